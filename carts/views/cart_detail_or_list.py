@@ -2,7 +2,7 @@ from decimal import Decimal
 from typing import cast
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Case, DecimalField, F, Sum, When
+from django.db.models import DecimalField, F, Sum
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.views import View
@@ -17,14 +17,7 @@ class CartDetailView(LoginRequiredMixin, View):
         cart_items = Cart.objects.filter(user=user).select_related('product', 'color', 'size')
         
         total_price = cart_items.aggregate(
-            total=Sum(
-                F('quantity') * Case(
-                    When(product__sale_price__isnull=False, then=F('product__price') - F('product__sale_price')),
-                    default=F('product__price'),
-                    output_field=DecimalField()
-                ),
-                output_field=DecimalField()
-            )
+            total=Sum(F('quantity') * F('product__effective_price'), output_field=DecimalField())
         )['total'] or Decimal('0')
         
         context = {
@@ -1,12 +1,20 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from django.http import HttpRequest
 
 from categories.models import Category
+from config.utils.local_cache import LocalCache
+from products.utils.cache_tags import CATALOG_TAG
+
+MAIN_CATEGORIES_CACHE_KEY = 'categories:main'
+
+
+def get_main_categories() -> List[Category]:
+    return list(Category.objects.filter(parent=None).prefetch_related('children')[:4])
 
 
 def categories_context(request: HttpRequest) -> Dict[str, Any]:
-    main_categories = Category.objects.filter(parent=None).prefetch_related('children')[:4]
+    main_categories = LocalCache.get_or_set(MAIN_CATEGORIES_CACHE_KEY, get_main_categories, tags=[CATALOG_TAG])
     return {
         'main_categories': main_categories
     }
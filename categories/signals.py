@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from categories.models import Category
+from products.utils.cache_tags import invalidate_categories
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_caches(sender: Any, instance: Category, **kwargs: Any) -> None:
+    invalidate_categories([instance.id])
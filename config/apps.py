@@ -5,3 +5,6 @@ class ConfigConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'config'
     verbose_name = '사이트 설정'
+
+    def ready(self) -> None:
+        import config.signals  # noqa: F401
@@ -0,0 +1,102 @@
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+from django.core.cache import cache as django_cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from config.utils.cache_helper import CacheHelper
+
+BENCHMARK_KEY_PREFIX = 'benchmark:cache_helper'
+
+
+def legacy_make_serializable(obj: Any) -> Any:
+    # 비교용으로 남겨 둔 이전 CacheHelper 직렬화 (값 전체를 재귀 순회한 뒤 indent=2 로 저장)
+    if isinstance(obj, dict):
+        return {k: legacy_make_serializable(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [legacy_make_serializable(item) for item in obj]
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
+    elif isinstance(obj, Decimal):
+        return float(obj)
+    elif hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    elif isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    return str(obj)
+
+
+def legacy_serialize(value: Any) -> bytes:
+    return json.dumps(legacy_make_serializable(value), ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class Command(BaseCommand):
+    help = 'Compare CacheHelper payload size and throughput against the previous JSON serializer'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument('--items', type=int, default=5, help='Order items in the sample preorder payload')
+        parser.add_argument('--iterations', type=int, default=2000, help='Operations per measurement')
+        parser.add_argument('--batch', type=int, default=20, help='Keys per get_many/set_many call')
+
+    def get_sample_payload(self, item_count: int) -> Dict[str, Any]:
+        return {
+            'user_id': 1,
+            'items': [
+                {
+                    'product_id': index,
+                    'product_name': f'린넨 셔츠 {index}',
+                    'quantity': 2,
+                    'price': Decimal('39000.00'),
+                    'color': '화이트',
+                    'size': 'M',
+                }
+                for index in range(item_count)
+            ],
+            'amount': 78000 * item_count,
+            'created_at': timezone.now(),
+        }
+
+    def measure(self, label: str, iterations: int, func: Callable[[], Any], ops_per_call: int = 1) -> None:
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - started_at
+        self.stdout.write(f'{label}: {iterations * ops_per_call / elapsed:,.0f} ops/sec')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        payload = self.get_sample_payload(options['items'])
+        iterations = options['iterations']
+        batch = options['batch']
+
+        self.stdout.write(f'legacy payload: {len(legacy_serialize(payload))} bytes')
+        self.stdout.write(f'compact payload: {len(CacheHelper._serialize(payload))} bytes')
+        self.measure('legacy serialize', iterations, lambda: legacy_serialize(payload))
+        self.measure('compact serialize', iterations, lambda: CacheHelper._serialize(payload))
+
+        keys = [f'{BENCHMARK_KEY_PREFIX}:{index}' for index in range(batch)]
+        redis_client = CacheHelper._get_redis_client()
+        legacy_value = legacy_serialize(payload)
+        try:
+            def legacy_set() -> None:
+                for key in keys:
+                    redis_client.setex(django_cache.make_key(key), 60, legacy_value)
+
+            def legacy_get() -> None:
+                for key in keys:
+                    json.loads(redis_client.get(django_cache.make_key(key)).decode('utf-8'))
+
+            round_count = max(1, iterations // batch)
+            self.measure('legacy set (one key per call)', round_count, legacy_set, batch)
+            self.measure('legacy get (one key per call)', round_count, legacy_get, batch)
+            self.measure(
+                'set_many', round_count, lambda: CacheHelper.set_many({key: payload for key in keys}, 60), batch
+            )
+            self.measure('get_many', round_count, lambda: CacheHelper.get_many(keys), batch)
+        finally:
+            redis_client.delete(*[django_cache.make_key(key) for key in keys])
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
@@ -0,0 +1,29 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from config.utils.local_cache import LocalCache
+
+
+class Command(BaseCommand):
+    help = 'Show in-process cache hit, miss and eviction counts per key prefix, summed over all workers'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument('--reset', action='store_true', help='Clear the counters after printing them')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stats = LocalCache.get_stats()
+        if not stats:
+            self.stdout.write('No local cache activity recorded')
+
+        for prefix, counts in sorted(stats.items()):
+            lookups = counts['hits'] + counts['misses']
+            hit_rate = counts['hits'] / lookups * 100 if lookups else 0.0
+            self.stdout.write(
+                f"{prefix}: hits {counts['hits']}, misses {counts['misses']}, "
+                f"evictions {counts['evictions']}, hit rate {hit_rate:.1f}%"
+            )
+
+        if options['reset']:
+            LocalCache.reset_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
@@ -4,6 +4,9 @@ import uuid
 from django.db import models
 
 from config.basemodel import BaseModel
+from config.utils.local_cache import LocalCache
+
+SITE_SETTINGS_CACHE_KEY = 'site:settings'
 
 
 def site_image_upload_path(instance: 'SiteSetting', filename: str) -> str:
@@ -38,6 +41,9 @@ class SiteSetting(BaseModel):
         verbose_name_plural = '사이트 설정'
 
     @classmethod
-    def get_settings(cls) -> 'SiteSetting':
-        setting, _ = cls.objects.get_or_create(pk=1)
-        return setting
\ No newline at end of file
+    def get_settings(cls, use_cache: bool = True) -> 'SiteSetting':
+        if not use_cache:
+            setting, _ = cls.objects.get_or_create(pk=1)
+            return setting
+        # 매 요청 렌더링마다 읽으므로 워커 메모리에 두고, 저장되면 signals 에서 모든 워커의 값을 지운다
+        return LocalCache.get_or_set(SITE_SETTINGS_CACHE_KEY, lambda: cls.get_settings(use_cache=False))
@@ -46,6 +46,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -284,6 +285,10 @@ EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
 # elasticsearch
 ES_HOST = env('ES_HOST', default='')
 ES_API_KEY = env('ES_API_KEY', default='')
+ES_CONNECT_TIMEOUT = env.float('ES_CONNECT_TIMEOUT', default=0.5)
+ES_READ_TIMEOUT = env.float('ES_READ_TIMEOUT', default=2.0)
+ES_BULK_TIMEOUT = env.float('ES_BULK_TIMEOUT', default=60.0)
+ES_CONNECTIONS_PER_NODE = env.int('ES_CONNECTIONS_PER_NODE', default=10)
 
 # Redis 설정
 REDIS_HOST = os.getenv("REDIS_HOST", "redis")
@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from config.models import SITE_SETTINGS_CACHE_KEY, SiteSetting
+from config.utils.cache_helper import CacheHelper
+from config.utils.local_cache import LocalCache
+from config.utils.page_cache import PAGE_TAG
+
+
+@receiver(post_save, sender=SiteSetting)
+def invalidate_site_settings(sender: Any, instance: SiteSetting, **kwargs: Any) -> None:
+    LocalCache.invalidate_on_commit(SITE_SETTINGS_CACHE_KEY)
+    CacheHelper.bump_tags_on_commit([PAGE_TAG])
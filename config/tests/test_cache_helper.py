@@ -0,0 +1,120 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from io import StringIO
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache as django_cache
+from django.core.management import call_command
+from django_redis import get_redis_connection
+
+from config.utils.cache_helper import SERIALIZER_VERSION, CacheHelper
+
+
+@pytest.mark.django_db
+class TestCacheHelper:
+    def setup_method(self) -> None:
+        self.keys = ['test:cache_helper:a', 'test:cache_helper:b', 'test:cache_helper:c']
+
+    def teardown_method(self) -> None:
+        for key in self.keys:
+            CacheHelper.delete(key)
+
+    def raw(self, key: str) -> bytes:
+        return bytes(get_redis_connection('default').get(django_cache.make_key(key)))
+
+    def test_stores_compact_json_with_version_byte(self) -> None:
+        value = {'amount': Decimal('1000.50'), 'created_at': datetime(2025, 1, 1, 9, 30), 'items': (1, 2)}
+
+        CacheHelper.set(self.keys[0], value, timeout=60)
+
+        raw = self.raw(self.keys[0])
+        assert raw[:1] == SERIALIZER_VERSION
+        assert b' ' not in raw
+        assert CacheHelper.get(self.keys[0]) == {
+            'amount': 1000.5, 'created_at': '2025-01-01T09:30:00', 'items': [1, 2],
+        }
+
+    def test_reads_previous_format(self) -> None:
+        legacy = json.dumps({'user_id': 1, 'name': '셔츠'}, ensure_ascii=False, indent=2)
+        get_redis_connection('default').set(django_cache.make_key(self.keys[0]), legacy.encode('utf-8'))
+        CacheHelper.incr(self.keys[1])
+
+        assert CacheHelper.get(self.keys[0]) == {'user_id': 1, 'name': '셔츠'}
+        assert CacheHelper.get(self.keys[1]) == 1
+
+    def test_get_many_and_set_many(self) -> None:
+        CacheHelper.set_many({self.keys[0]: {'a': 1}, self.keys[1]: [1, 2]}, timeout=60)
+
+        assert CacheHelper.get_many(self.keys) == {self.keys[0]: {'a': 1}, self.keys[1]: [1, 2]}
+        assert CacheHelper.get_many([]) == {}
+        assert 0 < get_redis_connection('default').ttl(django_cache.make_key(self.keys[1])) <= 60
+
+    def test_get_and_touch_extends_ttl(self) -> None:
+        CacheHelper.set(self.keys[0], 'value', timeout=10)
+
+        assert CacheHelper.get_and_touch(self.keys[0], 300) == 'value'
+        assert get_redis_connection('default').ttl(django_cache.make_key(self.keys[0])) > 10
+        assert CacheHelper.get_and_touch(self.keys[1], 300, default='missing') == 'missing'
+
+    def test_benchmark_command(self) -> None:
+        out = StringIO()
+
+        call_command('benchmark_cache_helper', '--iterations', '20', '--batch', '5', stdout=out)
+
+        assert 'compact payload' in out.getvalue()
+        assert get_redis_connection('default').keys(django_cache.make_key('benchmark:cache_helper:*')) == []
+
+
+@pytest.mark.django_db
+class TestCacheHelperGetOrSet:
+    key = 'test:cache_helper:get_or_set'
+
+    def setup_method(self) -> None:
+        CacheHelper.delete(self.key)
+        CacheHelper.delete(f'{self.key}:lock')
+
+    def teardown_method(self) -> None:
+        self.setup_method()
+
+    def test_concurrent_misses_run_loader_once(self) -> None:
+        calls = []
+
+        def loader() -> List[int]:
+            calls.append(1)
+            time.sleep(0.3)
+            return [1, 2, 3]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: CacheHelper.get_or_set(self.key, loader, 60), range(8)))
+
+        assert len(calls) == 1
+        assert results == [[1, 2, 3]] * 8
+
+    def test_serves_stale_value_while_another_worker_refreshes(self) -> None:
+        CacheHelper.set(self.key, {'value': 'stale', 'delta': 0.1, 'expires_at': time.time() - 1}, 60)
+        CacheHelper.add(f'{self.key}:lock', 1, timeout=10)
+
+        assert CacheHelper.get_or_set(self.key, lambda: 'fresh', 60) == 'stale'
+
+        CacheHelper.delete(f'{self.key}:lock')
+        assert CacheHelper.get_or_set(self.key, lambda: 'fresh', 60) == 'fresh'
+        assert CacheHelper.get(f'{self.key}:lock') is None
+
+    def test_refreshes_early_near_expiry(self) -> None:
+        # 계산에 2초 걸리는 값이 1초 뒤 만료되면 XFetch 가 미리 다시 계산한다
+        CacheHelper.set(self.key, {'value': 'old', 'delta': 2.0, 'expires_at': time.time() + 1}, 60)
+
+        with patch('config.utils.cache_helper.random.random', return_value=0.9):
+            assert CacheHelper.get_or_set(self.key, lambda: 'new', 60) == 'new'
+        with patch('config.utils.cache_helper.random.random', return_value=0.0):
+            assert CacheHelper.get_or_set(self.key, lambda: 'newer', 60) == 'new'
+
+    def test_ignores_value_in_previous_format(self) -> None:
+        CacheHelper.set(self.key, [1, 2], 60)
+
+        assert CacheHelper.get_or_set(self.key, lambda: [3], 60) == [3]
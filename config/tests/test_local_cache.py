@@ -0,0 +1,119 @@
+import time
+from io import StringIO
+from typing import Any, Callable
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache as django_cache
+from django.core.management import call_command
+from django.test.client import Client
+from django.urls import reverse
+from django_redis import get_redis_connection
+
+from categories.models import Category
+from config.models import SiteSetting
+from config.utils import local_cache
+from config.utils.local_cache import (
+    LOCAL_CACHE_INVALIDATE_CHANNEL,
+    LOCAL_CACHE_INVALIDATE_TAG_CHANNEL,
+    LocalCache,
+)
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.django_db
+class TestLocalCache:
+    def setup_method(self) -> None:
+        LocalCache.reset_stats()
+
+    def test_evicts_least_recently_used(self) -> None:
+        with patch.object(local_cache, 'LOCAL_CACHE_MAX_ENTRIES', 2):
+            LocalCache.set('test:a', 1)
+            LocalCache.set('test:b', 2)
+            LocalCache.get('test:a')
+            LocalCache.set('test:c', 3)
+
+        assert LocalCache.get('test:a') == 1
+        assert LocalCache.get('test:b') is None
+        assert LocalCache.get_stats()['test']['evictions'] == 1
+
+    def test_entries_expire(self) -> None:
+        LocalCache.set('test:a', 1, timeout=60)
+        with patch('config.utils.local_cache.time.monotonic', return_value=time.monotonic() + 61):
+            assert LocalCache.get('test:a') is None
+
+    def test_counts_hits_and_misses_per_prefix(self) -> None:
+        loader_calls = []
+
+        def loader() -> str:
+            loader_calls.append(1)
+            return 'value'
+
+        for key in ('product:card:1', 'product:card:1', 'product:card:2', 'site:settings'):
+            LocalCache.get_or_set(key, loader)
+
+        stats = LocalCache.get_stats()
+        assert len(loader_calls) == 3
+        assert stats['product:card'] == {'hits': 1, 'misses': 2, 'evictions': 0}
+        assert stats['site'] == {'hits': 0, 'misses': 1, 'evictions': 0}
+
+        out = StringIO()
+        call_command('local_cache_stats', '--reset', stdout=out)
+        assert 'product:card: hits 1, misses 2, evictions 0, hit rate 33.3%' in out.getvalue()
+        assert LocalCache.get_stats() == {}
+
+    def test_invalidation_from_another_worker(self) -> None:
+        LocalCache.set('test:a', 1)
+
+        # 다른 워커가 보낸 무효화 메시지를 흉내 낸다
+        get_redis_connection('default').publish(django_cache.make_key(LOCAL_CACHE_INVALIDATE_CHANNEL), 'test:a')
+
+        assert wait_for(lambda: LocalCache.get('test:a') is None)
+
+    def test_site_settings_are_cached_until_saved(self, django_capture_on_commit_callbacks: Any) -> None:
+        setting = SiteSetting.get_settings()
+
+        with patch.object(SiteSetting.objects, 'get_or_create') as mock_get_or_create:
+            assert SiteSetting.get_settings() is setting
+            mock_get_or_create.assert_not_called()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            fresh = SiteSetting.get_settings(use_cache=False)
+            fresh.hero_title = '여름 세일'
+            fresh.save()
+
+        assert SiteSetting.get_settings().hero_title == '여름 세일'
+
+    def test_category_change_refreshes_navigation(self, django_capture_on_commit_callbacks: Any) -> None:
+        client = Client()
+        client.get(reverse('home'))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Category.objects.create(name='아우터')
+
+        response = client.get(reverse('home'))
+        assert [category.name for category in response.context['main_categories']] == ['아우터']
+
+    def test_tag_invalidation_drops_tagged_entries(self) -> None:
+        LocalCache.set('test:a', 1, tags=['catalog'])
+        LocalCache.set('test:b', 2, tags=['catalog', 'product:1'])
+        LocalCache.set('test:c', 3)
+
+        LocalCache.delete_tags(['product:1'])
+        assert LocalCache.get('test:b') is None
+        assert LocalCache.get('test:a') == 1
+
+        # 다른 워커가 보낸 태그 무효화 메시지를 흉내 낸다
+        get_redis_connection('default').publish(django_cache.make_key(LOCAL_CACHE_INVALIDATE_TAG_CHANNEL), 'catalog')
+
+        assert wait_for(lambda: LocalCache.get('test:a') is None)
+        assert LocalCache.get('test:c') == 3
+        assert local_cache._tag_keys == {}
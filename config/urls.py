@@ -3,20 +3,25 @@ from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.urls import include, path
 from django.views.generic import TemplateView
-from products.models import Product
-from config.models import SiteSetting
 
 from config import settings
+from config.models import SiteSetting
 from config.utils.naver_sitemap import sitemap
+from config.utils.page_cache import cache_anonymous_page
+from config.views import UserFragmentView
+from products.services.product_listing import ProductListingService
+from products.utils.cache_tags import CATALOG_TAG
 from users import urls as users_urls
 
 
+@cache_anonymous_page(lambda request: [CATALOG_TAG])
 def home(request: HttpRequest) -> HttpResponse:
 
-    products = Product.objects.filter(is_live=True, is_sold=False).prefetch_related('colors', 'image').order_by('-created_at')
+    products, next_cursor = ProductListingService.get_product_page(ProductListingService.get_live_listings())
     site_settings = SiteSetting.get_settings()
     context = {
         'products': products,
+        'next_cursor': next_cursor,
         'site_settings': site_settings,
     }
     return render(request, 'home.html', context)
@@ -24,6 +29,7 @@ def home(request: HttpRequest) -> HttpResponse:
 urlpatterns = [
     path('', home, name='home'),
     path('sitemap.xml/', sitemap, name='sitemap'),
+    path('fragments/', UserFragmentView.as_view(), name='user-fragments'),
     path('payments/', include("payments.urls"), name='payments'),
     path("users/", include(users_urls), name='users'),
     path("products/", include("products.urls"), name='products'),
@@ -1,14 +1,44 @@
+import hashlib
 import json
-from datetime import datetime
+import math
+import random
+import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 from django.core.cache import cache as django_cache
+from django.db import transaction
 from django_redis import get_redis_connection
 
+from config.utils.local_cache import LocalCache
+
 if TYPE_CHECKING:
     from django_redis.client import DefaultClient
 
+# 저장 형식을 바꿀 때 이전 값과 구분할 수 있도록 값 앞에 붙이는 버전 바이트
+SERIALIZER_VERSION = b'\x01'
+
+# get_or_set: 다시 계산하는 워커가 잡는 잠금의 만료 시간과, 잠금을 못 잡은 워커가 값을 기다리는 간격
+GET_OR_SET_LOCK_TIMEOUT = 10
+GET_OR_SET_WAIT_INTERVAL = 0.05
+
+# 태그마다 버전 카운터를 두고, 태그를 단 캐시 키에는 현재 버전들을 넣어 버전이 오르면 이전 값을 읽지 않게 한다
+CACHE_TAG_KEY_PREFIX = 'cache:tag:'
+CACHE_TAG_TIMEOUT = 60 * 60 * 24 * 30
+
+T = TypeVar('T')
+
 
 class CacheHelper:
     @staticmethod
@@ -16,70 +46,194 @@ class CacheHelper:
         return get_redis_connection("default")
     
     @staticmethod
-    def _make_serializable(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: CacheHelper._make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [CacheHelper._make_serializable(item) for item in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, Decimal):
+    def _default(obj: Any) -> Any:
+        # json.dumps 가 기본으로 처리하지 못하는 값에만 호출되므로 값 전체를 미리 순회할 필요가 없다
+        if isinstance(obj, Decimal):
             return float(obj)
         elif hasattr(obj, 'isoformat'):
             return obj.isoformat()
-        elif isinstance(obj, (str, int, float, bool, type(None))):
-            return obj
-        else:
-            return str(obj)
-    
-    @staticmethod
-    def _serialize(value: Any) -> str:
-        serializable_value = CacheHelper._make_serializable(value)
-        return json.dumps(serializable_value, ensure_ascii=False, indent=2)
-    
-    @staticmethod
-    def _deserialize(value: str) -> Any:
-        return json.loads(value)
-    
+        return str(obj)
+
     @staticmethod
-    def set(key: str, value: Any, timeout: Optional[int] = None) -> None:
-        serialized_value = CacheHelper._serialize(value)
-        redis_client = CacheHelper._get_redis_client()
-        
-        cache_key = django_cache.make_key(key)
-        
-        if timeout is not None:
-            redis_client.setex(cache_key, timeout, serialized_value)
-        else:
-            redis_client.set(cache_key, serialized_value)
-    
+    def _serialize(value: Any) -> bytes:
+        payload = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=CacheHelper._default)
+        return SERIALIZER_VERSION + payload.encode('utf-8')
+
     @staticmethod
-    def get(key: str, default: Any = None) -> Any:
-        redis_client = CacheHelper._get_redis_client()
-        cache_key = django_cache.make_key(key)
-        
-        value = redis_client.get(cache_key)
-        
+    def _deserialize(value: Any, key: str, default: Any = None) -> Any:
         if value is None:
             return default
-        
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+
         try:
-            # bytes를 문자열로 변환
-            if isinstance(value, bytes):
-                value = value.decode('utf-8')
-            
-            # JSON 파싱
-            return CacheHelper._deserialize(value)
+            if value[:1] == SERIALIZER_VERSION:
+                return json.loads(value[1:])
+            # 버전 바이트가 없는 값은 이전 형식(들여쓰기 JSON)이거나 incr() 로 만든 정수 문자열이다
+            return json.loads(value.decode('utf-8'))
         except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
             # 기존 pickle 데이터가 있을 수 있으므로 Django 캐시로 폴백
             try:
                 return django_cache.get(key, default)
             except Exception:
                 return default
-    
+
+    @staticmethod
+    def set(key: str, value: Any, timeout: Optional[int] = None) -> None:
+        redis_client = CacheHelper._get_redis_client()
+        cache_key = django_cache.make_key(key)
+        redis_client.set(cache_key, CacheHelper._serialize(value), ex=timeout)
+
+    @staticmethod
+    def get(key: str, default: Any = None) -> Any:
+        redis_client = CacheHelper._get_redis_client()
+        cache_key = django_cache.make_key(key)
+        return CacheHelper._deserialize(redis_client.get(cache_key), key, default)
+
+    @staticmethod
+    def get_many(keys: Iterable[str]) -> Dict[str, Any]:
+        # MGET 한 번으로 읽고, 없는 키는 결과에서 뺀다
+        keys = list(keys)
+        if not keys:
+            return {}
+        redis_client = CacheHelper._get_redis_client()
+        values = redis_client.mget([django_cache.make_key(key) for key in keys])
+        return {
+            key: CacheHelper._deserialize(value, key)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    @staticmethod
+    def set_many(mapping: Mapping[str, Any], timeout: Optional[int] = None) -> None:
+        if not mapping:
+            return
+        redis_client = CacheHelper._get_redis_client()
+        pipeline = redis_client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipeline.set(django_cache.make_key(key), CacheHelper._serialize(value), ex=timeout)
+        pipeline.execute()
+
+    @staticmethod
+    def get_and_touch(key: str, timeout: int, default: Any = None) -> Any:
+        # 읽기와 만료 시간 연장을 한 번의 왕복으로 처리한다
+        redis_client = CacheHelper._get_redis_client()
+        cache_key = django_cache.make_key(key)
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.get(cache_key)
+        pipeline.expire(cache_key, timeout)
+        value, _ = pipeline.execute()
+        return CacheHelper._deserialize(value, key, default)
+
+    @staticmethod
+    def add(key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        # 키가 없을 때만 저장한다 (여러 프로세스 중 하나만 성공해야 하는 잠금 용도)
+        redis_client = CacheHelper._get_redis_client()
+        cache_key = django_cache.make_key(key)
+        return bool(redis_client.set(cache_key, CacheHelper._serialize(value), nx=True, ex=timeout))
+
     @staticmethod
     def delete(key: str) -> None:
         redis_client = CacheHelper._get_redis_client()
         cache_key = django_cache.make_key(key)
         redis_client.delete(cache_key)
 
+    @staticmethod
+    def incr(key: str, amount: int = 1, timeout: Optional[int] = None) -> int:
+        redis_client = CacheHelper._get_redis_client()
+        cache_key = django_cache.make_key(key)
+
+        # 정수 문자열로 저장되므로 get() 의 JSON 역직렬화로도 그대로 읽힌다
+        value = int(redis_client.incr(cache_key, amount))
+        if timeout is not None and value == amount:
+            # 처음 만들어질 때만 만료 시간을 걸어 고정 구간 카운터로 쓴다
+            redis_client.expire(cache_key, timeout)
+        return value
+
+    @staticmethod
+    def _should_refresh(entry: Dict[str, Any], beta: float) -> bool:
+        # XFetch: 만료가 가까울수록, 계산이 오래 걸리는 값일수록 높은 확률로 미리 다시 계산한다
+        early_by = entry['delta'] * beta * -math.log(1.0 - random.random())
+        return bool(time.time() + early_by >= entry['expires_at'])
+
+    @staticmethod
+    def get_or_set(
+        key: str,
+        loader: Callable[[], T],
+        timeout: int,
+        beta: float = 1.0,
+        lock_timeout: int = GET_OR_SET_LOCK_TIMEOUT,
+    ) -> T:
+        # 만료 직후 모든 요청이 동시에 loader 를 실행하지 않도록 잠금을 잡은 한 워커만 다시 계산한다.
+        # Redis 에는 논리적 만료의 두 배 동안 남겨, 다시 계산하는 동안 다른 워커는 이전 값을 돌려준다
+        entry = CacheHelper.get(key)
+        if not isinstance(entry, dict) or 'expires_at' not in entry:
+            # get_or_set 이전 형식으로 저장된 값은 없는 것으로 본다
+            entry = None
+        if entry is not None and not CacheHelper._should_refresh(entry, beta):
+            return cast(T, entry['value'])
+
+        lock_key = f'{key}:lock'
+        if not CacheHelper.add(lock_key, 1, timeout=lock_timeout):
+            if entry is not None:
+                return cast(T, entry['value'])
+            # 처음 채우는 중이면 잠금을 가진 워커가 저장할 때까지 잠깐 기다린다
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(GET_OR_SET_WAIT_INTERVAL)
+                entry = CacheHelper.get(key)
+                if entry is not None:
+                    return cast(T, entry['value'])
+            return loader()
+
+        try:
+            started_at = time.time()
+            value = loader()
+            finished_at = time.time()
+            CacheHelper.set(
+                key,
+                {'value': value, 'delta': finished_at - started_at, 'expires_at': finished_at + timeout},
+                timeout * 2,
+            )
+            return value
+        finally:
+            CacheHelper.delete(lock_key)
+
+    @staticmethod
+    def get_tag_versions(tags: Iterable[str]) -> List[int]:
+        tags = list(tags)
+        if not tags:
+            return []
+        redis_client = CacheHelper._get_redis_client()
+        values = redis_client.mget([django_cache.make_key(f'{CACHE_TAG_KEY_PREFIX}{tag}') for tag in tags])
+        return [int(value) if value is not None else 0 for value in values]
+
+    @staticmethod
+    def make_tagged_key(key: str, tags: Iterable[str]) -> str:
+        # 태그가 많아도 키 길이가 일정하도록 버전 목록의 해시만 붙인다
+        tags = list(tags)
+        versions = ','.join(
+            f'{tag}={version}' for tag, version in zip(tags, CacheHelper.get_tag_versions(tags))
+        )
+        return f"{key}:{hashlib.sha1(versions.encode('utf-8')).hexdigest()[:12]}"
+
+    @staticmethod
+    def bump_tags(tags: Iterable[str]) -> None:
+        tags = sorted(set(tags))
+        if not tags:
+            return
+        redis_client = CacheHelper._get_redis_client()
+        pipeline = redis_client.pipeline(transaction=False)
+        for tag in tags:
+            tag_key = django_cache.make_key(f'{CACHE_TAG_KEY_PREFIX}{tag}')
+            pipeline.incr(tag_key)
+            # 버전이 사라지면 0 으로 돌아가 이전 값이 다시 보일 수 있으므로, 올릴 때마다 만료를 늘린다
+            pipeline.expire(tag_key, CACHE_TAG_TIMEOUT)
+        pipeline.execute()
+        LocalCache.invalidate_tags(tags)
+
+    @staticmethod
+    def bump_tags_on_commit(tags: Iterable[str]) -> None:
+        # 커밋 전에 올리면 다른 요청이 이전 데이터로 새 버전의 캐시를 채울 수 있다
+        tags = list(tags)
+        transaction.on_commit(lambda: CacheHelper.bump_tags(tags))
@@ -0,0 +1,116 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, TypeVar
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Field, Model, Q, QuerySet
+
+ModelT = TypeVar('ModelT', bound=Model)
+
+
+class CursorPagination:
+    """(created_at, id) 기준 최신순 keyset 페이지네이션"""
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, pk: int) -> str:
+        raw = f"{created_at.isoformat()}|{pk}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+        if not cursor:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            created_at, pk = raw.rsplit('|', 1)
+            return datetime.fromisoformat(created_at), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            # 잘못된 커서는 첫 페이지로 취급한다
+            return None
+
+    @staticmethod
+    def encode_values(values: List[Any]) -> str:
+        # Elasticsearch search_after 처럼 정렬 값 목록 자체가 위치인 커서
+        # Decimal 가격 같은 값은 문자열로 담고, 비교할 때 DB 가 다시 숫자로 해석한다
+        raw = json.dumps(values, separators=(',', ':'), default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @staticmethod
+    def decode_values(cursor: Optional[str]) -> Optional[List[Any]]:
+        if not cursor:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+        return values if isinstance(values, list) else None
+
+    @staticmethod
+    def paginate(
+        queryset: QuerySet[ModelT], cursor: Optional[str], page_size: int
+    ) -> Tuple[List[ModelT], Optional[str]]:
+        position = CursorPagination.decode_cursor(cursor)
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+        # 다음 페이지 존재 여부를 COUNT 없이 알기 위해 한 건 더 가져온다
+        items = list(queryset.order_by('-created_at', '-id')[:page_size + 1])
+        if len(items) <= page_size:
+            return items, None
+
+        items = items[:page_size]
+        last: Any = items[-1]
+        return items, CursorPagination.encode_cursor(last.created_at, last.id)
+
+    @staticmethod
+    def get_sort_field(queryset: QuerySet[ModelT], field: str) -> "Field[Any, Any]":
+        annotation = queryset.query.annotations.get(field)
+        if annotation is not None:
+            return annotation.output_field
+        model_field = queryset.model._meta.get_field(field)
+        if not isinstance(model_field, Field):
+            raise FieldDoesNotExist(field)
+        return model_field
+
+    @staticmethod
+    def clean_position(
+        queryset: QuerySet[ModelT], field: str, position: Optional[List[Any]]
+    ) -> Optional[Tuple[Any, Any]]:
+        # 커서는 사용자가 바꿀 수 있으므로 정렬 필드 타입으로 변환·검증하고, 맞지 않으면 첫 페이지로 취급한다
+        if position is None or len(position) != 2:
+            return None
+        try:
+            sort_field = CursorPagination.get_sort_field(queryset, field)
+            pk_field = queryset.model._meta.pk
+            value, pk = sort_field.to_python(position[0]), pk_field.to_python(position[1])
+            if value is None or pk is None:
+                return None
+            sort_field.run_validators(value)
+            pk_field.run_validators(pk)
+        except (FieldDoesNotExist, ValidationError, TypeError, ValueError, ArithmeticError):
+            return None
+        return value, pk
+
+    @staticmethod
+    def paginate_by_field(
+        queryset: QuerySet[ModelT], field: str, cursor: Optional[str], page_size: int, descending: bool = True
+    ) -> Tuple[List[ModelT], Optional[str]]:
+        # 검색 점수나 가격처럼 id 외의 값 기준 keyset 페이지네이션 (동점은 같은 방향의 id 로 구분)
+        lookup, prefix = ('lt', '-') if descending else ('gt', '')
+        position = CursorPagination.clean_position(queryset, field, CursorPagination.decode_values(cursor))
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(
+                Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'id__{lookup}': pk})
+            )
+
+        items = list(queryset.order_by(f'{prefix}{field}', f'{prefix}id')[:page_size + 1])
+        if len(items) <= page_size:
+            return items, None
+
+        items = items[:page_size]
+        last: Any = items[-1]
+        return items, CursorPagination.encode_values([getattr(last, field), last.id])
@@ -0,0 +1,244 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar, cast
+
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_MAX_ENTRIES = 1000
+LOCAL_CACHE_TIMEOUT = 60
+LOCAL_CACHE_INVALIDATE_CHANNEL = 'cache:local:invalidate'
+LOCAL_CACHE_INVALIDATE_TAG_CHANNEL = 'cache:local:invalidate:tag'
+LOCAL_CACHE_STATS_KEY = 'cache:local:stats'
+LOCAL_CACHE_STATS_FLUSH_INTERVAL = 10.0
+LOCAL_CACHE_RECONNECT_DELAY = 1.0
+
+STAT_NAMES = ('hits', 'misses', 'evictions')
+
+T = TypeVar('T')
+
+# 워커 프로세스마다 따로 갖는 캐시. 값은 직렬화하지 않은 파이썬 객체 그대로 둔다
+_entries: 'OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]' = OrderedDict()
+_tag_keys: Dict[str, Set[str]] = defaultdict(set)
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(STAT_NAMES, 0))
+_stats_flushed_at = time.monotonic()
+_listener_pid: Optional[int] = None
+
+
+class LocalCache:
+    """Redis/DB 앞에 두는 프로세스 내부 LRU 캐시. 무효화는 Redis pub/sub 으로 모든 워커에 전파한다"""
+
+    @staticmethod
+    def _channel() -> str:
+        return django_cache.make_key(LOCAL_CACHE_INVALIDATE_CHANNEL)
+
+    @staticmethod
+    def _tag_channel() -> str:
+        return django_cache.make_key(LOCAL_CACHE_INVALIDATE_TAG_CHANNEL)
+
+    @staticmethod
+    def get_prefix(key: str) -> str:
+        # 'product:card:12' 처럼 마지막 구간이 식별자인 키를 'product:card' 로 묶어 센다
+        return key.rsplit(':', 1)[0]
+
+    @staticmethod
+    def _count(key: str, stat: str) -> None:
+        _stats[LocalCache.get_prefix(key)][stat] += 1
+
+    @staticmethod
+    def get(key: str, default: Any = None) -> Any:
+        with _lock:
+            entry = _entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    LocalCache._remove(key)
+                LocalCache._count(key, 'misses')
+                return default
+            _entries.move_to_end(key)
+            LocalCache._count(key, 'hits')
+            return entry[1]
+
+    @staticmethod
+    def _remove(key: str) -> None:
+        # _lock 을 잡은 상태에서만 호출한다
+        entry = _entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            tag_keys = _tag_keys.get(tag)
+            if tag_keys is not None:
+                tag_keys.discard(key)
+                if not tag_keys:
+                    del _tag_keys[tag]
+
+    @staticmethod
+    def set(key: str, value: Any, timeout: int = LOCAL_CACHE_TIMEOUT, tags: Iterable[str] = ()) -> None:
+        LocalCache.start_listener()
+        tags = tuple(tags)
+        with _lock:
+            LocalCache._remove(key)
+            _entries[key] = (time.monotonic() + timeout, value, tags)
+            for tag in tags:
+                _tag_keys[tag].add(key)
+            while len(_entries) > LOCAL_CACHE_MAX_ENTRIES:
+                evicted_key = next(iter(_entries))
+                LocalCache._remove(evicted_key)
+                LocalCache._count(evicted_key, 'evictions')
+
+    @staticmethod
+    def get_or_set(
+        key: str, loader: Callable[[], T], timeout: int = LOCAL_CACHE_TIMEOUT, tags: Iterable[str] = ()
+    ) -> T:
+        sentinel = object()
+        value = LocalCache.get(key, sentinel)
+        if value is sentinel:
+            value = loader()
+            LocalCache.set(key, value, timeout, tags)
+        LocalCache.flush_stats()
+        return cast(T, value)
+
+    @staticmethod
+    def delete(key: str) -> None:
+        with _lock:
+            LocalCache._remove(key)
+
+    @staticmethod
+    def delete_tags(tags: Iterable[str]) -> None:
+        with _lock:
+            for tag in tags:
+                for key in list(_tag_keys.get(tag, ())):
+                    LocalCache._remove(key)
+
+    @staticmethod
+    def clear() -> None:
+        with _lock:
+            _entries.clear()
+            _tag_keys.clear()
+
+    @staticmethod
+    def invalidate(key: str) -> None:
+        # 이 워커는 바로 지우고, 다른 워커들은 pub/sub 메시지를 받아 지운다
+        LocalCache.delete(key)
+        try:
+            get_redis_connection('default').publish(LocalCache._channel(), key)
+        except Exception as e:
+            # 전파에 실패해도 다른 워커의 값은 LOCAL_CACHE_TIMEOUT 안에 만료된다
+            logger.warning(f"[LocalCache] {key} 무효화 전파 실패: {e}")
+
+    @staticmethod
+    def invalidate_tags(tags: Iterable[str]) -> None:
+        tags = list(tags)
+        LocalCache.delete_tags(tags)
+        try:
+            pipeline = get_redis_connection('default').pipeline(transaction=False)
+            for tag in tags:
+                pipeline.publish(LocalCache._tag_channel(), tag)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"[LocalCache] 태그 {tags} 무효화 전파 실패: {e}")
+
+    @staticmethod
+    def invalidate_on_commit(key: str) -> None:
+        # 커밋 전에 지우면 다른 워커가 이전 데이터를 다시 읽어 채울 수 있다
+        transaction.on_commit(lambda: LocalCache.invalidate(key))
+
+    @staticmethod
+    def _subscribe() -> Any:
+        pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(LocalCache._channel(), LocalCache._tag_channel())
+        return pubsub
+
+    @staticmethod
+    def start_listener() -> None:
+        global _listener_pid
+
+        # gunicorn 은 워커를 fork 하므로 프로세스마다 한 번씩 구독한다
+        if _listener_pid == os.getpid():
+            return
+        with _lock:
+            if _listener_pid == os.getpid():
+                return
+            _listener_pid = os.getpid()
+
+        try:
+            # 첫 값을 저장하기 전에 구독을 마쳐 그 사이의 무효화 메시지를 놓치지 않게 한다
+            pubsub = LocalCache._subscribe()
+        except Exception as e:
+            logger.warning(f"[LocalCache] 무효화 구독 실패: {e}")
+            _listener_pid = None
+            return
+        threading.Thread(
+            target=LocalCache._listen, args=(pubsub,), name='local-cache-invalidation', daemon=True
+        ).start()
+
+    @staticmethod
+    def _listen(pubsub: Any) -> None:
+        while True:
+            try:
+                for message in pubsub.listen():
+                    channel, data = (
+                        value.decode('utf-8') if isinstance(value, bytes) else value
+                        for value in (message['channel'], message['data'])
+                    )
+                    if channel == LocalCache._tag_channel():
+                        LocalCache.delete_tags([data])
+                    else:
+                        LocalCache.delete(data)
+            except Exception as e:
+                logger.warning(f"[LocalCache] 무효화 구독이 끊어졌습니다: {e}")
+            # 끊겨 있던 동안의 무효화 메시지를 놓쳤을 수 있으므로 모두 버린다
+            LocalCache.clear()
+            time.sleep(LOCAL_CACHE_RECONNECT_DELAY)
+            try:
+                pubsub = LocalCache._subscribe()
+            except Exception as e:
+                logger.warning(f"[LocalCache] 무효화 재구독 실패: {e}")
+
+    @staticmethod
+    def flush_stats(force: bool = False) -> None:
+        global _stats_flushed_at
+
+        with _lock:
+            if not force and time.monotonic() - _stats_flushed_at < LOCAL_CACHE_STATS_FLUSH_INTERVAL:
+                return
+            stats = {prefix: dict(counts) for prefix, counts in _stats.items()}
+            _stats.clear()
+            _stats_flushed_at = time.monotonic()
+        if not stats:
+            return
+
+        # 워커별 카운터를 Redis 해시에 더해 전체 워커의 합계로 볼 수 있게 한다
+        try:
+            pipeline = get_redis_connection('default').pipeline(transaction=False)
+            stats_key = django_cache.make_key(LOCAL_CACHE_STATS_KEY)
+            for prefix, counts in stats.items():
+                for stat, count in counts.items():
+                    if count:
+                        pipeline.hincrby(stats_key, f'{prefix}|{stat}', count)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"[LocalCache] 통계 저장 실패: {e}")
+
+    @staticmethod
+    def get_stats() -> Dict[str, Dict[str, int]]:
+        LocalCache.flush_stats(force=True)
+        raw = get_redis_connection('default').hgetall(django_cache.make_key(LOCAL_CACHE_STATS_KEY))
+
+        stats: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(STAT_NAMES, 0))
+        for field, count in raw.items():
+            prefix, stat = field.decode('utf-8').rsplit('|', 1)
+            stats[prefix][stat] = int(count)
+        return dict(stats)
+
+    @staticmethod
+    def reset_stats() -> None:
+        with _lock:
+            _stats.clear()
+        get_redis_connection('default').delete(django_cache.make_key(LOCAL_CACHE_STATS_KEY))
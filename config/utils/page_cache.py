@@ -0,0 +1,102 @@
+import hashlib
+from functools import wraps
+from typing import Any, Callable, List, Optional
+from urllib.parse import urlencode
+
+from django.contrib.messages import get_messages
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.utils.cache import patch_vary_headers
+
+from config.utils.cache_helper import CacheHelper
+
+PAGE_CACHE_TIMEOUT = 60 * 10
+PAGE_CACHE_KEY_PREFIX = 'page'
+PAGE_CACHE_HEADER = 'X-Page-Cache'
+# 모든 페이지 캐시에 다는 태그. 사이트 설정처럼 레이아웃 전체에 보이는 값이 바뀌면 올린다
+PAGE_TAG = 'page'
+# 유입 추적용 파라미터는 페이지 내용이 같으므로 키에서 뺀다
+PAGE_CACHE_IGNORED_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'fbclid', 'gclid',
+})
+
+ViewFunc = Callable[..., HttpResponse]
+TagsFunc = Callable[..., Optional[List[str]]]
+
+
+class PageCacheService:
+    @staticmethod
+    def normalize_query(query: QueryDict) -> str:
+        # 파라미터 순서와 빈 값만 다른 요청은 같은 페이지로 본다
+        pairs = sorted(
+            (name, value)
+            for name, values in query.lists()
+            if name not in PAGE_CACHE_IGNORED_PARAMS
+            for value in values
+            if value != ''
+        )
+        return urlencode(pairs)
+
+    @staticmethod
+    def make_key(request: HttpRequest, tags: List[str]) -> str:
+        url = f'{request.path}?{PageCacheService.normalize_query(request.GET)}'
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return CacheHelper.make_tagged_key(f'{PAGE_CACHE_KEY_PREFIX}:{digest}', [PAGE_TAG, *tags])
+
+    @staticmethod
+    def has_pending_messages(request: HttpRequest) -> bool:
+        # len() 은 메시지를 읽음 처리하지 않으므로 다음 페이지에 그대로 표시된다
+        return len(get_messages(request)) > 0
+
+    @staticmethod
+    def is_cacheable_request(request: HttpRequest) -> bool:
+        return (
+            request.method == 'GET'
+            and not request.user.is_authenticated
+            and not PageCacheService.has_pending_messages(request)
+        )
+
+    @staticmethod
+    def is_cacheable_response(request: HttpRequest, response: HttpResponse) -> bool:
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and not request.session.modified
+            and not PageCacheService.has_pending_messages(request)
+        )
+
+
+def cache_anonymous_page(get_tags: TagsFunc, timeout: int = PAGE_CACHE_TIMEOUT) -> Callable[[ViewFunc], ViewFunc]:
+    """비로그인 GET 요청의 렌더링 결과를 태그와 함께 캐시한다. get_tags 가 None 을 돌려주면 캐시하지 않는다"""
+
+    def decorator(view_func: ViewFunc) -> ViewFunc:
+        @wraps(view_func)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if not PageCacheService.is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+            tags = get_tags(request, *args, **kwargs)
+            if tags is None:
+                return view_func(request, *args, **kwargs)
+
+            # base.html 은 이 표시가 있는 페이지에만 /fragments/ 를 부르는 스크립트를 넣는다
+            request.is_page_cacheable = True  # type: ignore[attr-defined]
+            cache_key = PageCacheService.make_key(request, tags)
+            cached = CacheHelper.get(cache_key)
+            if cached is not None:
+                response = HttpResponse(cached['content'], content_type=cached['content_type'])
+                response[PAGE_CACHE_HEADER] = 'HIT'
+            else:
+                response = view_func(request, *args, **kwargs)
+                if PageCacheService.is_cacheable_response(request, response):
+                    # 사용자별 내용(로그인 상태, CSRF 토큰)은 /fragments/ 로 따로 채운다
+                    CacheHelper.set(cache_key, {
+                        'content': response.content.decode(response.charset),
+                        'content_type': response['Content-Type'],
+                    }, timeout)
+                    response[PAGE_CACHE_HEADER] = 'MISS'
+            patch_vary_headers(response, ['Cookie'])
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,7 +1,10 @@
 from django.contrib import messages
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import redirect, render
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.cache import never_cache
 
 from config.models import SiteSetting
 from users.utils.permission import AdminPermission
@@ -15,7 +18,8 @@ class SiteSettingView(AdminPermission, View):
         return render(request, self.template_name, {'setting': setting})
 
     def post(self, request: HttpRequest) -> HttpResponse:
-        setting = SiteSetting.get_settings()
+        # 캐시된 객체는 다른 요청과 공유되므로 수정할 때는 DB 에서 새로 읽는다
+        setting = SiteSetting.get_settings(use_cache=False)
 
         hero_title = request.POST.get('hero_title', '').strip()
         hero_subtitle = request.POST.get('hero_subtitle', '').strip()
@@ -32,3 +36,16 @@ class SiteSettingView(AdminPermission, View):
         setting.save()
         messages.success(request, '메인 페이지 설정이 저장되었습니다.')
         return redirect('site-settings')
+
+
+@method_decorator(never_cache, name='dispatch')
+class UserFragmentView(View):
+    """캐시된 비로그인 페이지에 사용자별 상태(로그인 여부, CSRF 토큰)를 채우기 위한 JSON"""
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        # 캐시된 HTML 에 들어 있는 CSRF 토큰은 처음 렌더링한 방문자의 것이므로 새로 내려준다
+        # 로그인 사용자는 캐시되지 않은 페이지를 다시 받으므로 찜/장바구니 같은 값은 내려주지 않는다
+        return JsonResponse({
+            'is_authenticated': request.user.is_authenticated,
+            'csrf_token': get_token(request),
+        })
@@ -0,0 +1,48 @@
+from typing import Iterator
+
+import pytest
+from django.core.cache import cache as django_cache
+from django_redis import get_redis_connection
+
+from config.utils.local_cache import LocalCache
+from config.utils.page_cache import PAGE_CACHE_KEY_PREFIX
+
+
+@pytest.fixture(autouse=True)
+def clear_inventory_reservations() -> Iterator[None]:
+    # 테스트마다 상품 ID가 재사용되므로 이전 테스트의 재고 카운터/보류 내역을 비운다
+    redis_client = get_redis_connection("default")
+    pattern = django_cache.make_key("inventory:*")
+    for key in redis_client.scan_iter(match=pattern):
+        redis_client.delete(key)
+    yield
+    for key in redis_client.scan_iter(match=pattern):
+        redis_client.delete(key)
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache() -> Iterator[None]:
+    # 같은 검색어를 쓰는 테스트끼리 이전 테스트의 검색 결과 캐시를 재사용하지 않도록 비운다
+    redis_client = get_redis_connection("default")
+    pattern = django_cache.make_key("products:search:*")
+    for key in redis_client.scan_iter(match=pattern):
+        redis_client.delete(key)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache() -> Iterator[None]:
+    # 테스트 안의 저장은 커밋되지 않아 태그가 오르지 않으므로, 이전 테스트가 캐시한 페이지를 직접 지운다
+    redis_client = get_redis_connection("default")
+    pattern = django_cache.make_key(f"{PAGE_CACHE_KEY_PREFIX}:*")
+    for key in redis_client.scan_iter(match=pattern):
+        redis_client.delete(key)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache() -> Iterator[None]:
+    # 워커 메모리 캐시는 테스트 프로세스 안에서 계속 남으므로 이전 테스트의 객체를 쓰지 않도록 비운다
+    LocalCache.clear()
+    yield
+    LocalCache.clear()
@@ -0,0 +1,86 @@
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from membership.models import UserPoint, UserPointBalance
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Rebuild or verify user point balance snapshots from the UserPoint ledger'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report snapshots that differ from the ledger',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of users processed per transaction',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        verify_only = options['verify']
+        chunk_size = options['chunk_size']
+
+        last_user_id = 0
+        checked_count = 0
+        mismatch_count = 0
+
+        while True:
+            user_ids = list(
+                User.objects.filter(id__gt=last_user_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not user_ids:
+                break
+            last_user_id = user_ids[-1]
+
+            with transaction.atomic():
+                # 스냅샷 행을 먼저 잠가야 잠금 없이 추가되는 포인트 내역과 합계가 엇갈리지 않는다
+                snapshots: Dict[int, UserPointBalance] = {
+                    snapshot.user_id: snapshot
+                    for snapshot in UserPointBalance.objects.select_for_update().filter(user_id__in=user_ids)
+                }
+                ledger_totals: Dict[int, int] = {
+                    row['user_id']: row['total'] or 0
+                    for row in UserPoint.objects.filter(user_id__in=user_ids).values('user_id').annotate(total=Sum('amount'))
+                }
+
+                to_update: List[UserPointBalance] = []
+                to_create: List[UserPointBalance] = []
+                for user_id in user_ids:
+                    ledger_total = ledger_totals.get(user_id, 0)
+                    snapshot = snapshots.get(user_id)
+
+                    if snapshot is None:
+                        if ledger_total:
+                            to_create.append(UserPointBalance(user_id=user_id, balance=ledger_total))
+                        continue
+
+                    if snapshot.balance != ledger_total:
+                        mismatch_count += 1
+                        self.stdout.write(
+                            self.style.WARNING(
+                                f'User {user_id}: snapshot {snapshot.balance} != ledger {ledger_total}'
+                            )
+                        )
+                        snapshot.balance = ledger_total
+                        to_update.append(snapshot)
+
+                if not verify_only:
+                    UserPointBalance.objects.bulk_create(to_create, ignore_conflicts=True)
+                    UserPointBalance.objects.bulk_update(to_update, ['balance'])
+
+            checked_count += len(user_ids)
+
+        if verify_only:
+            self.stdout.write(f'Checked {checked_count} users, {mismatch_count} mismatched snapshots')
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f'Rebuilt snapshots for {checked_count} users ({mismatch_count} corrected)')
+            )
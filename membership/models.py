@@ -1,12 +1,13 @@
 from typing import TYPE_CHECKING, Any, Optional, cast
 
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Sum
 from django.utils import timezone
 
 from config.basemodel import BaseModel
 
 if TYPE_CHECKING:
+    from orders.models import Order
     from users.models import User
 
 
@@ -61,8 +62,64 @@ class UserPoint(BaseModel):
 
     @staticmethod
     def get_user_balance(user: "User") -> int:
+        balance = UserPointBalance.objects.filter(user=user).values_list("balance", flat=True).first()
+        if balance is None:
+            point_balance, _ = UserPointBalance.objects.get_or_create(
+                user=user,
+                defaults={"balance": UserPointBalance.calculate_from_ledger(user.id)},
+            )
+            return point_balance.balance
+        return balance
+
+    @classmethod
+    def record(
+        cls,
+        user: "User",
+        point_type: str,
+        amount: int,
+        description: str | None = None,
+        related_order: "Order | None" = None,
+    ) -> "UserPoint":
+        """잔액 스냅샷을 잠근 상태에서 내역을 추가한다 (포인트 내역은 반드시 이 메서드로 생성)"""
+        with transaction.atomic():
+            point_balance = UserPointBalance.lock_for_user(user.id)
+            point_balance.balance += amount
+            point_balance.save(update_fields=["balance", "updated_at"])
+            return cls.objects.create(
+                user=user,
+                point_type=point_type,
+                amount=amount,
+                description=description,
+                balance_after=point_balance.balance,
+                related_order=related_order,
+            )
+
+
+class UserPointBalance(BaseModel):
+    """UserPoint 내역 합계의 사용자별 스냅샷"""
+
+    user = models.OneToOneField("users.User", on_delete=models.CASCADE, related_name="point_balance")
+    balance = models.IntegerField(default=0, verbose_name="포인트 잔액")
+
+    class Meta:
+        db_table = "user_point_balance"
+
+    @staticmethod
+    def calculate_from_ledger(user_id: int) -> int:
         total = cast(
             Optional[int],
-            UserPoint.objects.filter(user=user).aggregate(total=Sum("amount"))["total"],
+            UserPoint.objects.filter(user_id=user_id).aggregate(total=Sum("amount"))["total"],
         )
-        return total or 0
\ No newline at end of file
+        return total or 0
+
+    @classmethod
+    def lock_for_user(cls, user_id: int) -> "UserPointBalance":
+        """트랜잭션 안에서 호출해야 하며, 스냅샷이 없으면 내역 합계로 생성한 뒤 잠근다"""
+        point_balance = cls.objects.select_for_update().filter(user_id=user_id).first()
+        if point_balance is None:
+            cls.objects.get_or_create(
+                user_id=user_id,
+                defaults={"balance": cls.calculate_from_ledger(user_id)},
+            )
+            point_balance = cls.objects.select_for_update().get(user_id=user_id)
+        return point_balance
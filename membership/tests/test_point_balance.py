@@ -0,0 +1,94 @@
+from io import StringIO
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from config.utils.setup_test_method import TestSetupMixin
+from membership.models import UserPoint, UserPointBalance
+from payments.models import Payment
+
+
+@pytest.mark.django_db
+class TestUserPointBalance(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.setup_test_order_data()
+
+    def test_record_updates_snapshot(self) -> None:
+        UserPoint.record(self.customer_user, UserPoint.PointType.EARN, 3000, "적립")
+        point = UserPoint.record(self.customer_user, UserPoint.PointType.USE, -1000, "사용")
+
+        assert point.balance_after == 2000
+        assert UserPointBalance.objects.get(user=self.customer_user).balance == 2000
+        assert UserPoint.get_user_balance(self.customer_user) == 2000
+
+    def test_get_user_balance_reads_snapshot_in_one_query(self, django_assert_num_queries: Any) -> None:
+        UserPoint.record(self.customer_user, UserPoint.PointType.EARN, 3000, "적립")
+
+        with django_assert_num_queries(1):
+            assert UserPoint.get_user_balance(self.customer_user) == 3000
+
+    def test_get_user_balance_builds_missing_snapshot_from_ledger(self) -> None:
+        UserPoint.objects.create(user=self.customer_user, point_type=UserPoint.PointType.EARN, amount=1500)
+        UserPoint.objects.create(user=self.customer_user, point_type=UserPoint.PointType.EARN, amount=500)
+
+        assert UserPoint.get_user_balance(self.customer_user) == 2000
+        assert UserPointBalance.objects.filter(user=self.customer_user).exists()
+
+    def test_payment_approve_uses_snapshot(self) -> None:
+        UserPoint.record(self.admin_user, UserPoint.PointType.EARN, 10000, "적립")
+        payment = Payment.objects.create(
+            order=self.order,
+            provider="toss",
+            method="CARD",
+            payment_key="balance-test-key",
+            amount=self.order.total_amount,
+            used_point=4000,
+        )
+
+        payment.approve()
+
+        # 10000 - 4000 사용 + 50000 * 5% 적립
+        assert UserPoint.get_user_balance(self.admin_user) == 8500
+        assert UserPoint.objects.filter(user=self.admin_user).order_by('-id').first().balance_after == 8500  # type: ignore[union-attr]
+
+    def test_payment_approve_insufficient_points(self) -> None:
+        payment = Payment.objects.create(
+            order=self.order,
+            provider="toss",
+            method="CARD",
+            payment_key="balance-test-key",
+            amount=self.order.total_amount,
+            used_point=4000,
+        )
+
+        with pytest.raises(ValueError, match="보유 포인트가 부족합니다."):
+            payment.approve()
+
+        assert UserPoint.get_user_balance(self.admin_user) == 0
+
+    def test_mypage_shows_snapshot_balance(self) -> None:
+        UserPoint.record(self.customer_user, UserPoint.PointType.EARN, 1200, "적립")
+        self.client.force_login(self.customer_user)
+
+        response = self.client.get(reverse('membership:list'))
+
+        assert response.status_code == 200
+        assert response.context['point_balance'] == 1200
+
+    def test_rebuild_command_verifies_and_repairs(self) -> None:
+        UserPoint.record(self.customer_user, UserPoint.PointType.EARN, 1000, "적립")
+        UserPointBalance.objects.filter(user=self.customer_user).update(balance=999)
+        UserPoint.objects.create(user=self.admin_user, point_type=UserPoint.PointType.EARN, amount=700)
+
+        out = StringIO()
+        call_command('rebuild_point_balances', '--verify', stdout=out)
+        assert '1 mismatched' in out.getvalue()
+        assert UserPointBalance.objects.get(user=self.customer_user).balance == 999
+
+        call_command('rebuild_point_balances', '--chunk-size', '1', stdout=StringIO())
+        assert UserPointBalance.objects.get(user=self.customer_user).balance == 1000
+        assert UserPointBalance.objects.get(user=self.admin_user).balance == 700
@@ -0,0 +1,32 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from orders.services.inventory_reservation_services import (
+    RECONCILE_BATCH_SIZE,
+    InventoryReservationService,
+)
+
+
+class Command(BaseCommand):
+    help = 'Release expired stock reservations and apply committed reservations to product stock'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECONCILE_BATCH_SIZE,
+            help='Number of products updated per transaction',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        released_count = InventoryReservationService.release_expired(limit=options['batch_size'])
+        while released_count:
+            self.stdout.write(f'Released {released_count} expired reservations')
+            released_count = InventoryReservationService.release_expired(limit=options['batch_size'])
+
+        reconciled_count = InventoryReservationService.reconcile(batch_size=options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Reconciled stock for {reconciled_count} products')
+        )
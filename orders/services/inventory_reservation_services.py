@@ -0,0 +1,342 @@
+import logging
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django_redis import get_redis_connection
+
+from products.models import Product, ProductIndexOutbox
+from products.utils.cache_tags import invalidate_products
+
+if TYPE_CHECKING:
+    from django_redis.client import DefaultClient
+
+logger = logging.getLogger(__name__)
+
+RESERVATION_TIMEOUT = 60 * 15
+SWEEP_LIMIT = 100
+RECONCILE_BATCH_SIZE = 500
+
+# 카운터를 다시 채워야 하는데 DB 재고가 넘어오지 않았다는 뜻으로 스크립트가 돌려주는 값
+SEED_REQUIRED = 2
+
+# 상품별 가용 재고 카운터가 없으면 DB 재고에서 (미반영 확정분 + 보류분)을 빼서 초기화한 뒤,
+# 모든 상품의 재고가 충분할 때만 한 번에 차감한다. DB 재고가 빈 값이면 SEED_REQUIRED 를 돌려준다.
+RESERVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return {1, ''}
+end
+local n = (#ARGV - 3) / 3
+for i = 0, n - 1 do
+    local pid = ARGV[4 + i * 3]
+    local qty = tonumber(ARGV[5 + i * 3])
+    local stock_key = ARGV[1] .. pid
+    if redis.call('EXISTS', stock_key) == 0 then
+        if ARGV[6 + i * 3] == '' then
+            return {2, pid}
+        end
+        local pending = tonumber(redis.call('HGET', KEYS[3], pid) or '0')
+        local reserved = tonumber(redis.call('HGET', KEYS[2], pid) or '0')
+        redis.call('SET', stock_key, tonumber(ARGV[6 + i * 3]) - pending - reserved)
+    end
+    if tonumber(redis.call('GET', stock_key)) < qty then
+        return {0, pid}
+    end
+end
+for i = 0, n - 1 do
+    local pid = ARGV[4 + i * 3]
+    local qty = tonumber(ARGV[5 + i * 3])
+    redis.call('DECRBY', ARGV[1] .. pid, qty)
+    redis.call('HINCRBY', KEYS[2], pid, qty)
+    redis.call('HSET', KEYS[1], pid, qty)
+end
+redis.call('ZADD', KEYS[4], ARGV[2], ARGV[3])
+return {1, ''}
+"""
+
+RELEASE_FUNCTION = """
+local function release(reservation_key, stock_prefix, reserved_key, expiry_key)
+    local fields = redis.call('HGETALL', reservation_key)
+    for i = 1, #fields, 2 do
+        local stock_key = stock_prefix .. fields[i]
+        if redis.call('EXISTS', stock_key) == 1 then
+            redis.call('INCRBY', stock_key, fields[i + 1])
+        end
+        redis.call('HINCRBY', reserved_key, fields[i], -tonumber(fields[i + 1]))
+    end
+    redis.call('DEL', reservation_key)
+    redis.call('ZREM', expiry_key, reservation_key)
+    if #fields > 0 then
+        return 1
+    end
+    return 0
+end
+"""
+
+RELEASE_SCRIPT = RELEASE_FUNCTION + """
+return release(KEYS[1], ARGV[1], KEYS[2], KEYS[4])
+"""
+
+SWEEP_SCRIPT = RELEASE_FUNCTION + """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[2], 'LIMIT', 0, tonumber(ARGV[3]))
+local released = 0
+for _, reservation_key in ipairs(expired) do
+    released = released + release(reservation_key, ARGV[1], KEYS[1], KEYS[2])
+end
+return released
+"""
+
+COMMIT_RESERVED = 1
+COMMIT_WITHOUT_HOLD = 0
+COMMIT_OVERSOLD = -1
+
+# 보류분을 확정분으로 옮긴다. 보류가 이미 만료되었다면 지금 남은 재고로 모두 차감할 수 있을 때만
+# 확정하고, 부족하면 아무것도 바꾸지 않고 -1 을 돌려준다 (초과 판매). 카운터 초기화는 RESERVE_SCRIPT 와 같다.
+COMMIT_SCRIPT = """
+local fields = redis.call('HGETALL', KEYS[1])
+local status = 1
+if #fields == 0 then
+    status = 0
+    for i = 2, #ARGV, 3 do
+        local stock_key = ARGV[1] .. ARGV[i]
+        if redis.call('EXISTS', stock_key) == 0 then
+            if ARGV[i + 2] == '' then
+                return 2
+            end
+            local pending = tonumber(redis.call('HGET', KEYS[3], ARGV[i]) or '0')
+            local reserved = tonumber(redis.call('HGET', KEYS[2], ARGV[i]) or '0')
+            redis.call('SET', stock_key, tonumber(ARGV[i + 2]) - pending - reserved)
+        end
+        if tonumber(redis.call('GET', stock_key)) < tonumber(ARGV[i + 1]) then
+            return -1
+        end
+    end
+    for i = 2, #ARGV, 3 do
+        redis.call('DECRBY', ARGV[1] .. ARGV[i], ARGV[i + 1])
+        redis.call('HINCRBY', KEYS[3], ARGV[i], ARGV[i + 1])
+    end
+else
+    for i = 1, #fields, 2 do
+        redis.call('HINCRBY', KEYS[2], fields[i], -tonumber(fields[i + 1]))
+        redis.call('HINCRBY', KEYS[3], fields[i], fields[i + 1])
+    end
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[4], KEYS[1])
+return status
+"""
+
+SETTLE_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], -tonumber(ARGV[i + 1])) <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return 1
+"""
+
+
+class InventoryReservationService:
+    @staticmethod
+    def _get_redis_client() -> "DefaultClient":
+        return get_redis_connection("default")
+
+    @staticmethod
+    def _run_script(script: str, keys: List[str], args: List[Any]) -> Any:
+        redis_client = InventoryReservationService._get_redis_client()
+        return redis_client.register_script(script)(keys=keys, args=args)
+
+    @staticmethod
+    def _stock_prefix() -> str:
+        return django_cache.make_key("inventory:stock:")
+
+    @staticmethod
+    def _reservation_key(preorder_key: str) -> str:
+        return django_cache.make_key(f"inventory:reservation:{preorder_key}")
+
+    @staticmethod
+    def _reserved_key() -> str:
+        return django_cache.make_key("inventory:reserved")
+
+    @staticmethod
+    def _pending_key() -> str:
+        return django_cache.make_key("inventory:pending")
+
+    @staticmethod
+    def _expiry_key() -> str:
+        return django_cache.make_key("inventory:expiry")
+
+    @staticmethod
+    def _script_keys(preorder_key: str) -> List[str]:
+        return [
+            InventoryReservationService._reservation_key(preorder_key),
+            InventoryReservationService._reserved_key(),
+            InventoryReservationService._pending_key(),
+            InventoryReservationService._expiry_key(),
+        ]
+
+    @staticmethod
+    def _run_stock_script(script: str, keys: List[str], args: List[Any], quantities: Dict[int, int]) -> Any:
+        # 카운터가 모두 있으면 DB 재고를 읽지 않는다. 없는 카운터가 있으면 reconcile 과 같은 상품 행 잠금을
+        # 잡고 다시 실행해, 반영 전 재고와 반영 후 미반영 수량을 섞어 읽은 값으로 카운터를 채우지 않게 한다.
+        unseeded_args = list(args)
+        for product_id, quantity in quantities.items():
+            unseeded_args.extend([product_id, quantity, ""])
+
+        result = InventoryReservationService._run_script(script, keys, unseeded_args)
+        if (result[0] if isinstance(result, list) else result) != SEED_REQUIRED:
+            return result
+
+        with transaction.atomic():
+            stock_map = dict(
+                Product.objects.select_for_update()
+                .filter(id__in=quantities.keys())
+                .order_by("id")
+                .values_list("id", "stock")
+            )
+            seeded_args = list(args)
+            for product_id, quantity in quantities.items():
+                seeded_args.extend([product_id, quantity, stock_map.get(product_id, 0)])
+            return InventoryReservationService._run_script(script, keys, seeded_args)
+
+    @staticmethod
+    def aggregate_quantities(items: List[Dict[str, Any]]) -> Dict[int, int]:
+        quantities: Dict[int, int] = defaultdict(int)
+        for item in items:
+            quantities[int(item["product_id"])] += int(item.get("quantity", 1))
+        return dict(quantities)
+
+    @staticmethod
+    def reserve(
+        preorder_key: str, items: List[Dict[str, Any]], timeout: int = RESERVATION_TIMEOUT
+    ) -> Tuple[bool, str]:
+        quantities = InventoryReservationService.aggregate_quantities(items)
+        if not quantities:
+            return True, ""
+
+        InventoryReservationService.release_expired()
+
+        args: List[Any] = [
+            InventoryReservationService._stock_prefix(),
+            time.time() + timeout,
+            InventoryReservationService._reservation_key(preorder_key),
+        ]
+        is_reserved, product_id = InventoryReservationService._run_stock_script(
+            RESERVE_SCRIPT, InventoryReservationService._script_keys(preorder_key), args, quantities
+        )
+        if not is_reserved:
+            product_name = Product.objects.filter(id=int(product_id)).values_list("name", flat=True).first()
+            return False, f"'{product_name}' 상품의 재고가 부족합니다."
+
+        return True, ""
+
+    @staticmethod
+    def extend(preorder_key: str, timeout: int = RESERVATION_TIMEOUT) -> None:
+        redis_client = InventoryReservationService._get_redis_client()
+        redis_client.zadd(
+            InventoryReservationService._expiry_key(),
+            {InventoryReservationService._reservation_key(preorder_key): time.time() + timeout},
+            xx=True,
+        )
+
+    @staticmethod
+    def release(preorder_key: str) -> bool:
+        keys = InventoryReservationService._script_keys(preorder_key)
+        return bool(
+            InventoryReservationService._run_script(
+                RELEASE_SCRIPT, keys, [InventoryReservationService._stock_prefix()]
+            )
+        )
+
+    @staticmethod
+    def release_expired(limit: int = SWEEP_LIMIT) -> int:
+        return int(
+            InventoryReservationService._run_script(
+                SWEEP_SCRIPT,
+                [InventoryReservationService._reserved_key(), InventoryReservationService._expiry_key()],
+                [InventoryReservationService._stock_prefix(), time.time(), limit],
+            )
+        )
+
+    @staticmethod
+    def commit(preorder_key: str | None, items: List[Dict[str, Any]]) -> int:
+        quantities = InventoryReservationService.aggregate_quantities(items)
+
+        # preOrderKey 없이 결제된 경우에도 남은 재고가 있으면 확정분으로 차감한다.
+        status = int(
+            InventoryReservationService._run_stock_script(
+                COMMIT_SCRIPT,
+                InventoryReservationService._script_keys(preorder_key or ""),
+                [InventoryReservationService._stock_prefix()],
+                quantities,
+            )
+        )
+        if status == COMMIT_WITHOUT_HOLD:
+            logger.warning(f"[Inventory] Reservation not found for {preorder_key}, committed without hold")
+        elif status == COMMIT_OVERSOLD:
+            logger.error(f"[Inventory] Reservation expired for {preorder_key} and stock is insufficient: {quantities}")
+        return status
+
+    @staticmethod
+    def invalidate_stock(product_id: int) -> None:
+        redis_client = InventoryReservationService._get_redis_client()
+        redis_client.delete(f"{InventoryReservationService._stock_prefix()}{product_id}")
+
+    @staticmethod
+    def get_available_stock(product_id: int) -> int | None:
+        redis_client = InventoryReservationService._get_redis_client()
+        value = redis_client.get(f"{InventoryReservationService._stock_prefix()}{product_id}")
+        return int(value) if value is not None else None
+
+    @staticmethod
+    def reconcile(batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+        redis_client = InventoryReservationService._get_redis_client()
+        pending = {
+            int(product_id): int(quantity)
+            for product_id, quantity in redis_client.hgetall(InventoryReservationService._pending_key()).items()
+            if int(quantity) > 0
+        }
+
+        product_ids = sorted(pending)
+        reconciled = 0
+        for start in range(0, len(product_ids), batch_size):
+            batch = {product_id: pending[product_id] for product_id in product_ids[start:start + batch_size]}
+
+            settle_args: List[Any] = []
+            for product_id, quantity in batch.items():
+                settle_args.extend([product_id, quantity])
+
+            is_settled = False
+            try:
+                with transaction.atomic():
+                    Product.objects.filter(id__in=batch.keys()).update(
+                        stock=F("stock") - Case(
+                            *[When(id=product_id, then=Value(quantity)) for product_id, quantity in batch.items()],
+                            default=Value(0),
+                            output_field=IntegerField(),
+                        )
+                    )
+                    # update() 는 시그널을 보내지 않으므로 재고 변경을 색인 아웃박스와 캐시 태그에 직접 반영한다
+                    ProductIndexOutbox.enqueue(batch.keys())
+                    invalidate_products(batch.keys())
+
+                    # 행 잠금을 쥔 채로 미반영 수량을 줄여야, 잠금을 기다리던 카운터 초기화가
+                    # 반영된 재고와 줄어든 미반영 수량을 함께 읽는다.
+                    InventoryReservationService._run_script(
+                        SETTLE_SCRIPT, [InventoryReservationService._pending_key()], settle_args
+                    )
+                    is_settled = True
+            except Exception:
+                # 커밋이 실패했다면 DB 재고는 그대로이므로 줄인 미반영 수량을 되돌린다
+                if is_settled:
+                    with redis_client.pipeline() as pipe:
+                        for product_id, quantity in batch.items():
+                            pipe.hincrby(InventoryReservationService._pending_key(), str(product_id), quantity)
+                        pipe.execute()
+                raise
+            reconciled += len(batch)
+
+        return reconciled
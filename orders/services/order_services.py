@@ -1,12 +1,16 @@
 import uuid
 from decimal import Decimal
-from typing import Any, Dict, List, Tuple, TypeVar
+from typing import Any, Dict, List, Set, Tuple, TypeVar
 
 from django.db.models import Count, Model, Q, QuerySet
 from django.utils import timezone
 
 from config.utils.cache_helper import CacheHelper
 from orders.models import Order
+from orders.services.inventory_reservation_services import (
+    RESERVATION_TIMEOUT,
+    InventoryReservationService,
+)
 from products.models import Color, Product, Size
 
 T = TypeVar("T", bound=Model)
@@ -35,23 +39,42 @@ class OrderService:
         product_relation_name: str,
         option_name: str,
         option_name_subject: str,
+        existing_option_ids: Set[int] | None = None,
     ) -> Tuple[bool, str]:
-        if not model.objects.filter(id=option_id).exists():  # type: ignore[attr-defined]
+        if existing_option_ids is None:
+            existing_option_ids = OrderService.get_existing_option_ids([option_id], model)
+
+        if int(option_id) not in existing_option_ids:
             return False, f"존재하지 않는 {option_name}입니다."
 
-        product_relation = getattr(product, product_relation_name)
-        if not product_relation.filter(id=option_id).exists():
+        # validate_products에서 prefetch한 옵션을 사용하므로 추가 쿼리가 발생하지 않는다
+        product_option_ids = {option.id for option in getattr(product, product_relation_name).all()}
+        if int(option_id) not in product_option_ids:
             return False, f"'{product.name}' 상품에 선택하신 {option_name_subject} 존재하지 않습니다."
 
         return True, ""
 
     @staticmethod
-    def validate_color(color_id: int, product: Product) -> Tuple[bool, str]:
-        return OrderService._validate_option(color_id, product, Color, "colors", "색상", "색상이")
+    def get_existing_option_ids(option_ids: List[int], model: type[T]) -> Set[int]:
+        if not option_ids:
+            return set()
+        return set(model.objects.filter(id__in=option_ids).values_list("id", flat=True))  # type: ignore[attr-defined]
 
     @staticmethod
-    def validate_size(size_id: int, product: Product) -> Tuple[bool, str]:
-        return OrderService._validate_option(size_id, product, Size, "sizes", "사이즈", "사이즈가")
+    def validate_color(
+        color_id: int, product: Product, existing_color_ids: Set[int] | None = None
+    ) -> Tuple[bool, str]:
+        return OrderService._validate_option(
+            color_id, product, Color, "colors", "색상", "색상이", existing_color_ids
+        )
+
+    @staticmethod
+    def validate_size(
+        size_id: int, product: Product, existing_size_ids: Set[int] | None = None
+    ) -> Tuple[bool, str]:
+        return OrderService._validate_option(
+            size_id, product, Size, "sizes", "사이즈", "사이즈가", existing_size_ids
+        )
 
     @staticmethod
     def get_options_map(
@@ -64,9 +87,7 @@ class OrderService:
 
     @staticmethod
     def calculate_item_price(product: Product) -> Decimal:
-        if product.sale_price:
-            return Decimal(str(product.price)) - Decimal(str(product.sale_price))
-        return Decimal(str(product.price))
+        return Decimal(str(product.effective_price))
 
     @staticmethod
     def validate_and_prepare_order_items(
@@ -81,6 +102,13 @@ class OrderService:
         if not is_valid:
             return False, error_message, [], Decimal("0.0")
 
+        existing_color_ids = OrderService.get_existing_option_ids(
+            [item["color_id"] for item in items_data if item.get("color_id")], Color
+        )
+        existing_size_ids = OrderService.get_existing_option_ids(
+            [item["size_id"] for item in items_data if item.get("size_id")], Size
+        )
+
         validated_items: List[Dict[str, Any]] = []
         total_amount = Decimal("0.0")
 
@@ -91,12 +119,12 @@ class OrderService:
             size_id = item.get("size_id")
 
             if color_id:
-                is_valid, error_message = OrderService.validate_color(color_id, product)
+                is_valid, error_message = OrderService.validate_color(color_id, product, existing_color_ids)
                 if not is_valid:
                     return False, error_message, [], Decimal("0.0")
 
             if size_id:
-                is_valid, error_message = OrderService.validate_size(size_id, product)
+                is_valid, error_message = OrderService.validate_size(size_id, product, existing_size_ids)
                 if not is_valid:
                     return False, error_message, [], Decimal("0.0")
 
@@ -121,6 +149,11 @@ class OrderService:
         user_id: int, validated_items: List[Dict[str, Any]], total_amount: Decimal
     ) -> str:
         preorder_key = OrderService.generate_preorder_key()
+
+        is_reserved, error_message = InventoryReservationService.reserve(preorder_key, validated_items)
+        if not is_reserved:
+            raise ValueError(error_message)
+
         cache_data = {
             "user_id": user_id,
             "items": validated_items,
@@ -128,7 +161,7 @@ class OrderService:
             "created_at": timezone.now().isoformat(),
         }
 
-        CacheHelper.set(preorder_key, cache_data, timeout=60 * 15)
+        CacheHelper.set(preorder_key, cache_data, timeout=RESERVATION_TIMEOUT)
 
         return preorder_key
 
@@ -0,0 +1,243 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.utils.setup_test_method import TestSetupMixin
+from orders.models import Order
+from orders.services.inventory_reservation_services import (
+    COMMIT_OVERSOLD,
+    COMMIT_RESERVED,
+    COMMIT_WITHOUT_HOLD,
+    InventoryReservationService,
+)
+from orders.services.order_services import OrderService
+
+
+@pytest.mark.django_db
+class TestInventoryReservation(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.items: List[Dict[str, Any]] = [{"product_id": self.product.id, "quantity": 2}]
+
+    def test_reserve_holds_stock(self) -> None:
+        is_reserved, error_message = InventoryReservationService.reserve("order:preorder:a", self.items)
+
+        assert is_reserved is True
+        assert error_message == ""
+        assert InventoryReservationService.get_available_stock(self.product.id) == 3
+
+    def test_reserve_insufficient_stock(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+        InventoryReservationService.reserve("order:preorder:b", self.items)
+
+        is_reserved, error_message = InventoryReservationService.reserve("order:preorder:c", self.items)
+
+        assert is_reserved is False
+        assert f"'{self.product.name}' 상품의 재고가 부족합니다." == error_message
+        assert InventoryReservationService.get_available_stock(self.product.id) == 1
+
+    def test_reserve_is_idempotent_per_key(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+
+        assert InventoryReservationService.get_available_stock(self.product.id) == 3
+
+    def test_release_returns_stock(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+
+        assert InventoryReservationService.release("order:preorder:a") is True
+        assert InventoryReservationService.release("order:preorder:a") is False
+        assert InventoryReservationService.get_available_stock(self.product.id) == 5
+
+    def test_release_expired(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items, timeout=-1)
+
+        assert InventoryReservationService.release_expired() == 1
+        assert InventoryReservationService.get_available_stock(self.product.id) == 5
+
+    def test_extend_keeps_reservation(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items, timeout=-1)
+        InventoryReservationService.extend("order:preorder:a")
+
+        assert InventoryReservationService.release_expired() == 0
+        assert InventoryReservationService.get_available_stock(self.product.id) == 3
+
+    def test_commit_and_reconcile_updates_product_stock(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+
+        assert InventoryReservationService.commit("order:preorder:a", self.items) == COMMIT_RESERVED
+        assert InventoryReservationService.release("order:preorder:a") is False
+
+        call_command("reconcile_inventory")
+
+        self.product.refresh_from_db()
+        assert self.product.stock == 3
+        assert InventoryReservationService.get_available_stock(self.product.id) == 3
+
+    def test_commit_without_reservation(self) -> None:
+        assert InventoryReservationService.commit(None, self.items) == COMMIT_WITHOUT_HOLD
+
+        InventoryReservationService.reconcile()
+
+        self.product.refresh_from_db()
+        assert self.product.stock == 3
+
+    def test_commit_after_expiry_does_not_oversell(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items, timeout=-1)
+        InventoryReservationService.release_expired()
+        InventoryReservationService.reserve("order:preorder:b", [{"product_id": self.product.id, "quantity": 4}])
+
+        assert InventoryReservationService.commit("order:preorder:a", self.items) == COMMIT_OVERSOLD
+        assert InventoryReservationService.get_available_stock(self.product.id) == 1
+
+        InventoryReservationService.reconcile()
+        self.product.refresh_from_db()
+        assert self.product.stock == 5
+
+    def test_invalidate_stock_reseeds_with_outstanding_holds(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+        self.product.stock = 10
+        self.product.save()
+        InventoryReservationService.invalidate_stock(self.product.id)
+
+        InventoryReservationService.reserve("order:preorder:b", [{"product_id": self.product.id, "quantity": 1}])
+
+        assert InventoryReservationService.get_available_stock(self.product.id) == 7
+
+    def test_product_save_invalidates_stock_counter(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+        self.product.stock = 10
+        self.product.save()
+
+        assert InventoryReservationService.get_available_stock(self.product.id) is None
+
+        InventoryReservationService.reserve("order:preorder:b", [{"product_id": self.product.id, "quantity": 1}])
+        assert InventoryReservationService.get_available_stock(self.product.id) == 7
+
+    def test_product_save_without_stock_keeps_counter(self) -> None:
+        InventoryReservationService.reserve("order:preorder:a", self.items)
+        self.product.name = "이름만 바꾼 상품"
+        self.product.save(update_fields=["name"])
+
+        assert InventoryReservationService.get_available_stock(self.product.id) == 3
+
+    def test_seeding_locks_product_rows(self) -> None:
+        with CaptureQueriesContext(connection) as seeding_queries:
+            InventoryReservationService.reserve("order:preorder:a", self.items)
+        with CaptureQueriesContext(connection) as seeded_queries:
+            InventoryReservationService.reserve("order:preorder:b", self.items)
+
+        assert any("FOR UPDATE" in query["sql"] for query in seeding_queries.captured_queries)
+        assert seeded_queries.captured_queries == []
+
+    def test_preorder_view_rejects_insufficient_stock(self) -> None:
+        self.client.force_login(self.customer_user)
+
+        response = self.client.post(
+            reverse("orders:preorder"),
+            data=json.dumps({"items": [{"product_id": self.product.id, "quantity": 6}]}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 409
+        assert "재고가 부족합니다" in response.json()["message"]
+
+    def test_toss_fail_releases_reservation(self) -> None:
+        _, _, validated_items, total_amount = OrderService.validate_and_prepare_order_items(self.items)
+        preorder_key = OrderService.create_preorder_cache(self.customer_user.id, validated_items, total_amount)
+        assert InventoryReservationService.get_available_stock(self.product.id) == 3
+
+        self.client.get(reverse("payments:toss-fail"), {"preOrderKey": preorder_key})
+
+        assert InventoryReservationService.get_available_stock(self.product.id) == 5
+
+    @patch("payments.services.toss_payment_service.requests.post")
+    def test_toss_confirm_commits_reservation(self, mock_post: Any, django_capture_on_commit_callbacks: Any) -> None:
+        self.client.force_login(self.customer_user)
+        _, _, validated_items, total_amount = OrderService.validate_and_prepare_order_items(self.items)
+        preorder_key = OrderService.create_preorder_cache(self.customer_user.id, validated_items, total_amount)
+        final_amount = int(total_amount) + 3000
+
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"method": "CARD", "receipt": {"url": ""}}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = self.client.get(reverse("payments:toss-confirm"), {
+                "paymentKey": "mock_payment_key",
+                "orderId": "ORD-RESERVE",
+                "amount": str(final_amount),
+                "preOrderKey": preorder_key,
+            })
+
+        assert response.status_code == 302
+        assert InventoryReservationService.release(preorder_key) is False
+
+        InventoryReservationService.reconcile()
+        self.product.refresh_from_db()
+        assert self.product.stock == 3
+
+    @patch("payments.services.toss_payment_service.requests.post")
+    def test_toss_confirm_flags_oversold_order(self, mock_post: Any, django_capture_on_commit_callbacks: Any) -> None:
+        self.client.force_login(self.customer_user)
+        _, _, validated_items, total_amount = OrderService.validate_and_prepare_order_items(self.items)
+        preorder_key = OrderService.create_preorder_cache(self.customer_user.id, validated_items, total_amount)
+        # 보류가 만료되고 그사이 다른 주문이 남은 재고를 가져간 상황
+        InventoryReservationService.release(preorder_key)
+        InventoryReservationService.reserve("order:preorder:other", [{"product_id": self.product.id, "quantity": 5}])
+
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"method": "CARD", "receipt": {"url": ""}}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.client.get(reverse("payments:toss-confirm"), {
+                "paymentKey": "mock_payment_key",
+                "orderId": "ORD-OVERSOLD",
+                "amount": str(int(total_amount) + 3000),
+                "preOrderKey": preorder_key,
+            })
+
+        order = Order.objects.get(order_id="ORD-OVERSOLD")
+        assert order.cancellation_request_status == Order.CancellationRequestStatus.PENDING
+        assert order.cancellation_admin_note
+        assert InventoryReservationService.get_available_stock(self.product.id) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+class TestInventoryReservationConcurrency(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.product.stock = 50
+        self.product.save()
+
+    def _checkout(self, index: int) -> Tuple[bool, str]:
+        try:
+            return InventoryReservationService.reserve(
+                f"order:preorder:concurrent{index}",
+                [{"product_id": self.product.id, "quantity": 1}],
+            )
+        finally:
+            connection.close()
+
+    def test_parallel_checkouts_never_oversell(self) -> None:
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            results = list(executor.map(self._checkout, range(300)))
+
+        succeeded = [result for result in results if result[0]]
+        assert len(succeeded) == 50
+        assert InventoryReservationService.get_available_stock(self.product.id) == 0
+
+        for index in range(300):
+            InventoryReservationService.commit(f"order:preorder:concurrent{index}", [])
+        InventoryReservationService.reconcile()
+
+        self.product.refresh_from_db()
+        assert self.product.stock == 0
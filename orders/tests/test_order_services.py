@@ -1,8 +1,10 @@
+from typing import Any, Dict, List
+
 import pytest
 
 from config.utils.setup_test_method import TestSetupMixin
 from orders.services.order_services import OrderService
-from products.models import Color
+from products.models import Color, Product, Size
 
 
 @pytest.mark.django_db
@@ -66,3 +68,48 @@ class TestOrderService(TestSetupMixin):
         assert "존재하지 않는 색상" in error_message or "선택하신 색상이 존재하지 않습니다" in error_message
         assert validated_items == []
         assert total_amount == 0
+
+    def test_validate_size_size_not_in_product(self) -> None:
+        other_size = Size.objects.create(name="XL")
+        is_valid, error_message = OrderService.validate_size(other_size.id, self.product)
+
+        assert is_valid is False
+        assert f"'{self.product.name}' 상품에 선택하신 사이즈가 존재하지 않습니다" in error_message
+
+    def test_validate_and_prepare_order_items_query_budget(self, django_assert_num_queries: Any) -> None:
+        color = Color.objects.create(name="블랙", hex_code="#000000")
+        size = Size.objects.create(name="M")
+        items_data: List[Dict[str, Any]] = []
+        for index in range(10):
+            product = Product.objects.create(
+                user=self.admin_user,
+                name=f"Query Budget Product {index}",
+                description="Test Description",
+                price=10000,
+                stock=10,
+            )
+            product.colors.add(color)
+            product.sizes.add(size)
+            items_data.append({"product_id": product.id, "color_id": color.id, "size_id": size.id, "quantity": 1})
+            items_data.append({"product_id": product.id, "color_id": color.id, "quantity": 2})
+
+        # 상품 + colors/sizes prefetch + 색상/사이즈 존재 확인 = 항목 수와 무관하게 5번
+        with django_assert_num_queries(5):
+            is_valid, error_message, validated_items, total_amount = (
+                OrderService.validate_and_prepare_order_items(items_data)
+            )
+
+        assert is_valid is True
+        assert error_message == ""
+        assert len(validated_items) == 20
+        assert total_amount == 300000
+
+    def test_validate_and_prepare_order_items_invalid_size(self) -> None:
+        other_size = Size.objects.create(name="XL")
+        items_data = [{"product_id": self.product.id, "size_id": other_size.id, "quantity": 1}]
+        is_valid, error_message, validated_items, total_amount = OrderService.validate_and_prepare_order_items(items_data)
+
+        assert is_valid is False
+        assert "선택하신 사이즈가 존재하지 않습니다" in error_message
+        assert validated_items == []
+        assert total_amount == 0
@@ -29,11 +29,14 @@ class OrderCreateView(LoginRequiredMixin, View):
             return JsonResponse({"error": error_message}, status=400)
 
         user = cast(User, request.user)
-        preorder_key = OrderService.create_preorder_cache(
-            user_id=user.id,
-            validated_items=validated_items,
-            total_amount=total_amount,
-        )
+        try:
+            preorder_key = OrderService.create_preorder_cache(
+                user_id=user.id,
+                validated_items=validated_items,
+                total_amount=total_amount,
+            )
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=409)
 
         return JsonResponse({
             "success": True,
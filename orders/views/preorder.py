@@ -24,7 +24,10 @@ class OrderPreorderView(LoginRequiredMixin, View):
             return JsonResponse({"success": False, "message": error_message}, status=400)
 
         user = cast(User, request.user)
-        preorder_key = OrderService.create_preorder_cache(user.id, validated_items, total_amount)
+        try:
+            preorder_key = OrderService.create_preorder_cache(user.id, validated_items, total_amount)
+        except ValueError as e:
+            return JsonResponse({"success": False, "message": str(e)}, status=409)
 
         return JsonResponse(
             {
@@ -1,7 +1,7 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
-from membership.models import UserPoint
+from membership.models import UserPoint, UserPointBalance
 from orders.models import Order
 
 
@@ -84,38 +84,35 @@ class Payment(models.Model):
 
         user = self.order.user
 
-        current_balance = UserPoint.get_user_balance(user)
-
-        if self.used_point > 0:
-            if current_balance < self.used_point:
-                raise ValueError("보유 포인트가 부족합니다.")
-
-            current_balance -= self.used_point
-            UserPoint.objects.create(
-                user=user,
-                point_type=UserPoint.PointType.USE,
-                amount=-self.used_point,
-                description=f"주문 {self.order.order_id} 결제 사용",
-                balance_after=current_balance,
-                related_order=self.order,
-            )
-            self.is_used_point = True
-
-        self.status = "APPROVED"
-        self.approved_at = timezone.now()
-
-        earn_amount = int(self.order.total_amount * 0.05)  # 예: 5% 적립
-        if earn_amount > 0:
-            new_balance = current_balance + earn_amount
-            UserPoint.objects.create(
-                user=user,
-                point_type=UserPoint.PointType.EARN,
-                amount=earn_amount,
-                description=f"주문 {self.order.order_id} 결제 적립",
-                balance_after=new_balance,
-                related_order=self.order,
-            )
-            self.earned_point = earn_amount
+        with transaction.atomic():
+            point_balance = UserPointBalance.lock_for_user(user.id)
+
+            if self.used_point > 0:
+                if point_balance.balance < self.used_point:
+                    raise ValueError("보유 포인트가 부족합니다.")
+
+                UserPoint.record(
+                    user=user,
+                    point_type=UserPoint.PointType.USE,
+                    amount=-self.used_point,
+                    description=f"주문 {self.order.order_id} 결제 사용",
+                    related_order=self.order,
+                )
+                self.is_used_point = True
+
+            self.status = "APPROVED"
+            self.approved_at = timezone.now()
+
+            earn_amount = int(self.order.total_amount * 0.05)  # 예: 5% 적립
+            if earn_amount > 0:
+                UserPoint.record(
+                    user=user,
+                    point_type=UserPoint.PointType.EARN,
+                    amount=earn_amount,
+                    description=f"주문 {self.order.order_id} 결제 적립",
+                    related_order=self.order,
+                )
+                self.earned_point = earn_amount
 
         self.save(
             update_fields=[
@@ -36,11 +36,7 @@ class PaymentService:
             product = products_dict.get(item_data['product_id'])
             
             if product:
-                if product.sale_price:
-                    item_price = Decimal(str(product.price)) - Decimal(str(product.sale_price))
-                else:
-                    item_price = Decimal(str(product.price))
-                
+                item_price = Decimal(str(product.effective_price))
                 item_total = item_price * Decimal(str(item_data['quantity']))
                 actual_total += item_total
                 
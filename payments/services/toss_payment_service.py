@@ -10,6 +10,10 @@ from django.utils import timezone
 
 from carts.models import Cart
 from orders.models import Order, OrderItem
+from orders.services.inventory_reservation_services import (
+    COMMIT_OVERSOLD,
+    InventoryReservationService,
+)
 from orders.services.order_services import OrderService
 from payments.models import Payment, PaymentLog
 from products.models import Color, Size
@@ -145,6 +149,7 @@ class TossPaymentService:
         request_url: str | None = None,
         request_payload: Dict[str, Any] | None = None,
         response_status_code: int | None = None,
+        pre_order_key: str | None = None,
     ) -> None:
 
         user = get_user_model().objects.get(id=user_id)
@@ -219,6 +224,24 @@ class TossPaymentService:
 
             TossPaymentService.clear_cart_after_payment(user_id, items_data)
 
+            # 주문이 커밋된 뒤에만 보류 재고를 확정한다 (DB 반영은 reconcile_inventory 배치).
+            transaction.on_commit(
+                lambda: TossPaymentService.commit_inventory(order.id, pre_order_key, items_data)
+            )
+
+    @staticmethod
+    def commit_inventory(order_pk: int, pre_order_key: str | None, items_data: List[Dict[str, Any]]) -> None:
+        if InventoryReservationService.commit(pre_order_key, items_data) != COMMIT_OVERSOLD:
+            return
+
+        # 보류가 만료된 뒤 결제되어 재고가 부족하면 재고는 차감하지 않고 관리자 취소 요청 목록에 올린다
+        Order.objects.filter(id=order_pk).update(
+            cancellation_request_status=Order.CancellationRequestStatus.PENDING,
+            cancellation_reason=Order.CancellationReason.OTHER,
+            cancellation_requested_at=timezone.now(),
+            cancellation_admin_note="재고 보류가 만료된 뒤 결제되어 재고가 부족합니다. 환불 또는 수동 처리가 필요합니다.",
+        )
+
     @staticmethod
     def clear_cart_after_payment(user_id: int, items_data: List[Dict[str, Any]]) -> None:
         user = get_user_model().objects.get(id=user_id)
@@ -82,6 +82,7 @@ class PointOnlyPaymentView(LoginRequiredMixin, View):
                 payment_key=payment_key,
                 used_point=used_point_value,
                 payment_method="POINT",
+                pre_order_key=pre_order_key,
             )
 
             CacheHelper.delete(pre_order_key)
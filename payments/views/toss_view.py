@@ -12,6 +12,10 @@ from django.views.decorators.csrf import csrf_exempt, csrf_protect
 
 from config.utils.cache_helper import CacheHelper
 from membership.models import UserPoint
+from orders.services.inventory_reservation_services import (
+    RESERVATION_TIMEOUT,
+    InventoryReservationService,
+)
 from payments.services.toss_payment_service import TossPaymentService
 
 
@@ -46,7 +50,8 @@ class TossPaymentRequestView(LoginRequiredMixin, View):
             return JsonResponse({"error": "사용 포인트가 주문 금액을 초과할 수 없습니다."}, status=400)
 
         cache_data["used_point"] = used_point
-        CacheHelper.set(pre_order_key, cache_data, timeout=60 * 15)
+        CacheHelper.set(pre_order_key, cache_data, timeout=RESERVATION_TIMEOUT)
+        InventoryReservationService.extend(pre_order_key)
 
         base_url = settings.HOST_URL if not settings.DEBUG else request.build_absolute_uri("/")[:-1]
         _, _, _, response_data = TossPaymentService.prepare_payment_request(
@@ -88,6 +93,7 @@ class TossFailView(View):
         pre_order_key = request.GET.get("preOrderKey")
         if pre_order_key:
             CacheHelper.delete(pre_order_key)
+            InventoryReservationService.release(pre_order_key)
 
         return JsonResponse({
             "success": False,
@@ -165,6 +171,7 @@ class TossConfirmView(View):
                 request_payload=request_payload,
                 response_status_code=status_code,
                 used_point=used_point,
+                pre_order_key=pre_order_key,
             )
         except IntegrityError:
             return JsonResponse({"success": True, "message": "이미 승인된 결제입니다."}, status=200)
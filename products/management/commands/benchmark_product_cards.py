@@ -0,0 +1,66 @@
+import time
+from itertools import cycle, islice
+from typing import Any, Callable, List
+
+from django.core.cache import cache as django_cache
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+
+from products.models import ProductListing
+from products.services.product_card_cache import ProductCardCacheService
+from products.services.product_listing import ProductListingService
+
+# 비교용으로 남겨 둔 이전 방식 (카드마다 템플릿을 렌더링)
+LEGACY_CARDS_TEMPLATE = (
+    '{% for product in products %}{% include "products/customers/product_card.html" %}{% endfor %}'
+)
+
+
+class Command(BaseCommand):
+    help = 'Compare product card page render time with and without the card fragment cache'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument('--cards', type=int, default=60, help='Product cards rendered per page')
+        parser.add_argument('--iterations', type=int, default=20, help='Page renders per measurement')
+
+    def get_page(self, card_count: int) -> List[ProductListing]:
+        # 목록 페이지처럼 매번 새로 읽어 조회 비용까지 포함해 잰다
+        products = list(ProductListingService.get_live_listings().order_by('-id')[:card_count])
+        if not products:
+            raise CommandError('No live products to render')
+        return list(islice(cycle(products), card_count))
+
+    def measure(self, label: str, iterations: int, func: Callable[[], Any]) -> None:
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed_ms = (time.perf_counter() - started_at) * 1000 / iterations
+        self.stdout.write(f'{label}: {elapsed_ms:.2f} ms/page')
+
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        card_count = options['cards']
+        iterations = options['iterations']
+        legacy_template = engines['django'].from_string(LEGACY_CARDS_TEMPLATE)
+        card_keys = ProductCardCacheService.get_card_keys(self.get_page(card_count))
+
+        self.stdout.write(f'{card_count} cards per page, {iterations} iterations')
+        self.measure(
+            'without fragment cache',
+            iterations,
+            lambda: legacy_template.render({'products': self.get_page(card_count)}),
+        )
+
+        def render_cold() -> None:
+            django_cache.delete_many(card_keys)
+            ProductCardCacheService.render_cards(self.get_page(card_count))
+
+        self.measure('fragment cache, all cards missing', iterations, render_cold)
+        self.measure(
+            'fragment cache, all cards cached',
+            iterations,
+            lambda: ProductCardCacheService.render_cards(self.get_page(card_count)),
+        )
+        django_cache.delete_many(card_keys)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
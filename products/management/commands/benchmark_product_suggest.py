@@ -0,0 +1,68 @@
+import statistics
+import time
+from typing import Any, Callable, List
+
+from django.core.management.base import BaseCommand
+
+from products.models import Product
+from products.services.product_suggest import SUGGEST_SIZE, ProductSuggestService
+from products.utils.elasticsearch.elastic_search import suggest_products
+
+
+class Command(BaseCommand):
+    help = 'Measure autocomplete latency against Elasticsearch and the Redis cache'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--prefixes',
+            nargs='*',
+            help='Prefixes to query (defaults to the first 1-3 characters of live product names)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Number of rounds over all prefixes',
+        )
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=SUGGEST_SIZE,
+            help='Number of suggestions per request',
+        )
+
+    def get_default_prefixes(self) -> List[str]:
+        names = Product.objects.filter(is_live=True).values_list('name', flat=True)[:50]
+        return sorted({name[:length] for name in names for length in (1, 2, 3) if len(name) >= length})
+
+    def measure(self, label: str, prefixes: List[str], iterations: int, func: Callable[[str], Any]) -> None:
+        timings = []
+        for _ in range(iterations):
+            for prefix in prefixes:
+                started_at = time.perf_counter()
+                func(prefix)
+                timings.append((time.perf_counter() - started_at) * 1000)
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f'{label}: {len(timings)} requests, '
+            f'p50 {statistics.median(timings):.2f}ms, p95 {p95:.2f}ms, max {timings[-1]:.2f}ms'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        prefixes = options['prefixes'] or self.get_default_prefixes()
+        if not prefixes:
+            self.stdout.write(self.style.WARNING('No prefixes to benchmark'))
+            return
+
+        size = options['size']
+        self.measure(
+            'elasticsearch', prefixes, options['iterations'], lambda prefix: suggest_products(prefix, size)
+        )
+        # 첫 라운드에서 캐시가 채워지므로 이후 요청은 Redis 에서 응답한다
+        self.measure(
+            'cached', prefixes, options['iterations'],
+            lambda prefix: ProductSuggestService.get_suggestions(prefix, size),
+        )
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
@@ -0,0 +1,25 @@
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.utils.elasticsearch.elastic_search import delete_old_product_indices
+
+
+class Command(BaseCommand):
+    help = 'Delete product index versions that are no longer behind the alias'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--grace-hours',
+            type=float,
+            default=24,
+            help='Keep unaliased versions younger than this so a swap can be rolled back',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deleted = delete_old_product_indices(timedelta(hours=options['grace_hours']))
+
+        for index_name in deleted:
+            self.stdout.write(f'Deleted {index_name}')
+        self.stdout.write(self.style.SUCCESS(f'Deleted {len(deleted)} old product indices'))
@@ -0,0 +1,47 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.services.search_analytics import (
+    SEARCH_LOG_BATCH_SIZE,
+    SearchAnalyticsService,
+)
+
+
+class Command(BaseCommand):
+    help = 'Move buffered search logs from Redis into the database'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SEARCH_LOG_BATCH_SIZE,
+            help='Number of log entries saved per bulk insert',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the queue instead of exiting once it is empty',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=10.0,
+            help='Seconds to sleep between polls when the queue is empty (with --loop)',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        saved_total = 0
+        while True:
+            saved_count = SearchAnalyticsService.persist(options['batch_size'])
+            if saved_count:
+                saved_total += saved_count
+                self.stdout.write(f'Saved {saved_count} search logs')
+                continue
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Saved {saved_total} search logs in total'))
@@ -1,9 +1,26 @@
+import time
+from datetime import datetime
 from typing import Any
 
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
+from config.utils.cache_helper import CacheHelper
 from products.models import Product
-from products.utils.elasticsearch.elastic_search import bulk_index_products
+from products.services.search_indexing import ProductIndexOutboxService
+from products.utils.elasticsearch.elastic_search import (
+    INDEX_CHUNK_SIZE,
+    PRODUCT_INDEX_NAME,
+    bump_search_generation,
+    create_product_index,
+    create_product_index_version,
+    start_double_write,
+    stop_double_write,
+    stream_index_products,
+    swap_product_index_alias,
+)
+
+INDEX_CHECKPOINT_KEY = 'products:index:checkpoint'
 
 
 class Command(BaseCommand):
@@ -13,25 +30,106 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force',
             action='store_true',
-            help='Force re-indexing of all products',
+            help='Rebuild into a new index version and swap the alias when done',
+        )
+        parser.add_argument(
+            '--double-write',
+            action='store_true',
+            help='Also write incremental updates to the new index while it is being built (with --force)',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue after the last checkpointed product ID',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=INDEX_CHUNK_SIZE,
+            help='Number of products per database fetch and bulk request',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=1,
+            help='Number of parallel bulk threads',
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
-        products = Product.objects.filter(is_live=True).prefetch_related('categories', 'colors')
-        
-        self.stdout.write(f'Indexing {products.count()} products...')
-        
-        success_count, failed_count = bulk_index_products(products, reset_index=options['force'])
-        
+        chunk_size = options['chunk_size']
+        checkpoint = CacheHelper.get(INDEX_CHECKPOINT_KEY) if options['resume'] else None
+
+        if checkpoint:
+            index_name, last_id = checkpoint['index'], checkpoint['last_id']
+            build_started_at = checkpoint['started_at']
+            self.stdout.write(f'Resuming {index_name} after product {last_id}...')
+        elif options['force']:
+            # 새 버전 인덱스를 만드는 동안에도 검색은 기존 별칭으로 계속 동작한다
+            index_name, last_id = create_product_index_version(), 0
+            build_started_at = timezone.now().isoformat()
+            self.stdout.write(f'Building {index_name}...')
+        else:
+            create_product_index()
+            index_name, last_id = PRODUCT_INDEX_NAME, 0
+            build_started_at = timezone.now().isoformat()
+
+        is_rebuild = index_name != PRODUCT_INDEX_NAME
+        if is_rebuild and options['double_write']:
+            start_double_write(index_name)
+
+        products = (
+            Product.objects.filter(is_live=True, id__gt=last_id)
+            .order_by('id')
+            .prefetch_related('categories', 'colors')
+            .iterator(chunk_size=chunk_size)
+        )
+
+        success_count = failed_count = 0
+        started_at = time.monotonic()
+        for ok, product_id in stream_index_products(products, chunk_size, options['threads'], index_name):
+            if ok:
+                success_count += 1
+            else:
+                failed_count += 1
+
+            # 결과는 상품 ID 순서대로 오므로 chunk 마다 마지막 ID 를 기록해 두면 중단 지점부터 이어서 색인할 수 있다
+            processed_count = success_count + failed_count
+            if processed_count % chunk_size == 0:
+                CacheHelper.set(INDEX_CHECKPOINT_KEY, {
+                    'index': index_name,
+                    'last_id': product_id,
+                    'started_at': build_started_at,
+                })
+                elapsed = max(time.monotonic() - started_at, 0.001)
+                self.stdout.write(f'Indexed {processed_count} products ({processed_count / elapsed:.1f} docs/s)')
+
+        if is_rebuild:
+            swap_product_index_alias(index_name)
+            stop_double_write()
+            # 재색인 중에 들어온 변경은 새 인덱스에 빠졌을 수 있으므로 아웃박스에서 다시 처리하게 한다
+            replayed_count = ProductIndexOutboxService.replay(since=datetime.fromisoformat(build_started_at))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Alias {PRODUCT_INDEX_NAME} now points to {index_name} '
+                    f'({replayed_count} outbox entries re-queued)'
+                )
+            )
+
+        CacheHelper.delete(INDEX_CHECKPOINT_KEY)
+        bump_search_generation()
+        elapsed = max(time.monotonic() - started_at, 0.001)
+
         if success_count > 0:
             self.stdout.write(
-                self.style.SUCCESS(f'Successfully indexed {success_count} products')
+                self.style.SUCCESS(
+                    f'Successfully indexed {success_count} products '
+                    f'in {elapsed:.1f}s ({success_count / elapsed:.1f} docs/s)'
+                )
             )
-        
+
         if failed_count > 0:
             self.stdout.write(
                 self.style.WARNING(f'Failed to index {failed_count} products')
             )
-        
-        self.stdout.write(self.style.SUCCESS('Indexing complete!'))
 
+        self.stdout.write(self.style.SUCCESS('Indexing complete!'))
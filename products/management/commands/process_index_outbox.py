@@ -0,0 +1,84 @@
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.services.search_indexing import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_RETENTION,
+    ProductIndexOutboxService,
+)
+
+# --loop 실행에서 처리된 행 정리는 이 간격(초)마다 한 번만 한다
+PURGE_INTERVAL = 60 * 60
+
+
+class Command(BaseCommand):
+    help = 'Drain the product index outbox into Elasticsearch'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=OUTBOX_BATCH_SIZE,
+            help='Number of outbox entries processed per bulk request',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the outbox instead of exiting once it is empty',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to sleep between polls when the outbox is empty (with --loop)',
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=float,
+            default=OUTBOX_RETENTION.days,
+            help='Delete processed outbox entries older than this many days (replay --since cannot go further back)',
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Only print outbox lag metrics',
+        )
+
+    def _write_lag(self) -> None:
+        lag = ProductIndexOutboxService.get_lag()
+        self.stdout.write(f"Pending: {lag['pending_count']}, lag: {lag['lag_seconds']:.1f}s")
+
+    def _purge(self, options: Any) -> None:
+        purged_count = ProductIndexOutboxService.purge_processed(
+            timedelta(days=options['retention_days']), options['batch_size']
+        )
+        if purged_count:
+            self.stdout.write(f'Purged {purged_count} processed outbox entries')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['stats']:
+            self._write_lag()
+            return
+
+        last_purged_at: float | None = None
+        while True:
+            indexed_count, deleted_count = ProductIndexOutboxService.process_batch(options['batch_size'])
+            if indexed_count or deleted_count:
+                self.stdout.write(
+                    self.style.SUCCESS(f'Indexed {indexed_count} products, deleted {deleted_count} products')
+                )
+                self._write_lag()
+                continue
+
+            if last_purged_at is None or time.monotonic() - last_purged_at >= PURGE_INTERVAL:
+                self._purge(options)
+                last_purged_at = time.monotonic()
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Outbox drained!'))
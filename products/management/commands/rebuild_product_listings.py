@@ -0,0 +1,42 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from products.models import Product, ProductListing
+from products.services.product_listing_sync import ProductListingSyncService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized product_listings read model from products'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of products rebuilt per transaction',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        chunk_size = options['chunk_size']
+
+        last_product_id = 0
+        rebuilt_count = 0
+        while True:
+            product_ids = list(
+                Product.objects.filter(id__gt=last_product_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not product_ids:
+                break
+            last_product_id = product_ids[-1]
+
+            with transaction.atomic():
+                rebuilt_count += ProductListingSyncService.refresh(product_ids)
+
+        # 시그널 없이 지워진 상품(raw SQL, 일괄 삭제 등)의 행도 정리한다
+        deleted_count, _ = ProductListing.objects.exclude(id__in=Product.objects.values('id')).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {rebuilt_count} product listings ({deleted_count} stale rows removed)')
+        )
@@ -0,0 +1,47 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from products.services.search_indexing import ProductIndexOutboxService
+
+
+class Command(BaseCommand):
+    help = 'Re-queue products in the index outbox so the worker indexes them again'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--since',
+            help='Replay outbox entries created at or after this ISO datetime',
+        )
+        parser.add_argument(
+            '--product-ids',
+            nargs='+',
+            type=int,
+            help='Queue the given product IDs',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Queue every product',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        since = None
+        if options['since']:
+            since = parse_datetime(options['since'])
+            if since is None:
+                raise CommandError(f"Invalid datetime: {options['since']}")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        if not (since or options['product_ids'] or options['all']):
+            raise CommandError('Specify --since, --product-ids or --all')
+
+        replayed_count = ProductIndexOutboxService.replay(
+            since=since,
+            product_ids=options['product_ids'],
+            all_products=options['all'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Queued {replayed_count} outbox entries for re-indexing'))
@@ -0,0 +1,32 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.utils.elasticsearch.elastic_search import (
+    reload_search_analyzers,
+    sync_synonym_sets,
+)
+
+
+class Command(BaseCommand):
+    help = 'Push es_data synonym files to Elasticsearch synonym sets and reload search analyzers without reindexing'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--reload-only',
+            action='store_true',
+            help='Skip updating the synonym sets and only reload search analyzers on the product index',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['reload_only']:
+            result = reload_search_analyzers()
+            reloaded = [detail['index'] for detail in result.get('reload_details', [])]
+            self.stdout.write(self.style.SUCCESS(f'Reloaded search analyzers on {", ".join(reloaded) or "no indices"}'))
+            return
+
+        for set_id, result in sync_synonym_sets().items():
+            reload_details = result.get('reload_analyzers_details', {}).get('reload_details', [])
+            reloaded = [detail['index'] for detail in reload_details]
+            self.stdout.write(f'Updated {set_id} ({result.get("result")}), reloaded {", ".join(reloaded) or "no indices"}')
+        self.stdout.write(self.style.SUCCESS('Synonym sets updated'))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_alter_category_parent'),
+        ('products', '0009_size_product_sizes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['is_live', 'is_sold', '-created_at', '-id'], name='products_live_page_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_product_live_page_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductIndexOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product_id', models.BigIntegerField()),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'product_index_outbox',
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['id'], name='product_outbox_pending_idx'), models.Index(fields=['created_at'], name='product_outbox_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.6 on 2026-10-16 23:40
+
+from typing import Any
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_trigram_index(apps: Any, schema_editor: Any) -> None:
+    # pg_trgm 확장이 설치되지 않은 서버에서는 trigram 인덱스 없이 전문 검색만 사용한다
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS products_name_trgm_idx ON products USING gin (name gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps: Any, schema_editor: Any) -> None:
+    schema_editor.execute("DROP INDEX IF EXISTS products_name_trgm_idx")
+
+
+BACKFILL_SEARCH_VECTOR_SQL = """
+UPDATE products SET search_vector =
+    setweight(to_tsvector('simple', COALESCE(name, '')), 'B')
+    || setweight(to_tsvector('simple', COALESCE(description, '')), 'C')
+    || setweight(to_tsvector('simple', COALESCE((
+        SELECT string_agg(categories.name, ' ')
+        FROM product_category_cdt
+        JOIN categories ON categories.id = product_category_cdt.category_id
+        WHERE product_category_cdt.product_id = products.id
+    ), '')), 'A')
+    || setweight(to_tsvector('simple', COALESCE((
+        SELECT string_agg(products_color.name, ' ')
+        FROM product_color_cdt
+        JOIN products_color ON products_color.id = product_color_cdt.color_id
+        WHERE product_color_cdt.product_id = products.id
+    ), '')), 'B')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_productindexoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='products_search_vector_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='product',
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        fields=['name'], name='products_name_trgm_idx', opclasses=['gin_trgm_ops']
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_trigram_index, drop_trigram_index),
+            ],
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_VECTOR_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-17 00:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_product_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchQueryLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(max_length=100)),
+                ('result_count', models.IntegerField()),
+                ('latency_ms', models.FloatField()),
+                ('backend', models.CharField(max_length=20)),
+                ('is_fallback', models.BooleanField(default=False)),
+                ('searched_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'product_search_query_logs',
+                'indexes': [models.Index(fields=['searched_at'], name='search_log_searched_idx')],
+            },
+        ),
+    ]
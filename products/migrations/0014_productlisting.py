@@ -0,0 +1,94 @@
+# Generated by Django 5.2.6 on 2026-10-17 01:12
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+# 배포 직후 목록이 비지 않도록 기존 상품으로 채운다 (이후에는 rebuild_product_listings 로 다시 만들 수 있다)
+BACKFILL_PRODUCT_LISTINGS_SQL = """
+INSERT INTO product_listings (
+    id, name, slug, price, sale_price, effective_price, discount_rate, image_url, hover_image_url,
+    color_codes, color_names, category_ids, is_live, is_sold, created_at, updated_at
+)
+SELECT
+    products.id,
+    products.name,
+    COALESCE(products.slug, ''),
+    products.price,
+    products.sale_price,
+    products.price - COALESCE(products.sale_price, 0),
+    CASE
+        WHEN products.price > 0 AND products.sale_price > 0
+        THEN ROUND(products.sale_price / products.price * 100)
+        ELSE 0
+    END,
+    COALESCE(%s || images.names[1], ''),
+    COALESCE(%s || COALESCE(images.names[2], images.names[1]), ''),
+    COALESCE(colors.codes, '{}'),
+    COALESCE(colors.names, '{}'),
+    COALESCE(categories.ids, '{}'),
+    products.is_live,
+    products.is_sold,
+    products.created_at,
+    NOW()
+FROM products
+LEFT JOIN LATERAL (
+    SELECT array_agg(products_image.image ORDER BY products_image.id) AS names
+    FROM product_image_cdt
+    JOIN products_image ON products_image.id = product_image_cdt.productimage_id
+    WHERE product_image_cdt.product_id = products.id
+) AS images ON TRUE
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(COALESCE(products_color.hex_code, '') ORDER BY products_color.id) AS codes,
+        array_agg(products_color.name ORDER BY products_color.id) AS names
+    FROM product_color_cdt
+    JOIN products_color ON products_color.id = product_color_cdt.color_id
+    WHERE product_color_cdt.product_id = products.id
+) AS colors ON TRUE
+LEFT JOIN LATERAL (
+    SELECT array_agg(product_category_cdt.category_id ORDER BY product_category_cdt.category_id) AS ids
+    FROM product_category_cdt
+    WHERE product_category_cdt.product_id = products.id
+) AS categories ON TRUE
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0013_searchquerylog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductListing',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.CharField(max_length=255)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('sale_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('effective_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('discount_rate', models.PositiveSmallIntegerField(default=0)),
+                ('image_url', models.CharField(blank=True, max_length=500)),
+                ('hover_image_url', models.CharField(blank=True, max_length=500)),
+                ('color_codes', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(blank=True, max_length=7), blank=True, default=list, size=None)),
+                ('color_names', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, size=None)),
+                ('category_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, size=None)),
+                ('is_live', models.BooleanField(default=False)),
+                ('is_sold', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'product_listings',
+                'indexes': [models.Index(condition=models.Q(('is_live', True), ('is_sold', False)), fields=['-created_at', '-id'], name='product_listing_live_page_idx'), django.contrib.postgres.indexes.GinIndex(fields=['category_ids'], name='product_listing_category_idx'), django.contrib.postgres.indexes.GinIndex(fields=['color_names'], name='product_listing_color_idx')],
+            },
+        ),
+        migrations.RunSQL(
+            [(BACKFILL_PRODUCT_LISTINGS_SQL, [settings.MEDIA_URL, settings.MEDIA_URL])],
+            migrations.RunSQL.noop,
+        ),
+    ]
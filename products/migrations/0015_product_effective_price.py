@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-17 01:26
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_alter_category_parent'),
+        ('products', '0014_productlisting'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='effective_price',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('price'), '-', django.db.models.functions.comparison.Coalesce('sale_price', models.Value(0), output_field=models.DecimalField())), output_field=models.DecimalField(decimal_places=2, max_digits=10)),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['effective_price'], name='products_effective_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(condition=models.Q(('is_live', True), ('is_sold', False)), fields=['effective_price', 'id'], name='product_listing_price_idx'),
+        ),
+    ]
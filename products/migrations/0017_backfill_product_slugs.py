@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-17 03:05
+
+from typing import Any
+
+from django.db import migrations
+from django.db.models import Q
+
+
+def backfill_product_slugs(apps: Any, schema_editor: Any) -> None:
+    # 0008 에서 slug 를 채우지 않고 추가했으므로, 목록 카드의 상세 링크가 깨지지 않도록
+    # Product.save 와 같은 방식(product_name_to_slug + 중복 시 -1, -2 ...)으로 채운다
+    from products.utils.url_slug import product_name_to_slug
+
+    Product = apps.get_model('products', 'Product')
+    ProductListing = apps.get_model('products', 'ProductListing')
+
+    used_slugs = set(Product.objects.exclude(Q(slug__isnull=True) | Q(slug='')).values_list('slug', flat=True))
+    for product_id, name in Product.objects.filter(Q(slug__isnull=True) | Q(slug='')).order_by('id').values_list(
+        'id', 'name'
+    ):
+        # 이름에 slug 로 쓸 문자가 없으면 빈 값 대신 상품 ID 를 쓴다
+        base_slug = product_name_to_slug(name) or str(product_id)
+        slug = base_slug
+        counter = 1
+        while slug in used_slugs:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        used_slugs.add(slug)
+
+        Product.objects.filter(id=product_id).update(slug=slug)
+        ProductListing.objects.filter(id=product_id).update(slug=slug)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0016_productindexoutbox_claim'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_product_slugs, migrations.RunPython.noop),
+    ]
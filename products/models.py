@@ -1,6 +1,11 @@
-from typing import Any
+from typing import Any, Iterable
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
 
 from categories.models import Category
 from config.basemodel import BaseModel
@@ -37,15 +42,29 @@ class Product(BaseModel):
     image = models.ManyToManyField(ProductImage, blank=True, db_table='product_image_cdt')
     price = models.DecimalField(max_digits=10, decimal_places=2)
     sale_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    # 실제 판매가 (sale_price 는 할인 금액). DB 가 계산해 저장하므로 가격 정렬/범위 조회에 인덱스를 쓸 수 있다
+    effective_price = models.GeneratedField(
+        expression=F('price') - Coalesce('sale_price', Value(0), output_field=models.DecimalField()),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+    )
     stock = models.IntegerField()
     is_live = models.BooleanField(default=False)
     is_sold = models.BooleanField(default=False)
     categories = models.ManyToManyField(Category, blank=True, db_table='product_category_cdt')
     colors = models.ManyToManyField(Color, blank=True, db_table='product_color_cdt')
     sizes = models.ManyToManyField(Size, blank=True, db_table='product_size_cdt')
+    # Elasticsearch 장애 시 DB 검색용 (products.signals 에서 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         db_table = 'products'
+        indexes = [
+            models.Index(fields=['is_live', 'is_sold', '-created_at', '-id'], name='products_live_page_idx'),
+            models.Index(fields=['effective_price'], name='products_effective_price_idx'),
+            GinIndex(fields=['search_vector'], name='products_search_vector_idx'),
+            GinIndex(fields=['name'], name='products_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
     
     def save(self, *args: Any, **kwargs: Any) -> None:
         from products.utils.url_slug import product_name_to_slug
@@ -67,11 +86,93 @@ class Product(BaseModel):
                 slug = f"{base_slug}-{counter}"
                 counter += 1
             self.slug = slug
+        adding = self._state.adding
         super().save(*args, **kwargs)
+        if not adding:
+            # UPDATE 는 생성 컬럼 값을 돌려받지 않으므로 다음 접근 때 DB 에서 다시 읽게 한다
+            self.__dict__.pop('effective_price', None)
+
+
+class ProductIndexOutbox(BaseModel):
+    # 상품이 삭제된 뒤에도 색인 삭제를 처리할 수 있도록 FK 대신 ID 만 보관한다
+    product_id = models.BigIntegerField()
+    processed_at = models.DateTimeField(null=True, blank=True)
+    # 워커가 가져간 시각. 처리 중 워커가 죽거나 색인에 실패한 행은 이 시각이 오래되면 다시 가져간다
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'product_index_outbox'
+        indexes = [
+            models.Index(
+                fields=['id'],
+                condition=models.Q(processed_at__isnull=True),
+                name='product_outbox_pending_idx',
+            ),
+            models.Index(fields=['created_at'], name='product_outbox_created_idx'),
+        ]
+
+    @classmethod
+    def enqueue(cls, product_ids: Iterable[int]) -> None:
+        ProductIndexOutbox.objects.bulk_create([ProductIndexOutbox(product_id=product_id) for product_id in set(product_ids)])
+
+
+class ProductListing(models.Model):
+    # 목록 카드에 필요한 값만 모아 둔 읽기 모델 (products.signals 와 rebuild_product_listings 로 갱신)
+    # 상품 삭제도 시그널로 함께 처리하므로 FK 대신 상품 ID 를 그대로 기본 키로 쓴다
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=100)
+    slug = models.CharField(max_length=255)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    sale_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    effective_price = models.DecimalField(max_digits=10, decimal_places=2)
+    discount_rate = models.PositiveSmallIntegerField(default=0)
+    image_url = models.CharField(max_length=500, blank=True)
+    hover_image_url = models.CharField(max_length=500, blank=True)
+    color_codes = ArrayField(models.CharField(max_length=7, blank=True), default=list, blank=True)
+    color_names = ArrayField(models.CharField(max_length=50), default=list, blank=True)
+    category_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)
+    is_live = models.BooleanField(default=False)
+    is_sold = models.BooleanField(default=False)
+    # 상품 등록 시각 (목록 정렬 기준). updated_at 은 이 행을 다시 만든 시각이라 카드 캐시 키로 쓴다
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'product_listings'
+        indexes = [
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(is_live=True, is_sold=False),
+                name='product_listing_live_page_idx',
+            ),
+            models.Index(
+                fields=['effective_price', 'id'],
+                condition=models.Q(is_live=True, is_sold=False),
+                name='product_listing_price_idx',
+            ),
+            GinIndex(fields=['category_ids'], name='product_listing_category_idx'),
+            GinIndex(fields=['color_names'], name='product_listing_color_idx'),
+        ]
 
 
 class WishList(BaseModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     class Meta:
-        db_table = 'wish_list'
\ No newline at end of file
+        db_table = 'wish_list'
+
+class SearchQueryLog(models.Model):
+    query = models.CharField(max_length=100)
+    result_count = models.IntegerField()
+    latency_ms = models.FloatField()
+    backend = models.CharField(max_length=20)  # elasticsearch, cache, database
+    is_fallback = models.BooleanField(default=False)
+    # 버퍼에서 모아 나중에 저장하므로 저장 시각(auto_now_add) 대신 검색 시각을 따로 기록한다
+    searched_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'product_search_query_logs'
+        indexes = [
+            models.Index(fields=['searched_at'], name='search_log_searched_idx'),
+        ]
@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, List
+
+from django.template.loader import render_to_string
+
+from config.utils.cache_helper import CacheHelper
+from products.models import ProductListing
+
+PRODUCT_CARD_CACHE_KEY_PREFIX = 'product:card'
+PRODUCT_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+PRODUCT_CARD_TEMPLATE = 'products/customers/product_card.html'
+
+
+class ProductCardCacheService:
+    @staticmethod
+    def get_card_keys(products: List[ProductListing]) -> List[str]:
+        # 읽기 모델 행은 색상·이미지가 바뀔 때도 다시 만들어지므로 updated_at 만으로 카드가 구분된다
+        return [
+            f'{PRODUCT_CARD_CACHE_KEY_PREFIX}:{product.id}:{product.updated_at.timestamp():.6f}'
+            for product in products
+        ]
+
+    @staticmethod
+    def render_card(product: ProductListing) -> str:
+        return render_to_string(PRODUCT_CARD_TEMPLATE, {'product': product})
+
+    @staticmethod
+    def render_cards(products: Iterable[ProductListing]) -> str:
+        products = list(products)
+        if not products:
+            return ''
+
+        keys = ProductCardCacheService.get_card_keys(products)
+        cached_cards = CacheHelper.get_many(keys)
+        missing_cards: Dict[str, str] = {}
+        cards = []
+        for key, product in zip(keys, products):
+            card = cached_cards.get(key)
+            if card is None:
+                card = missing_cards.get(key) or ProductCardCacheService.render_card(product)
+                missing_cards[key] = card
+            cards.append(card)
+
+        CacheHelper.set_many(missing_cards, PRODUCT_CARD_CACHE_TIMEOUT)
+        return ''.join(cards)
@@ -0,0 +1,222 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import Case, IntegerField, QuerySet, Value, When
+from django.http import QueryDict
+
+from categories.models import Category
+from config.utils.cursor_pagination import CursorPagination
+from products.models import Product, ProductListing
+from products.services.search_analytics import SearchAnalyticsService
+from products.services.search_cache import SearchResultCacheService
+from products.utils.elasticsearch.elastic_search import (
+    DEFAULT_SEARCH_SORT,
+    SEARCH_SORT_OPTIONS,
+    build_facet_filters,
+    search_products_page,
+)
+from products.utils.postgres_search import search_page
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_PAGE_SIZE = 24
+DEFAULT_BROWSE_SORT = 'newest'
+# 정렬 값 -> 내림차순 여부 (products.effective_price 를 그대로 옮긴 읽기 모델 컬럼과 그 인덱스를 쓴다)
+PRICE_SORT_OPTIONS = {'price_low': False, 'price_high': True}
+# ES search_after 커서와 DB keyset 커서를 구분하기 위한 접두어 (base64url 문자에는 '.' 이 없다)
+SEARCH_CURSOR_PREFIX = 'es.'
+
+
+class ProductListingService:
+    @staticmethod
+    def get_live_listings() -> QuerySet[ProductListing]:
+        # 카드에 필요한 값이 한 행에 모여 있어 관계 조회(prefetch) 없이 목록을 만든다
+        return ProductListing.objects.filter(is_live=True, is_sold=False)
+
+    @staticmethod
+    def get_product_page(
+        listings: QuerySet[ProductListing],
+        cursor: Optional[str] = None,
+        page_size: int = PRODUCT_PAGE_SIZE,
+        sort: str = DEFAULT_BROWSE_SORT,
+    ) -> Tuple[List[ProductListing], Optional[str]]:
+        if sort in PRICE_SORT_OPTIONS:
+            return CursorPagination.paginate_by_field(
+                listings, 'effective_price', cursor, page_size, descending=PRICE_SORT_OPTIONS[sort]
+            )
+        return CursorPagination.paginate(listings, cursor, page_size)
+
+    @staticmethod
+    def get_products_in_order(product_ids: List[int]) -> List[ProductListing]:
+        if not product_ids:
+            return []
+
+        # ES 가 정한 순서를 한 번의 쿼리로 유지한다 (색인이 늦어 판매 종료된 상품은 제외)
+        ordering = Case(
+            *[When(id=product_id, then=Value(position)) for position, product_id in enumerate(product_ids)],
+            output_field=IntegerField(),
+        )
+        return list(ProductListingService.get_live_listings().filter(id__in=product_ids).order_by(ordering))
+
+    @staticmethod
+    def encode_search_cursor(search_after: List[Any]) -> str:
+        return SEARCH_CURSOR_PREFIX + CursorPagination.encode_values(search_after)
+
+    @staticmethod
+    def decode_search_cursor(cursor: Optional[str]) -> Optional[List[Any]]:
+        if not cursor or not cursor.startswith(SEARCH_CURSOR_PREFIX):
+            return None
+        return CursorPagination.decode_values(cursor[len(SEARCH_CURSOR_PREFIX):])
+
+    @staticmethod
+    def parse_price_range(price_range: str) -> Tuple[Optional[int], Optional[int]]:
+        # "10000-20000", "10000-", "-20000" 형식 (잘못된 값은 무시)
+        price_min, _, price_max = price_range.partition('-')
+        try:
+            return (int(price_min) if price_min else None), (int(price_max) if price_max else None)
+        except ValueError:
+            return None, None
+
+    @staticmethod
+    def search_product_page(
+        search_query: str,
+        filters: List[Dict[str, Any]],
+        sort: str = DEFAULT_SEARCH_SORT,
+        cursor: Optional[str] = None,
+        page_size: int = PRODUCT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        search_query = SearchResultCacheService.normalize_query(search_query)
+        search_after = ProductListingService.decode_search_cursor(cursor)
+        with_facets = search_after is None
+
+        # 같은 검색어/필터/정렬/페이지의 ES 결과(ID 목록과 패싯)를 캐시하고, 상품 정보는 매번 DB 에서 읽는다
+        cache_key = SearchResultCacheService.make_key(search_query, sort, search_after, page_size, filters, with_facets)
+        hit_count = SearchResultCacheService.record_hit(search_query)
+        result = SearchResultCacheService.get(cache_key)
+        search_backend = 'cache' if result is not None else 'elasticsearch'
+        if result is None:
+            result = search_products_page(
+                search_query,
+                sort=sort,
+                search_after=search_after,
+                size=page_size,
+                filters=filters,
+                with_facets=with_facets,
+            )
+            SearchResultCacheService.set(cache_key, result, hit_count)
+
+        return {
+            'products': ProductListingService.get_products_in_order(result['ids']),
+            'next_cursor': (
+                ProductListingService.encode_search_cursor(result['search_after']) if result['search_after'] else None
+            ),
+            'total_count': result['total'],
+            'facets': result['facets'],
+            'search_backend': search_backend,
+        }
+
+    @staticmethod
+    def record_search(listing: Dict[str, Any], search_query: str, started_at: float, is_fallback: bool) -> None:
+        SearchAnalyticsService.record(
+            SearchResultCacheService.normalize_query(search_query),
+            listing['total_count'] or 0,
+            (time.perf_counter() - started_at) * 1000,
+            'database' if is_fallback else listing['search_backend'],
+            is_fallback,
+        )
+
+    @staticmethod
+    def get_listing_page(params: QueryDict, page_size: int = PRODUCT_PAGE_SIZE) -> Dict[str, Any]:
+        search_query = params.get('search', '')
+        category_name = params.get('category', '')
+        # 검색어가 없으면 관련도가 의미 없으므로 최신순을 기본으로 한다
+        sort = params.get('sort') or (DEFAULT_SEARCH_SORT if search_query else DEFAULT_BROWSE_SORT)
+        cursor = params.get('cursor')
+        # 같은 조건이 같은 캐시 키를 쓰도록 색상 순서를 고정한다
+        colors = sorted({color for color in params.getlist('color') if color})
+        price_min, price_max = ProductListingService.parse_price_range(params.get('price_range', ''))
+        has_facet_filters = bool(colors) or price_min is not None or price_max is not None
+
+        listing: Dict[str, Any] = {
+            'products': [],
+            'next_cursor': None,
+            'total_count': 0 if search_query or has_facet_filters else None,
+            'category': None,
+            'facets': None,
+        }
+
+        if category_name:
+            listing['category'] = Category.objects.filter(name=category_name).first()
+            if not listing['category']:
+                return listing
+
+        # 검색 분석에는 스크롤로 이어지는 페이지를 빼고 첫 페이지 검색만 기록한다
+        should_record = bool(search_query) and not cursor
+        started_at = time.perf_counter()
+
+        # 커서는 만든 쪽에서만 이어 간다. ES 장애 중 DB 로 만든 커서는 ES 가 복구돼도 DB 로 계속 읽는다
+        is_search_cursor = ProductListingService.decode_search_cursor(cursor) is not None
+
+        # 검색어나 패싯 필터가 있으면 ES 한 번의 요청으로 결과와 패싯 집계를 함께 가져온다
+        if (search_query or has_facet_filters) and (not cursor or is_search_cursor):
+            filters = build_facet_filters(category_name or None, colors, price_min, price_max)
+            try:
+                listing.update(ProductListingService.search_product_page(
+                    search_query,
+                    filters,
+                    sort if sort in SEARCH_SORT_OPTIONS else DEFAULT_SEARCH_SORT,
+                    cursor,
+                    page_size,
+                ))
+                if should_record:
+                    ProductListingService.record_search(listing, search_query, started_at, is_fallback=False)
+                return listing
+            except Exception as e:
+                logger.warning(f"Elasticsearch 검색 실패, DB 검색으로 대체합니다: {e}")
+                if is_search_cursor:
+                    # ES 정렬 값으로 만든 커서는 DB 순서로 이어 갈 수 없으므로 중복 대신 목록을 여기서 끝낸다
+                    return listing
+
+        listings = ProductListingService.get_live_listings()
+        if listing['category']:
+            listings = listings.filter(category_ids__contains=[listing['category'].id])
+        if colors:
+            listings = listings.filter(color_names__overlap=colors)
+        if price_min is not None:
+            listings = listings.filter(effective_price__gte=price_min)
+        if price_max is not None:
+            listings = listings.filter(effective_price__lt=price_max)
+
+        matched: QuerySet[Any] = listings
+        # ES 장애 시에도 순차 스캔 대신 GIN 인덱스를 타는 전문 검색으로 결과를 유지한다
+        searchable = Product.objects.filter(id__in=listings.values('id'))
+        if search_query and sort not in (*PRICE_SORT_OPTIONS, DEFAULT_BROWSE_SORT):
+            # 관련도순: 검색 점수는 products.search_vector 에 있으므로 순서만 정하고 카드 값은 읽기 모델에서 가져온다
+            matched, page, listing['next_cursor'] = search_page(
+                searchable,
+                search_query,
+                lambda products: CursorPagination.paginate_by_field(
+                    products.only('id'), 'search_rank', cursor, page_size
+                ),
+            )
+            listing['products'] = ProductListingService.get_products_in_order([product.id for product in page])
+        elif search_query:
+            # 최신순/가격순은 검색 결과로 좁힌 읽기 모델을 ES 와 같은 정렬로 페이지네이션한다
+            matched, listing['products'], listing['next_cursor'] = search_page(
+                searchable,
+                search_query,
+                lambda products: ProductListingService.get_product_page(
+                    listings.filter(id__in=products.values('id')), cursor, page_size, sort
+                ),
+            )
+        else:
+            listing['products'], listing['next_cursor'] = ProductListingService.get_product_page(
+                listings, cursor, page_size, sort
+            )
+        if listing['total_count'] is not None:
+            # 검색 결과 수는 검색/필터 시에만 필요하므로 그때만 COUNT 쿼리를 실행한다
+            listing['total_count'] = matched.count()
+        if should_record:
+            ProductListingService.record_search(listing, search_query, started_at, is_fallback=True)
+        return listing
@@ -0,0 +1,61 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable, List
+
+from products.models import Product, ProductListing
+from products.utils.url_slug import product_name_to_slug
+
+LISTING_SYNC_FIELDS = [
+    'name', 'slug', 'price', 'sale_price', 'effective_price', 'discount_rate', 'image_url', 'hover_image_url',
+    'color_codes', 'color_names', 'category_ids', 'is_live', 'is_sold', 'created_at', 'updated_at',
+]
+
+
+class ProductListingSyncService:
+    @staticmethod
+    def build_listing(product: Product) -> ProductListing:
+        # prefetch 결과를 쓰도록 정렬은 파이썬에서 한다 (image.first() 는 매번 쿼리를 보낸다)
+        images = sorted(product.image.all(), key=lambda image: image.pk)
+        colors = sorted(product.colors.all(), key=lambda color: color.pk)
+        sale_price = product.sale_price or Decimal('0')
+        discount_rate = 0
+        if product.price > 0 and sale_price > 0:
+            discount_rate = int((sale_price / product.price * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+        return ProductListing(
+            id=product.id,
+            name=product.name,
+            slug=product.slug or product_name_to_slug(product.name),
+            price=product.price,
+            sale_price=product.sale_price,
+            effective_price=product.effective_price,
+            discount_rate=discount_rate,
+            image_url=images[0].image.url if images else '',
+            hover_image_url=images[min(1, len(images) - 1)].image.url if images else '',
+            color_codes=[color.hex_code or '' for color in colors],
+            color_names=[color.name for color in colors],
+            category_ids=sorted(category.pk for category in product.categories.all()),
+            is_live=product.is_live,
+            is_sold=product.is_sold,
+            created_at=product.created_at,
+        )
+
+    @staticmethod
+    def refresh(product_ids: Iterable[int]) -> int:
+        product_ids = list(set(product_ids))
+        if not product_ids:
+            return 0
+
+        products = Product.objects.filter(id__in=product_ids).prefetch_related('image', 'colors', 'categories')
+        listings: List[ProductListing] = [ProductListingSyncService.build_listing(product) for product in products]
+        ProductListing.objects.bulk_create(
+            listings, update_conflicts=True, unique_fields=['id'], update_fields=LISTING_SYNC_FIELDS
+        )
+        # 그사이 삭제된 상품의 행은 지운다
+        ProductListing.objects.filter(id__in=product_ids).exclude(
+            id__in=[listing.id for listing in listings]
+        ).delete()
+        return len(listings)
+
+    @staticmethod
+    def delete(product_ids: Iterable[int]) -> None:
+        ProductListing.objects.filter(id__in=list(product_ids)).delete()
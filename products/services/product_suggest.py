@@ -0,0 +1,54 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from config.utils.cache_helper import CacheHelper
+from products.models import Product
+from products.utils.elasticsearch.elastic_search import suggest_products
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_SIZE = 8
+SUGGEST_MAX_SIZE = 20
+SUGGEST_MAX_PREFIX_LENGTH = 50
+SUGGEST_CACHE_TIMEOUT = 60
+
+
+class ProductSuggestService:
+    @staticmethod
+    def normalize_prefix(prefix: str) -> str:
+        # 대소문자/공백만 다른 입력이 같은 캐시 키를 쓰도록 정규화한다
+        return ' '.join(prefix.split()).lower()[:SUGGEST_MAX_PREFIX_LENGTH]
+
+    @staticmethod
+    def _cache_key(prefix: str, size: int) -> str:
+        return f'products:suggest:{size}:{prefix}'
+
+    @staticmethod
+    def get_db_suggestions(prefix: str, size: int) -> Dict[str, List[Any]]:
+        products = Product.objects.filter(
+            is_live=True, is_sold=False, name__istartswith=prefix
+        ).order_by('name').values('id', 'name')[:size]
+        return {'products': list(products), 'categories': []}
+
+    @staticmethod
+    def get_suggestions(prefix: str, size: int = SUGGEST_SIZE) -> Dict[str, List[Any]]:
+        prefix = ProductSuggestService.normalize_prefix(prefix)
+        size = max(1, min(size, SUGGEST_MAX_SIZE))
+        if not prefix:
+            return {'products': [], 'categories': []}
+
+        cache_key = ProductSuggestService._cache_key(prefix, size)
+        cached: Optional[Dict[str, List[Any]]] = CacheHelper.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            suggestions = suggest_products(prefix, size)
+        except Exception as e:
+            # ES 장애 시에는 상품명 접두어 검색으로 대체하고, 복구되면 바로 반영되도록 캐시하지 않는다
+            logger.warning(f"Elasticsearch 자동완성 실패, DB 검색으로 대체합니다: {e}")
+            return ProductSuggestService.get_db_suggestions(prefix, size)
+
+        # 자주 입력되는 접두어는 짧게 캐시해 타이핑마다 ES 를 호출하지 않게 한다
+        CacheHelper.set(cache_key, suggestions, timeout=SUGGEST_CACHE_TIMEOUT)
+        return suggestions
@@ -0,0 +1,165 @@
+import atexit
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache as django_cache
+from django.db.models import Aggregate, Avg, Count, FloatField, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from config.utils.cache_helper import CacheHelper
+from products.models import SearchQueryLog
+
+logger = logging.getLogger(__name__)
+
+SEARCH_LOG_QUEUE_KEY = 'products:search:logs'
+SEARCH_LOG_PERSIST_LOCK_KEY = 'products:search:logs:persist_lock'
+# 한 배치 저장에 걸리는 시간보다 넉넉하게 잡는다 (워커가 죽으면 이 시간 뒤에 다른 워커가 이어 받는다)
+SEARCH_LOG_PERSIST_LOCK_TIMEOUT = 60 * 5
+SEARCH_LOG_BUFFER_SIZE = 50
+SEARCH_LOG_FLUSH_INTERVAL = 5.0
+SEARCH_LOG_BATCH_SIZE = 1000
+SEARCH_REPORT_DAYS = 14
+SEARCH_REPORT_TOP_SIZE = 20
+
+# 요청 처리 중에는 메모리에만 쌓고, 일정 개수/시간마다 Redis 리스트로 한 번에 보낸다
+_buffer: List[str] = []
+_buffer_lock = threading.Lock()
+_last_flushed_at = time.monotonic()
+
+
+class PercentileCont(Aggregate):
+    function = 'PERCENTILE_CONT'
+    template = '%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression: Any, percentile: float, **extra: Any) -> None:
+        super().__init__(expression, percentile=percentile, **extra)
+
+
+class SearchAnalyticsService:
+    @staticmethod
+    def _queue_key() -> str:
+        return django_cache.make_key(SEARCH_LOG_QUEUE_KEY)
+
+    @staticmethod
+    def record(query: str, result_count: int, latency_ms: float, backend: str, is_fallback: bool = False) -> None:
+        global _last_flushed_at
+
+        entry = json.dumps({
+            'query': query[:100],
+            'result_count': result_count,
+            'latency_ms': round(latency_ms, 2),
+            'backend': backend,
+            'is_fallback': is_fallback,
+            'searched_at': timezone.now().isoformat(),
+        }, ensure_ascii=False)
+
+        with _buffer_lock:
+            _buffer.append(entry)
+            should_flush = (
+                len(_buffer) >= SEARCH_LOG_BUFFER_SIZE
+                or time.monotonic() - _last_flushed_at >= SEARCH_LOG_FLUSH_INTERVAL
+            )
+        if should_flush:
+            SearchAnalyticsService.flush_buffer()
+
+    @staticmethod
+    def flush_buffer() -> int:
+        global _last_flushed_at
+
+        with _buffer_lock:
+            entries = _buffer[:]
+            _buffer.clear()
+            _last_flushed_at = time.monotonic()
+        if not entries:
+            return 0
+
+        try:
+            get_redis_connection("default").rpush(SearchAnalyticsService._queue_key(), *entries)
+        except Exception as e:
+            # 분석용 기록 때문에 검색 요청이 실패하면 안 되므로 버린다
+            logger.warning(f"[SearchAnalytics] 검색 로그 {len(entries)}건 전송 실패: {e}")
+            return 0
+        return len(entries)
+
+    @staticmethod
+    def parse_entry(entry: bytes) -> Optional[SearchQueryLog]:
+        try:
+            data = json.loads(entry)
+            data['searched_at'] = datetime.fromisoformat(data['searched_at'])
+            return SearchQueryLog(**data)
+        except (TypeError, ValueError, KeyError) as e:
+            logger.warning(f"[SearchAnalytics] 잘못된 검색 로그를 건너뜁니다: {entry!r} ({e})")
+            return None
+
+    @staticmethod
+    def persist(batch_size: int = SEARCH_LOG_BATCH_SIZE) -> int:
+        # 뒤에는 RPUSH 로만 추가되므로, 한 워커만 앞부분을 읽어 저장한 뒤에 그만큼 잘라낸다
+        # 저장이 실패하면 큐에 그대로 남아 다음 실행에서 다시 처리한다
+        if not CacheHelper.add(SEARCH_LOG_PERSIST_LOCK_KEY, 1, timeout=SEARCH_LOG_PERSIST_LOCK_TIMEOUT):
+            return 0
+        try:
+            redis_client = get_redis_connection("default")
+            queue_key = SearchAnalyticsService._queue_key()
+            entries = redis_client.lrange(queue_key, 0, batch_size - 1)
+            if not entries:
+                return 0
+
+            logs = [log for log in map(SearchAnalyticsService.parse_entry, entries) if log is not None]
+            SearchQueryLog.objects.bulk_create(logs)
+            redis_client.ltrim(queue_key, len(entries), -1)
+            return len(logs)
+        finally:
+            CacheHelper.delete(SEARCH_LOG_PERSIST_LOCK_KEY)
+
+    @staticmethod
+    def get_pending_count() -> int:
+        return int(get_redis_connection("default").llen(SearchAnalyticsService._queue_key()))
+
+    @staticmethod
+    def get_daily_stats(days: int = SEARCH_REPORT_DAYS) -> List[Dict[str, Any]]:
+        since = timezone.now() - timedelta(days=days)
+        return list(
+            SearchQueryLog.objects.filter(searched_at__gte=since)
+            .annotate(day=TruncDate('searched_at'))
+            .values('day')
+            .annotate(
+                search_count=Count('id'),
+                zero_result_count=Count('id', filter=Q(result_count=0)),
+                fallback_count=Count('id', filter=Q(is_fallback=True)),
+                avg_latency_ms=Avg('latency_ms'),
+                p50_latency_ms=PercentileCont('latency_ms', 0.5),
+                p95_latency_ms=PercentileCont('latency_ms', 0.95),
+            )
+            .order_by('-day')
+        )
+
+    @staticmethod
+    def get_top_queries(
+        day: date, zero_result_only: bool = False, limit: int = SEARCH_REPORT_TOP_SIZE
+    ) -> List[Dict[str, Any]]:
+        logs = SearchQueryLog.objects.filter(searched_at__date=day)
+        if zero_result_only:
+            logs = logs.filter(result_count=0)
+        return list(
+            logs.values('query')
+            .annotate(search_count=Count('id'), avg_result_count=Avg('result_count'))
+            .order_by('-search_count', 'query')[:limit]
+        )
+
+    @staticmethod
+    def parse_day(value: Optional[str]) -> date:
+        try:
+            return date.fromisoformat(value) if value else timezone.localdate()
+        except ValueError:
+            return timezone.localdate()
+
+
+# 워커가 종료될 때 아직 보내지 않은 로그를 Redis 로 넘긴다
+atexit.register(SearchAnalyticsService.flush_buffer)
@@ -0,0 +1,83 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from config.utils.cache_helper import CacheHelper
+from products.utils.elasticsearch.elastic_search import (
+    SEARCH_INDEX_WRITTEN_KEY,
+    get_search_generation,
+)
+
+SEARCH_POPULARITY_WINDOW = 60 * 60
+# (구간 내 최소 조회 수, TTL 초) - 자주 찾는 검색어일수록 오래 캐시한다
+SEARCH_CACHE_TTL_TIERS = [
+    (100, 60 * 30),
+    (20, 60 * 10),
+    (5, 60 * 3),
+    (0, 60),
+]
+# 상품 단위 색인 이후에도 이전 결과를 쓰는 최대 시간. 인기 검색어의 긴 TTL 이 쓰기마다 버려지지 않으면서도
+# 바뀐 상품이 검색 결과에 늦게 반영되는 시간을 이 값으로 제한한다
+SEARCH_CACHE_STALE_AFTER_WRITE = 60
+
+
+class SearchResultCacheService:
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return ' '.join(query.split()).lower()
+
+    @staticmethod
+    def _query_digest(value: Any) -> str:
+        raw = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    @staticmethod
+    def make_key(
+        query: str,
+        sort: str,
+        search_after: Optional[List[Any]],
+        size: int,
+        filters: List[Dict[str, Any]],
+        with_facets: bool,
+    ) -> str:
+        # 세대 번호가 키에 들어가므로 재색인 후에는 이전 결과가 다시 조회되지 않는다
+        digest = SearchResultCacheService._query_digest(
+            [query, sort, search_after, size, filters, with_facets]
+        )
+        return f'products:search:result:{get_search_generation()}:{digest}'
+
+    @staticmethod
+    def record_hit(query: str) -> int:
+        # 캐시 적중 여부와 관계없이 검색어별 조회 수를 세어 TTL 을 정한다
+        popularity_key = f'products:search:popularity:{SearchResultCacheService._query_digest(query)}'
+        return CacheHelper.incr(popularity_key, timeout=SEARCH_POPULARITY_WINDOW)
+
+    @staticmethod
+    def get_timeout(hit_count: int) -> int:
+        for min_hits, timeout in SEARCH_CACHE_TTL_TIERS:
+            if hit_count >= min_hits:
+                return timeout
+        return SEARCH_CACHE_TTL_TIERS[-1][1]
+
+    @staticmethod
+    def get(cache_key: str) -> Optional[Dict[str, Any]]:
+        values = CacheHelper.get_many([cache_key, SEARCH_INDEX_WRITTEN_KEY])
+        cached: Optional[Dict[str, Any]] = values.get(cache_key)
+        if cached is None or 'cached_at' not in cached:
+            return None
+
+        cached_at = cached['cached_at']
+        is_written_after = cached_at < values.get(SEARCH_INDEX_WRITTEN_KEY, 0)
+        if is_written_after and time.time() - cached_at > SEARCH_CACHE_STALE_AFTER_WRITE:
+            return None
+        result: Dict[str, Any] = cached['result']
+        return result
+
+    @staticmethod
+    def set(cache_key: str, result: Dict[str, Any], hit_count: int = 0) -> None:
+        CacheHelper.set(
+            cache_key,
+            {'result': result, 'cached_at': time.time()},
+            timeout=SearchResultCacheService.get_timeout(hit_count),
+        )
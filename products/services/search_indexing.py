@@ -0,0 +1,123 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from products.models import Product, ProductIndexOutbox
+from products.utils.elasticsearch.elastic_search import (
+    bulk_delete_products_from_index,
+    bulk_index_products,
+)
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 500
+# 가져간 뒤 이 시간 안에 처리되지 않은 행(워커 중단, 색인 실패)은 다른 실행이 다시 가져간다
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=5)
+# 처리된 행은 replay --since 로 다시 색인할 수 있도록 이 기간 동안만 남겨 둔다
+OUTBOX_RETENTION = timedelta(days=7)
+
+
+class ProductIndexOutboxService:
+    @staticmethod
+    def claim_batch(batch_size: int = OUTBOX_BATCH_SIZE) -> List[Tuple[int, int]]:
+        now = timezone.now()
+        with transaction.atomic():
+            # 여러 워커가 동시에 실행돼도 같은 행을 중복 처리하지 않도록 잠긴 행은 건너뛰고, 가져간 행에 표시를 남긴다
+            entries = list(
+                ProductIndexOutbox.objects.filter(processed_at__isnull=True)
+                .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - OUTBOX_CLAIM_TIMEOUT))
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', 'product_id')[:batch_size]
+            )
+            ProductIndexOutbox.objects.filter(id__in=[entry_id for entry_id, _ in entries]).update(claimed_at=now)
+        return entries
+
+    @staticmethod
+    def process_batch(batch_size: int = OUTBOX_BATCH_SIZE) -> Tuple[int, int]:
+        # ES 요청이 느려도 DB 잠금과 트랜잭션을 잡고 있지 않도록, 가져오기와 완료 표시만 짧은 트랜잭션으로 한다
+        entries = ProductIndexOutboxService.claim_batch(batch_size)
+        if not entries:
+            return 0, 0
+        entry_ids = [entry_id for entry_id, _ in entries]
+
+        try:
+            # 같은 상품의 변경이 여러 번 쌓여 있어도 현재 상태로 한 번만 색인한다
+            product_ids = {product_id for _, product_id in entries}
+            products = list(
+                Product.objects.filter(id__in=product_ids, is_live=True).prefetch_related('categories', 'colors')
+            )
+            deleted_ids = sorted(product_ids - {product.id for product in products})
+
+            indexed_count, failed_index_ids = bulk_index_products(products) if products else (0, [])
+            deleted_count, failed_delete_ids = bulk_delete_products_from_index(deleted_ids)
+        except Exception:
+            # ES 요청 자체가 실패하면 다음 실행에서 바로 다시 가져가도록 표시를 지운다
+            ProductIndexOutbox.objects.filter(id__in=entry_ids).update(claimed_at=None)
+            raise
+
+        # 문서 단위로 실패한 상품의 행은 처리하지 않고 남겨 두어 가져간 시각이 만료된 뒤 다시 시도한다
+        failed_ids = set(failed_index_ids) | set(failed_delete_ids)
+        failed_entry_ids = [entry_id for entry_id, product_id in entries if product_id in failed_ids]
+        with transaction.atomic():
+            ProductIndexOutbox.objects.filter(id__in=entry_ids).exclude(id__in=failed_entry_ids).update(
+                processed_at=timezone.now()
+            )
+            if failed_entry_ids:
+                ProductIndexOutbox.objects.filter(id__in=failed_entry_ids).update(attempts=F('attempts') + 1)
+        if failed_ids:
+            logger.warning(f"[ProductIndexOutbox] {len(failed_ids)}개 상품 색인 실패, 다시 시도합니다: {sorted(failed_ids)}")
+
+        return indexed_count, deleted_count
+
+    @staticmethod
+    def purge_processed(retention: timedelta = OUTBOX_RETENTION, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+        # product_outbox_created_idx 로 오래된 행만 훑고, 한 번에 많이 지워 테이블을 오래 잠그지 않도록 나눠 지운다
+        cutoff = timezone.now() - retention
+        purged = 0
+        while True:
+            batch_ids = ProductIndexOutbox.objects.filter(
+                created_at__lt=cutoff, processed_at__isnull=False
+            ).values('id')[:batch_size]
+            deleted, _ = ProductIndexOutbox.objects.filter(id__in=batch_ids).delete()
+            purged += deleted
+            if deleted < batch_size:
+                return purged
+
+    @staticmethod
+    def get_lag() -> Dict[str, Any]:
+        pending = ProductIndexOutbox.objects.filter(processed_at__isnull=True).aggregate(
+            pending_count=Count('id'),
+            oldest=Min('created_at'),
+        )
+        oldest: Optional[datetime] = pending['oldest']
+
+        return {
+            'pending_count': pending['pending_count'],
+            'lag_seconds': (timezone.now() - oldest).total_seconds() if oldest else 0.0,
+        }
+
+    @staticmethod
+    def replay(
+        since: Optional[datetime] = None,
+        product_ids: Optional[Iterable[int]] = None,
+        all_products: bool = False,
+    ) -> int:
+        if all_products:
+            product_ids = Product.objects.values_list('id', flat=True)
+
+        if product_ids is not None:
+            product_id_list = list(product_ids)
+            ProductIndexOutbox.enqueue(product_id_list)
+            return len(set(product_id_list))
+
+        if since is not None:
+            return ProductIndexOutbox.objects.filter(
+                created_at__gte=since, processed_at__isnull=False
+            ).update(processed_at=None, claimed_at=None)
+
+        return 0
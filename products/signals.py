@@ -0,0 +1,156 @@
+from typing import Any, Iterable, Set
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from categories.models import Category
+from orders.services.inventory_reservation_services import InventoryReservationService
+from products.models import Color, Product, ProductImage, ProductIndexOutbox, Size
+from products.services.product_listing_sync import ProductListingSyncService
+from products.utils.cache_tags import invalidate_products
+from products.utils.postgres_search import update_search_vectors
+
+# 상품 변경과 같은 트랜잭션에서 아웃박스에 기록하고, 실제 색인은 process_index_outbox 워커가 처리한다
+# DB 검색용 search_vector 는 ES 장애 중에도 최신이어야 하므로 같은 트랜잭션에서 바로 갱신한다
+
+
+def enqueue_and_update_search_vectors(product_ids: Iterable[int]) -> None:
+    product_ids = list(product_ids)
+    ProductIndexOutbox.enqueue(product_ids)
+    update_search_vectors(product_ids)
+
+
+@receiver(post_save, sender=Product)
+def enqueue_product_on_save(sender: Any, instance: Product, **kwargs: Any) -> None:
+    enqueue_and_update_search_vectors([instance.id])
+
+
+@receiver(post_delete, sender=Product)
+def enqueue_product_on_delete(sender: Any, instance: Product, **kwargs: Any) -> None:
+    ProductIndexOutbox.enqueue([instance.id])
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product_caches(sender: Any, instance: Product, **kwargs: Any) -> None:
+    invalidate_products([instance.id])
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_stock_counter(sender: Any, instance: Product, update_fields: Any = None, **kwargs: Any) -> None:
+    # 저장 중인 트랜잭션이 상품 행을 잠그고 있으므로, 다음 예약은 커밋된 재고로 가용 재고 카운터를 다시 채운다
+    if update_fields is None or 'stock' in update_fields:
+        InventoryReservationService.invalidate_stock(instance.id)
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver(m2m_changed, sender=Product.colors.through)
+@receiver(m2m_changed, sender=Product.sizes.through)
+@receiver(m2m_changed, sender=Product.image.through)
+def invalidate_product_caches_on_m2m_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Set[int] | None, **kwargs: Any
+) -> None:
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_products([instance.pk])
+    elif action in ('post_add', 'post_remove') and pk_set:
+        invalidate_products(pk_set)
+    elif action == 'pre_clear':
+        invalidate_products(instance.product_set.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Color)
+@receiver(post_save, sender=Size)
+@receiver(post_save, sender=ProductImage)
+def invalidate_related_product_caches(sender: Any, instance: Any, created: bool = False, **kwargs: Any) -> None:
+    if not created:
+        invalidate_products(instance.product_set.values_list('id', flat=True))
+
+
+@receiver(pre_delete, sender=Color)
+@receiver(pre_delete, sender=Size)
+@receiver(pre_delete, sender=ProductImage)
+def invalidate_related_product_caches_on_delete(sender: Any, instance: Any, **kwargs: Any) -> None:
+    # 연결 행은 삭제와 함께 사라지므로 삭제 전에 상품 ID 를 모아 둔다
+    invalidate_products(list(instance.product_set.values_list('id', flat=True)))
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver(m2m_changed, sender=Product.colors.through)
+def enqueue_product_on_m2m_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Set[int] | None, **kwargs: Any
+) -> None:
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            enqueue_and_update_search_vectors([instance.pk])
+    elif action in ('post_add', 'post_remove') and pk_set:
+        enqueue_and_update_search_vectors(pk_set)
+    elif action == 'pre_clear':
+        product_ids = list(instance.product_set.values_list('id', flat=True))
+        ProductIndexOutbox.enqueue(product_ids)
+        transaction.on_commit(lambda: update_search_vectors(product_ids))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Color)
+def enqueue_related_products(sender: Any, instance: Any, created: bool = False, **kwargs: Any) -> None:
+    # 색인 문서에 카테고리/색상 이름이 들어가므로 이름 변경 시 연결된 상품을 다시 색인한다
+    if not created:
+        enqueue_and_update_search_vectors(instance.product_set.values_list('id', flat=True))
+
+
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Color)
+def enqueue_related_products_on_delete(sender: Any, instance: Any, **kwargs: Any) -> None:
+    # 연결 행은 삭제와 함께 사라지므로 search_vector 는 커밋된 뒤에 다시 계산한다
+    product_ids = list(instance.product_set.values_list('id', flat=True))
+    ProductIndexOutbox.enqueue(product_ids)
+    transaction.on_commit(lambda: update_search_vectors(product_ids))
+
+
+# 목록 읽기 모델(product_listings)은 상품 변경과 같은 트랜잭션에서 갱신한다
+
+
+@receiver(post_save, sender=Product)
+def sync_listing_on_save(sender: Any, instance: Product, **kwargs: Any) -> None:
+    ProductListingSyncService.refresh([instance.id])
+
+
+@receiver(post_delete, sender=Product)
+def delete_listing_on_delete(sender: Any, instance: Product, **kwargs: Any) -> None:
+    ProductListingSyncService.delete([instance.id])
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver(m2m_changed, sender=Product.colors.through)
+@receiver(m2m_changed, sender=Product.image.through)
+def sync_listing_on_m2m_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Set[int] | None, **kwargs: Any
+) -> None:
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            ProductListingSyncService.refresh([instance.pk])
+    elif action in ('post_add', 'post_remove') and pk_set:
+        ProductListingSyncService.refresh(pk_set)
+    elif action == 'pre_clear':
+        product_ids = list(instance.product_set.values_list('id', flat=True))
+        transaction.on_commit(lambda: ProductListingSyncService.refresh(product_ids))
+
+
+@receiver(post_save, sender=Color)
+@receiver(post_save, sender=ProductImage)
+def sync_related_listings(sender: Any, instance: Any, created: bool = False, **kwargs: Any) -> None:
+    # 색상 코드/이름, 이미지 파일이 카드에 그대로 들어가므로 연결된 상품 행을 다시 만든다
+    if not created:
+        ProductListingSyncService.refresh(instance.product_set.values_list('id', flat=True))
+
+
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Color)
+@receiver(pre_delete, sender=ProductImage)
+def sync_related_listings_on_delete(sender: Any, instance: Any, **kwargs: Any) -> None:
+    # 연결 행은 삭제와 함께 사라지므로 커밋된 뒤에 다시 만든다
+    product_ids = list(instance.product_set.values_list('id', flat=True))
+    transaction.on_commit(lambda: ProductListingSyncService.refresh(product_ids))
@@ -0,0 +1,14 @@
+from typing import Iterable
+
+from django import template
+from django.utils.safestring import SafeString, mark_safe
+
+from products.models import ProductListing
+from products.services.product_card_cache import ProductCardCacheService
+
+register = template.Library()
+
+@register.simple_tag
+def render_product_cards(products: Iterable[ProductListing]) -> SafeString:
+    # 카드 HTML 은 자동 이스케이프된 템플릿으로 렌더링한 결과만 캐시에 들어간다
+    return mark_safe(ProductCardCacheService.render_cards(products))
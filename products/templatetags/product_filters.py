@@ -12,21 +12,6 @@ def product_slug(value: str) -> str:
         return ''
     return product_name_to_slug(value)
 
-@register.filter
-def discount_rate(price: Union[int, float], sale_price: Union[int, float]) -> int:
-    if not price or not sale_price or price <= 0:
-        return 0
-
-    discount = ((price - sale_price) / price) * 100
-    return round(discount)
-
-@register.filter
-def discount_amount(price: Union[int, float], sale_price: Union[int, float]) -> int:
-    if not price or price <= 0 or sale_price is None or sale_price < 0:
-        return 0
-
-    return int(price - sale_price)
-
 @register.filter
 def intcomma(value: Union[int, float, str]) -> str:
     if value is None:
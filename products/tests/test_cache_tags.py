@@ -0,0 +1,102 @@
+from typing import Any
+
+import pytest
+from django.urls import reverse
+
+from categories.models import Category
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product, ProductImage
+from products.utils.cache_tags import CATALOG_TAG, category_tag, product_tag
+
+
+@pytest.mark.django_db
+class TestCacheTags(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+
+    def create_product(self, name: str = '린넨 셔츠') -> Product:
+        return Product.objects.create(
+            user=self.admin_user, name=name, description='', price=10000, stock=1, is_live=True
+        )
+
+    def versions(self, *tags: str) -> list[int]:
+        return CacheHelper.get_tag_versions(tags)
+
+    def test_bumping_a_tag_changes_tagged_key(self) -> None:
+        key = CacheHelper.make_tagged_key('test:tagged', ['test:tag'])
+        CacheHelper.set(key, 'old', 60)
+
+        CacheHelper.bump_tags(['test:tag'])
+        new_key = CacheHelper.make_tagged_key('test:tagged', ['test:tag'])
+
+        assert new_key != key
+        assert CacheHelper.get(new_key) is None
+        CacheHelper.delete(key)
+
+    def test_product_save_bumps_tags_after_commit(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            product = self.create_product()
+        before = self.versions(product_tag(product.id), CATALOG_TAG)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            product.price = 9000
+            product.save()
+        assert self.versions(product_tag(product.id), CATALOG_TAG) == before
+
+        for callback in callbacks:
+            callback()
+        assert self.versions(product_tag(product.id), CATALOG_TAG) == [version + 1 for version in before]
+
+    def test_related_edits_bump_product_tags(self, django_capture_on_commit_callbacks: Any) -> None:
+        product = self.create_product()
+        color = Color.objects.create(name='화이트')
+        image = ProductImage.objects.create(image='products/images/test_image.jpg')
+        product.colors.add(color)
+        product.image.add(image)
+
+        def assert_bumped(before: int) -> None:
+            assert self.versions(product_tag(product.id))[0] > before
+
+        before = self.versions(product_tag(product.id))[0]
+        with django_capture_on_commit_callbacks(execute=True):
+            color.name = '아이보리'
+            color.save()
+        assert_bumped(before)
+
+        before = self.versions(product_tag(product.id))[0]
+        with django_capture_on_commit_callbacks(execute=True):
+            color.product_set.remove(product)
+        assert_bumped(before)
+
+        before = self.versions(product_tag(product.id))[0]
+        with django_capture_on_commit_callbacks(execute=True):
+            image.delete()
+        assert_bumped(before)
+
+    def test_category_change_bumps_category_tag(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            category = Category.objects.create(name='아우터')
+        tag = category_tag(category.id)
+        before = self.versions(tag)[0]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            category.delete()
+
+        assert self.versions(tag)[0] == before + 1
+
+    def test_new_products_update_without_waiting_for_ttl(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            first = self.create_product('첫 상품')
+        response = self.client.get(reverse('home'))
+        assert first.id in [product.id for product in response.context['new_products']]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            second = self.create_product('두번째 상품')
+            first.is_live = False
+            first.save()
+
+        response = self.client.get(reverse('home'))
+        new_product_ids = [product.id for product in response.context['new_products']]
+        assert second.id in new_product_ids
+        assert first.id not in new_product_ids
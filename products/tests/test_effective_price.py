@@ -0,0 +1,100 @@
+from decimal import Decimal
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+
+from carts.models import Cart
+from config.utils.cursor_pagination import CursorPagination
+from config.utils.setup_test_method import TestSetupMixin
+from orders.services.order_services import OrderService
+from products.models import Product
+from products.services.product_listing import ProductListingService
+
+
+@pytest.mark.django_db
+@patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+class TestEffectivePrice(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.products = [
+            Product.objects.create(
+                user=self.admin_user,
+                name=f'린넨 셔츠 {index}',
+                description='',
+                price=Decimal(price),
+                sale_price=Decimal(sale_price) if sale_price else None,
+                stock=10,
+                is_live=True,
+            )
+            for index, (price, sale_price) in enumerate([
+                ('40000', '10000'), ('20000', None), ('60000', '5000'), ('30000', '10000'),
+            ])
+        ]
+
+    def get_ids(self, params: Any) -> List[int]:
+        response = self.client.get(reverse('customer-product-list'), params)
+        return [listing.id for listing in response.context['products']]
+
+    def test_generated_column_follows_price_changes(self, mock_search: Any) -> None:
+        product = self.products[0]
+        assert product.effective_price == Decimal('30000')
+
+        product.sale_price = Decimal('15000')
+        product.save()
+        assert product.effective_price == Decimal('25000')
+
+        product.sale_price = None
+        product.save()
+        assert Product.objects.get(id=product.id).effective_price == Decimal('40000')
+        assert OrderService.calculate_item_price(product) == Decimal('40000')
+
+    def test_price_sort(self, mock_search: Any) -> None:
+        # 20000(1), 20000(3), 30000(0), 55000(2) - 같은 가격은 정렬 방향의 id 로 순서를 정한다
+        assert self.get_ids({'sort': 'price_low'}) == [self.products[index].id for index in (1, 3, 0, 2)]
+        assert self.get_ids({'sort': 'price_high'}) == [self.products[index].id for index in (2, 0, 3, 1)]
+
+    def test_price_sort_cursor_continues_after_ties(self, mock_search: Any) -> None:
+        listings = ProductListingService.get_live_listings()
+        first, cursor = ProductListingService.get_product_page(listings, page_size=1, sort='price_low')
+        second, cursor = ProductListingService.get_product_page(listings, cursor, page_size=2, sort='price_low')
+        third, cursor = ProductListingService.get_product_page(listings, cursor, page_size=2, sort='price_low')
+
+        assert [listing.id for listing in first + second + third] == [
+            self.products[index].id for index in (1, 3, 0, 2)
+        ]
+        assert cursor is None
+
+    @pytest.mark.parametrize('position', [['abc', 1], [10000, 'x'], [[1], 1], ['NaN', 1], [10000, 10 ** 30], [None, 1]])
+    def test_tampered_cursor_returns_first_page(self, mock_search: Any, position: List[Any]) -> None:
+        response = self.client.get(
+            reverse('customer-product-list'), {'sort': 'price_low', 'cursor': CursorPagination.encode_values(position)}
+        )
+
+        assert response.status_code == 200
+        assert [listing.id for listing in response.context['products']] == [
+            self.products[index].id for index in (1, 3, 0, 2)
+        ]
+
+    def test_price_range_uses_effective_price(self, mock_search: Any) -> None:
+        assert self.get_ids({'price_range': '-30000', 'sort': 'price_low'}) == [
+            self.products[1].id, self.products[3].id,
+        ]
+        assert self.get_ids({'price_range': '50000-'}) == [self.products[2].id]
+
+    def test_browse_page_shows_sort_and_price_range(self, mock_search: Any) -> None:
+        response = self.client.get(reverse('customer-product-list'))
+
+        assert response.context['sort'] == 'newest'
+        assert 'relevance' not in dict(response.context['sort_choices'])
+        assert 'name="price_range"' in response.content.decode()
+
+    def test_cart_total_uses_effective_price(self, mock_search: Any) -> None:
+        Cart.objects.create(user=self.customer_user, product=self.products[0], quantity=2)
+        Cart.objects.create(user=self.customer_user, product=self.products[1], quantity=1)
+        self.client.force_login(self.customer_user)
+
+        response = self.client.get(reverse('cart-detail'))
+
+        assert response.context['total_price'] == Decimal('80000')
@@ -0,0 +1,122 @@
+import time
+from typing import Any, cast
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from elastic_transport import ApiResponseMeta, ConnectionError, HttpHeaders, NodeConfig
+from elasticsearch import BadRequestError
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
+from products.utils.elasticsearch.circuit_breaker import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_FAILURES_KEY,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_OPENED_AT_KEY,
+    CIRCUIT_PROBE_KEY,
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitOpenError,
+    ElasticSearchCircuitBreaker,
+)
+from products.utils.elasticsearch.elastic_search import (
+    TimeoutHttpNode,
+    create_es_client,
+    search_products_page,
+)
+
+
+def es_response() -> dict[str, Any]:
+    return {'hits': {'total': {'value': 0, 'relation': 'eq'}, 'hits': []}}
+
+
+def bad_request() -> BadRequestError:
+    meta = ApiResponseMeta(
+        status=400, http_version='1.1', headers=HttpHeaders(), duration=0.0, node=NodeConfig('http', 'localhost', 9200)
+    )
+    return BadRequestError('bad query', meta=meta, body={})
+
+
+@pytest.mark.django_db
+class TestElasticSearchCircuitBreaker(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.clear_circuit()
+
+    def teardown_method(self) -> None:
+        self.clear_circuit()
+
+    def clear_circuit(self) -> None:
+        for key in (CIRCUIT_FAILURES_KEY, CIRCUIT_OPENED_AT_KEY, CIRCUIT_PROBE_KEY):
+            CacheHelper.delete(key)
+
+    def test_client_uses_separate_connect_and_read_timeouts(self) -> None:
+        node = cast(TimeoutHttpNode, next(iter(create_es_client().transport.node_pool.all())))
+
+        assert node.pool.timeout.connect_timeout == 0.5
+        assert node.pool.timeout.read_timeout == 2.0
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_connection_failures_open_circuit(self, mock_client: Any) -> None:
+        mock_client.search.side_effect = ConnectionError('ES down')
+
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(ConnectionError):
+                search_products_page('셔츠')
+
+        assert ElasticSearchCircuitBreaker.get_state() == OPEN
+        with pytest.raises(CircuitOpenError):
+            search_products_page('셔츠')
+        assert mock_client.search.call_count == CIRCUIT_FAILURE_THRESHOLD
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_client_errors_do_not_count(self, mock_client: Any) -> None:
+        mock_client.search.side_effect = bad_request()
+
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(BadRequestError):
+                search_products_page('셔츠')
+
+        assert ElasticSearchCircuitBreaker.get_state() == CLOSED
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_half_open_allows_single_probe_and_closes(self, mock_client: Any) -> None:
+        CacheHelper.set(CIRCUIT_OPENED_AT_KEY, time.time() - CIRCUIT_OPEN_SECONDS - 1)
+        assert ElasticSearchCircuitBreaker.get_state() == HALF_OPEN
+
+        # 다른 워커가 시험 요청을 보내는 중이면 바로 대체 경로로 간다
+        CacheHelper.add(CIRCUIT_PROBE_KEY, 1)
+        with pytest.raises(CircuitOpenError):
+            search_products_page('셔츠')
+
+        CacheHelper.delete(CIRCUIT_PROBE_KEY)
+        mock_client.search.return_value = es_response()
+        search_products_page('셔츠')
+
+        assert ElasticSearchCircuitBreaker.get_state() == CLOSED
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_failed_probe_reopens(self, mock_client: Any) -> None:
+        CacheHelper.set(CIRCUIT_OPENED_AT_KEY, time.time() - CIRCUIT_OPEN_SECONDS - 1)
+        mock_client.search.side_effect = ConnectionError('ES down')
+
+        with pytest.raises(ConnectionError):
+            search_products_page('셔츠')
+
+        assert ElasticSearchCircuitBreaker.get_state() == OPEN
+        assert CacheHelper.get(CIRCUIT_PROBE_KEY) is None
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_open_circuit_goes_straight_to_db_search(self, mock_client: Any) -> None:
+        self.setup_test_user_data()
+        product = Product.objects.create(
+            user=self.admin_user, name='린넨 셔츠', description='', price=10000, stock=1, is_live=True
+        )
+        ElasticSearchCircuitBreaker.open()
+
+        response = self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+
+        assert [listing.id for listing in response.context['products']] == [product.id]
+        mock_client.search.assert_not_called()
@@ -0,0 +1,122 @@
+from io import StringIO
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.management.commands.index_products import INDEX_CHECKPOINT_KEY
+from products.models import Product, ProductIndexOutbox
+from products.utils.elasticsearch.elastic_search import (
+    BUILDING_INDEX_KEY,
+    PRODUCT_INDEX_NAME,
+)
+
+
+class FakeBulk:
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.fail_after = fail_after
+        self.indexed_ids: List[int] = []
+        self.chunk_sizes: List[int] = []
+
+    def __call__(
+        self, client: Any, actions: Iterable[Dict[str, Any]], chunk_size: int, **kwargs: Any
+    ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        self.chunk_sizes.append(chunk_size)
+        for action in actions:
+            if self.fail_after is not None and len(self.indexed_ids) >= self.fail_after:
+                raise ConnectionError('ES down')
+            self.indexed_ids.append(action['_id'])
+            yield True, {'index': {'_id': str(action['_id']), 'status': 201}}
+
+
+@pytest.mark.django_db
+class TestIndexProductsCommand(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.products = [
+            Product.objects.create(
+                user=self.admin_user,
+                name=f'상품 {index}',
+                description='상품 설명',
+                price=10000,
+                stock=10,
+                is_live=True,
+            )
+            for index in range(5)
+        ]
+        CacheHelper.delete(INDEX_CHECKPOINT_KEY)
+
+    def teardown_method(self) -> None:
+        CacheHelper.delete(INDEX_CHECKPOINT_KEY)
+
+    @patch('products.management.commands.index_products.create_product_index')
+    def test_streams_all_live_products_in_chunks(self, mock_create: Any) -> None:
+        Product.objects.create(user=self.admin_user, name='비공개', description='', price=1000, stock=1)
+        fake_bulk = FakeBulk()
+        out = StringIO()
+
+        with patch('products.utils.elasticsearch.elastic_search.helpers.streaming_bulk', fake_bulk):
+            call_command('index_products', chunk_size=2, stdout=out)
+
+        assert fake_bulk.indexed_ids == [product.id for product in self.products]
+        assert fake_bulk.chunk_sizes == [2]
+        assert 'Successfully indexed 5 products' in out.getvalue()
+        assert 'docs/s' in out.getvalue()
+        assert CacheHelper.get(INDEX_CHECKPOINT_KEY) is None
+
+    @patch('products.management.commands.index_products.create_product_index')
+    def test_uses_parallel_bulk_with_threads(self, mock_create: Any) -> None:
+        fake_bulk = FakeBulk()
+
+        with patch('products.utils.elasticsearch.elastic_search.helpers.parallel_bulk', fake_bulk):
+            call_command('index_products', threads=4, stdout=StringIO())
+
+        assert len(fake_bulk.indexed_ids) == 5
+
+    @patch('products.management.commands.index_products.create_product_index')
+    def test_resume_continues_after_checkpoint(self, mock_create: Any) -> None:
+        crashing_bulk = FakeBulk(fail_after=3)
+        with patch('products.utils.elasticsearch.elastic_search.helpers.streaming_bulk', crashing_bulk):
+            with pytest.raises(ConnectionError):
+                call_command('index_products', chunk_size=2, stdout=StringIO())
+
+        checkpoint = CacheHelper.get(INDEX_CHECKPOINT_KEY)
+        assert checkpoint['index'] == PRODUCT_INDEX_NAME
+        assert checkpoint['last_id'] == self.products[1].id
+
+        fake_bulk = FakeBulk()
+        with patch('products.utils.elasticsearch.elastic_search.helpers.streaming_bulk', fake_bulk):
+            call_command('index_products', chunk_size=2, resume=True, stdout=StringIO())
+
+        assert fake_bulk.indexed_ids == [product.id for product in self.products[2:]]
+        # 이어서 색인할 때는 체크포인트의 인덱스를 그대로 사용한다
+        mock_create.assert_called_once_with()
+
+    @patch('products.management.commands.index_products.swap_product_index_alias')
+    @patch('products.management.commands.index_products.create_product_index_version')
+    def test_force_builds_new_version_then_swaps_alias(self, mock_version: Any, mock_swap: Any) -> None:
+        mock_version.return_value = f'{PRODUCT_INDEX_NAME}-v2'
+        ProductIndexOutbox.objects.update(processed_at=timezone.now())
+        fake_bulk = FakeBulk()
+        actions: List[Dict[str, Any]] = []
+
+        def recording_bulk(client: Any, generated: Iterable[Dict[str, Any]], **kwargs: Any) -> Any:
+            generated = list(generated)
+            actions.extend(generated)
+            # 재색인 도중 다른 프로세스가 변경을 색인하고 처리 완료로 표시한 상황
+            ProductIndexOutbox.objects.create(product_id=self.products[0].id, processed_at=timezone.now())
+            return fake_bulk(client, generated, **kwargs)
+
+        with patch('products.utils.elasticsearch.elastic_search.helpers.streaming_bulk', recording_bulk):
+            call_command('index_products', force=True, double_write=True, stdout=StringIO())
+
+        assert {action['_index'] for action in actions} == {f'{PRODUCT_INDEX_NAME}-v2'}
+        mock_swap.assert_called_once_with(f'{PRODUCT_INDEX_NAME}-v2')
+        assert CacheHelper.get(BUILDING_INDEX_KEY) is None
+        # 재색인 중에 생긴 아웃박스 항목만 다시 처리 대기 상태가 된다
+        pending = ProductIndexOutbox.objects.filter(processed_at__isnull=True)
+        assert list(pending.values_list('product_id', flat=True)) == [self.products[0].id]
@@ -0,0 +1,114 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.utils.page_cache import PAGE_CACHE_HEADER, PageCacheService
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
+from reviews.models import Review
+
+
+@pytest.mark.django_db
+class TestPageCache(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+
+    def create_product(self, name: str = '린넨 셔츠') -> Product:
+        return Product.objects.create(
+            user=self.admin_user, name=name, description='', price=10000, stock=1, is_live=True
+        )
+
+    def test_normalize_query_ignores_order_blank_and_tracking_params(self) -> None:
+        first = QueryDict('sort=newest&color=red&utm_source=ad&price_range=')
+        second = QueryDict('color=red&sort=newest&fbclid=abc')
+
+        assert PageCacheService.normalize_query(first) == PageCacheService.normalize_query(second)
+        assert PageCacheService.normalize_query(first) != PageCacheService.normalize_query(QueryDict('sort=price_low'))
+
+    def test_anonymous_home_is_served_from_cache(self) -> None:
+        first = self.client.get(reverse('home'))
+        second = self.client.get(reverse('home'), {'utm_source': 'newsletter'})
+
+        assert first[PAGE_CACHE_HEADER] == 'MISS'
+        assert second[PAGE_CACHE_HEADER] == 'HIT'
+        assert second.content == first.content
+        assert 'Cookie' in second['Vary']
+
+    def test_authenticated_user_bypasses_cache(self) -> None:
+        self.client.get(reverse('home'))
+        self.client.force_login(self.customer_user)
+
+        response = self.client.get(reverse('home'))
+
+        assert PAGE_CACHE_HEADER not in response
+        assert b'data-authenticated="true"' in response.content
+
+    def test_search_request_is_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            'products.services.product_listing.ProductListingService.get_listing_page',
+            lambda params: {'products': [], 'next_cursor': None, 'total_count': 0, 'facets': {}, 'category': None},
+        )
+        self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+        response = self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+
+        assert PAGE_CACHE_HEADER not in response
+
+    def test_product_change_invalidates_detail_page(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            product = self.create_product()
+        url = reverse('products-detail', args=[product.slug])
+
+        assert self.client.get(url)[PAGE_CACHE_HEADER] == 'MISS'
+        assert self.client.get(url)[PAGE_CACHE_HEADER] == 'HIT'
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.description = '여름용 린넨 셔츠'
+            product.save()
+        response = self.client.get(url)
+
+        assert response[PAGE_CACHE_HEADER] == 'MISS'
+        assert '여름용 린넨 셔츠' in response.content.decode()
+
+    def test_review_invalidates_only_its_product_page(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            product = self.create_product()
+            other = self.create_product('코튼 셔츠')
+        url = reverse('products-detail', args=[product.slug])
+        other_url = reverse('products-detail', args=[other.slug])
+        self.client.get(url)
+        self.client.get(other_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Review.objects.create(user=self.customer_user, product=product, content='좋아요', rating=5)
+
+        assert self.client.get(url)[PAGE_CACHE_HEADER] == 'MISS'
+        assert self.client.get(other_url)[PAGE_CACHE_HEADER] == 'HIT'
+
+    def test_user_fragments_for_anonymous_user(self) -> None:
+        response = self.client.get(reverse('user-fragments'))
+        data = response.json()
+
+        assert data['is_authenticated'] is False
+        assert data['csrf_token']
+        assert 'no-cache' in response['Cache-Control']
+
+    def test_user_fragments_for_logged_in_user(self) -> None:
+        self.client.force_login(self.customer_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get(reverse('user-fragments')).json()
+
+        assert data == {'is_authenticated': True, 'csrf_token': data['csrf_token']}
+        # 세션/사용자 조회 외에 장바구니나 찜 쿼리를 실행하지 않는다
+        assert not [query for query in queries.captured_queries if 'carts' in query['sql'] or 'favorites' in query['sql']]
+
+    def test_fragment_script_only_on_anonymous_cached_pages(self) -> None:
+        assert b'js/page_fragments.js' in self.client.get(reverse('home')).content
+        assert b'js/page_fragments.js' not in self.client.get(reverse('login')).content
+
+        self.client.force_login(self.customer_user)
+        assert b'js/page_fragments.js' not in self.client.get(reverse('home')).content
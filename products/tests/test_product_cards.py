@@ -0,0 +1,92 @@
+from io import StringIO
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.template import engines
+from django.urls import reverse
+
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product, ProductListing
+from products.services.product_card_cache import ProductCardCacheService
+from products.services.product_listing import ProductListingService
+
+
+@pytest.mark.django_db
+class TestProductCardCache(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.products = [
+            Product.objects.create(
+                user=self.admin_user, name=f'린넨 셔츠 {index}', description='', price=10000, stock=1, is_live=True
+            )
+            for index in range(3)
+        ]
+
+    def get_page(self) -> List[ProductListing]:
+        return list(ProductListingService.get_live_listings().order_by('id'))
+
+    def render_uncached(self, products: List[ProductListing]) -> str:
+        template = engines['django'].from_string(
+            '{% for product in products %}{% include "products/customers/product_card.html" %}{% endfor %}'
+        )
+        return template.render({'products': products})
+
+    def test_cached_cards_match_direct_render(self) -> None:
+        products = self.get_page()
+
+        assert ProductCardCacheService.render_cards(products) == self.render_uncached(products)
+        assert ProductCardCacheService.render_cards(self.get_page()) == self.render_uncached(products)
+
+    def test_only_missing_cards_are_rendered(self) -> None:
+        ProductCardCacheService.render_cards(self.get_page()[:2])
+
+        with patch.object(
+            ProductCardCacheService, 'render_card', wraps=ProductCardCacheService.render_card
+        ) as render_card:
+            ProductCardCacheService.render_cards(self.get_page())
+
+        assert [call.args[0].id for call in render_card.call_args_list] == [self.products[2].id]
+
+    def test_price_change_renders_new_card(self) -> None:
+        ProductCardCacheService.render_cards(self.get_page())
+
+        product = self.products[0]
+        product.price = 12345
+        product.save()
+
+        assert '12,345원' in ProductCardCacheService.render_cards(self.get_page())
+
+    def test_card_shows_stored_discount_rate(self) -> None:
+        product = self.products[0]
+        product.sale_price = 2500
+        product.save()
+
+        html = ProductCardCacheService.render_cards(self.get_page()[:1])
+
+        assert '<span class="discount">25%</span>' in html
+        assert '7,500원' in html
+
+    def test_color_change_renders_new_card(self, django_capture_on_commit_callbacks: Any) -> None:
+        color = Color.objects.create(name='화이트', hex_code='#ffffff')
+        self.products[0].colors.add(color)
+        ProductCardCacheService.render_cards(self.get_page())
+
+        with django_capture_on_commit_callbacks(execute=True):
+            color.hex_code = '#000000'
+            color.save()
+
+        assert '#000000' in ProductCardCacheService.render_cards(self.get_page())
+
+    def test_list_page_renders_cards(self) -> None:
+        response = self.client.get(reverse('customer-product-list'))
+
+        for product in self.products:
+            assert product.name in response.content.decode()
+
+    def test_benchmark_command(self) -> None:
+        out = StringIO()
+        call_command('benchmark_product_cards', '--cards', '6', '--iterations', '2', stdout=out)
+
+        assert 'fragment cache, all cards cached' in out.getvalue()
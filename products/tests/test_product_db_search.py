@@ -0,0 +1,125 @@
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+from django.db.models import QuerySet
+from django.http import QueryDict
+from django.urls import reverse
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product
+from products.services.product_listing import ProductListingService
+
+
+@pytest.mark.django_db
+class TestProductDBSearch(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.shirt = self._create_product('린넨 셔츠', '여름용 상의')
+        self.pants = self._create_product('와이드 팬츠', '셔츠와 잘 어울리는 하의')
+        self.hidden = self._create_product('셔츠 원피스', '', is_live=False)
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def search_ids(self, query: str, mock_search: Any) -> List[int]:
+        params = QueryDict(mutable=True)
+        params['search'] = query
+        return [listing.id for listing in ProductListingService.get_listing_page(params)['products']]
+
+    def _create_product(self, name: str, description: str, is_live: bool = True) -> Product:
+        return Product.objects.create(
+            user=self.admin_user, name=name, description=description, price=10000, stock=1, is_live=is_live
+        )
+
+    def test_search_vector_is_maintained(self) -> None:
+        category = Category.objects.create(name='아우터')
+        self.pants.categories.add(category)
+        assert self.search_ids('아우터') == [self.pants.id]
+
+        category.name = '코트'
+        category.save()
+        assert self.search_ids('아우터') == []
+        assert self.search_ids('코트') == [self.pants.id]
+
+        color = Color.objects.create(name='네이비')
+        self.shirt.colors.add(color)
+        assert self.search_ids('네이비') == [self.shirt.id]
+
+    def test_ranks_name_above_description_and_skips_hidden(self) -> None:
+        assert self.search_ids('셔츠') == [self.shirt.id, self.pants.id]
+
+    def test_prefix_and_multi_token_match(self) -> None:
+        assert self.search_ids('린넨 셔') == [self.shirt.id]
+        assert self.search_ids('!!!') == []
+
+    @patch('products.utils.postgres_search.is_trigram_available', return_value=False)
+    def test_falls_back_to_substring_without_trigram(self, mock_available: Any) -> None:
+        # 단어 중간 일치는 전문 검색에 걸리지 않는다
+        assert self.search_ids('이드') == [self.pants.id]
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_fallback_search_skips_exists_query(self, mock_search: Any) -> None:
+        with patch.object(QuerySet, 'exists', side_effect=AssertionError('extra exists() query')):
+            listing = ProductListingService.get_listing_page(QueryDict('search=셔츠'))
+
+        assert [product.id for product in listing['products']] == [self.shirt.id, self.pants.id]
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_listing_fallback_orders_by_rank(self, mock_search: Any) -> None:
+        response = self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+
+        assert [listing.id for listing in response.context['products']] == [self.shirt.id, self.pants.id]
+        assert response.context['product_count'] == 2
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_listing_fallback_rank_cursor(self, mock_search: Any) -> None:
+        first_page = ProductListingService.get_listing_page(QueryDict('search=셔츠'), page_size=1)
+        assert [listing.id for listing in first_page['products']] == [self.shirt.id]
+
+        params = QueryDict(mutable=True)
+        params.update({'search': '셔츠', 'cursor': first_page['next_cursor']})
+        second_page = ProductListingService.get_listing_page(params, page_size=1)
+        assert [listing.id for listing in second_page['products']] == [self.pants.id]
+        assert second_page['next_cursor'] is None
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_listing_fallback_honors_sort(self, mock_search: Any) -> None:
+        self.shirt.price = 30000
+        self.shirt.save()
+
+        price_low = ProductListingService.get_listing_page(QueryDict('search=셔츠&sort=price_low'))
+        assert [listing.id for listing in price_low['products']] == [self.pants.id, self.shirt.id]
+
+        newest = ProductListingService.get_listing_page(QueryDict('search=셔츠&sort=newest'))
+        assert [listing.id for listing in newest['products']] == [self.pants.id, self.shirt.id]
+
+        price_high = ProductListingService.get_listing_page(QueryDict('search=셔츠&sort=price_high'), page_size=1)
+        assert [listing.id for listing in price_high['products']] == [self.shirt.id]
+        params = QueryDict(mutable=True)
+        params.update({'search': '셔츠', 'sort': 'price_high', 'cursor': price_high['next_cursor']})
+        assert [listing.id for listing in ProductListingService.get_listing_page(params)['products']] == [
+            self.pants.id
+        ]
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_listing_fallback_ends_es_cursor(self, mock_search: Any) -> None:
+        params = QueryDict(mutable=True)
+        params.update({'search': '셔츠', 'cursor': ProductListingService.encode_search_cursor([1.0, self.shirt.id])})
+
+        listing = ProductListingService.get_listing_page(params)
+
+        assert listing['products'] == []
+        assert listing['next_cursor'] is None
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_db_cursor_keeps_paging_on_db_after_recovery(self, mock_search: Any) -> None:
+        mock_search.side_effect = Exception('ES down')
+        first_page = ProductListingService.get_listing_page(QueryDict('search=셔츠'), page_size=1)
+
+        mock_search.side_effect = None
+        params = QueryDict(mutable=True)
+        params.update({'search': '셔츠', 'cursor': first_page['next_cursor']})
+        second_page = ProductListingService.get_listing_page(params, page_size=1)
+
+        assert mock_search.call_count == 1
+        assert [listing.id for listing in second_page['products']] == [self.pants.id]
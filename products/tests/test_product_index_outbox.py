@@ -0,0 +1,193 @@
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from orders.services.inventory_reservation_services import InventoryReservationService
+from products.models import Color, Product, ProductIndexOutbox
+from products.services.search_indexing import (
+    OUTBOX_CLAIM_TIMEOUT,
+    OUTBOX_RETENTION,
+    ProductIndexOutboxService,
+)
+from products.utils.elasticsearch.elastic_search import bulk_delete_products_from_index
+
+
+def pending_product_ids() -> set[int]:
+    return set(ProductIndexOutbox.objects.filter(processed_at__isnull=True).values_list('product_id', flat=True))
+
+
+@pytest.mark.django_db
+class TestProductIndexOutbox(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.product.is_live = True
+        self.product.save()
+        ProductIndexOutbox.objects.all().delete()
+
+    def test_product_save_enqueues(self) -> None:
+        self.product.stock = 3
+        self.product.save()
+
+        assert pending_product_ids() == {self.product.id}
+
+    def test_product_delete_enqueues(self) -> None:
+        product_id = self.product.id
+        self.product.delete()
+
+        assert pending_product_ids() == {product_id}
+
+    def test_m2m_changes_enqueue(self) -> None:
+        category = Category.objects.create(name='TOP')
+        ProductIndexOutbox.objects.all().delete()
+
+        self.product.categories.add(category)
+        assert pending_product_ids() == {self.product.id}
+
+        ProductIndexOutbox.objects.all().delete()
+        category.product_set.clear()
+        assert pending_product_ids() == {self.product.id}
+
+    def test_color_rename_enqueues_related_products(self) -> None:
+        color = Color.objects.create(name='블랙')
+        self.product.colors.add(color)
+        ProductIndexOutbox.objects.all().delete()
+
+        color.name = '검정'
+        color.save()
+
+        assert pending_product_ids() == {self.product.id}
+
+    def test_reconcile_enqueues_stock_changes(self) -> None:
+        items = [{"product_id": self.product.id, "quantity": 1}]
+        InventoryReservationService.reserve("order:preorder:a", items)
+        InventoryReservationService.commit("order:preorder:a", items)
+
+        InventoryReservationService.reconcile()
+
+        assert pending_product_ids() == {self.product.id}
+
+    @patch('products.services.search_indexing.bulk_delete_products_from_index')
+    @patch('products.services.search_indexing.bulk_index_products')
+    def test_process_batch_coalesces_and_splits_deletes(self, mock_index: Any, mock_delete: Any) -> None:
+        hidden = Product.objects.create(user=self.admin_user, name='숨김 상품', description='', price=1000, stock=1)
+        ProductIndexOutbox.enqueue([self.product.id])
+        ProductIndexOutbox.enqueue([self.product.id])
+        ProductIndexOutbox.enqueue([99999])
+        mock_index.return_value = (1, [])
+        mock_delete.return_value = (2, [])
+
+        indexed_count, deleted_count = ProductIndexOutboxService.process_batch()
+
+        assert (indexed_count, deleted_count) == (1, 2)
+        assert [product.id for product in mock_index.call_args.args[0]] == [self.product.id]
+        assert mock_delete.call_args.args[0] == sorted([hidden.id, 99999])
+        assert pending_product_ids() == set()
+
+    @patch('products.services.search_indexing.bulk_delete_products_from_index')
+    @patch('products.services.search_indexing.bulk_index_products', side_effect=Exception('ES down'))
+    def test_process_batch_keeps_entries_on_failure(self, mock_index: Any, mock_delete: Any) -> None:
+        ProductIndexOutbox.enqueue([self.product.id])
+
+        with pytest.raises(Exception):
+            ProductIndexOutboxService.process_batch()
+
+        assert pending_product_ids() == {self.product.id}
+        # 표시를 지웠으므로 다음 실행에서 바로 다시 가져간다
+        assert [product_id for _, product_id in ProductIndexOutboxService.claim_batch()] == [self.product.id]
+
+    @patch('products.services.search_indexing.bulk_delete_products_from_index', return_value=(0, []))
+    @patch('products.services.search_indexing.bulk_index_products')
+    def test_process_batch_keeps_failed_documents(self, mock_index: Any, mock_delete: Any) -> None:
+        other = Product.objects.create(
+            user=self.admin_user, name='다른 상품', description='', price=1000, stock=1, is_live=True
+        )
+        ProductIndexOutbox.objects.all().delete()
+        ProductIndexOutbox.enqueue([self.product.id, other.id])
+        mock_index.return_value = (1, [other.id])
+
+        assert ProductIndexOutboxService.process_batch() == (1, 0)
+
+        assert pending_product_ids() == {other.id}
+        assert ProductIndexOutbox.objects.get(product_id=other.id).attempts == 1
+        # 실패한 행은 가져간 시각이 만료되기 전에는 다시 가져가지 않는다
+        assert ProductIndexOutboxService.process_batch() == (0, 0)
+
+        ProductIndexOutbox.objects.update(claimed_at=timezone.now() - OUTBOX_CLAIM_TIMEOUT - timedelta(seconds=1))
+        mock_index.return_value = (1, [])
+        ProductIndexOutboxService.process_batch()
+        assert pending_product_ids() == set()
+
+    @patch('products.utils.elasticsearch.elastic_search.helpers.streaming_bulk')
+    def test_bulk_delete_reports_failed_documents(self, mock_bulk: Any) -> None:
+        mock_bulk.return_value = iter([
+            (True, {'delete': {'_id': '1', 'status': 200}}),
+            (False, {'delete': {'_id': '2', 'status': 404}}),
+            (False, {'delete': {'_id': '3', 'status': 429}}),
+        ])
+
+        assert bulk_delete_products_from_index([1, 2, 3]) == (2, [3])
+
+    def test_claimed_entries_are_not_claimed_twice(self) -> None:
+        ProductIndexOutbox.enqueue([self.product.id])
+
+        assert len(ProductIndexOutboxService.claim_batch()) == 1
+        assert ProductIndexOutboxService.claim_batch() == []
+
+    def test_get_lag(self) -> None:
+        assert ProductIndexOutboxService.get_lag() == {'pending_count': 0, 'lag_seconds': 0.0}
+
+        ProductIndexOutbox.enqueue([self.product.id])
+        ProductIndexOutbox.objects.update(created_at=timezone.now() - timedelta(seconds=30))
+
+        lag = ProductIndexOutboxService.get_lag()
+        assert lag['pending_count'] == 1
+        assert lag['lag_seconds'] >= 30
+
+    @patch('products.services.search_indexing.bulk_delete_products_from_index', return_value=(0, []))
+    @patch('products.services.search_indexing.bulk_index_products', return_value=(1, []))
+    def test_process_command_drains_outbox(self, mock_index: Any, mock_delete: Any) -> None:
+        ProductIndexOutbox.enqueue([self.product.id])
+
+        call_command('process_index_outbox', batch_size=10)
+
+        assert pending_product_ids() == set()
+
+    def test_purge_processed_keeps_recent_and_pending_entries(self) -> None:
+        ProductIndexOutbox.objects.all().delete()
+        old = timezone.now() - OUTBOX_RETENTION - timedelta(hours=1)
+        for _ in range(3):
+            ProductIndexOutbox.objects.create(product_id=self.product.id, processed_at=old)
+        ProductIndexOutbox.objects.update(created_at=old)
+        old_pending = ProductIndexOutbox.objects.create(product_id=self.product.id)
+        ProductIndexOutbox.objects.filter(id=old_pending.id).update(created_at=old)
+        recent = ProductIndexOutbox.objects.create(product_id=self.product.id, processed_at=timezone.now())
+
+        assert ProductIndexOutboxService.purge_processed(batch_size=2) == 3
+        assert set(ProductIndexOutbox.objects.values_list('id', flat=True)) == {old_pending.id, recent.id}
+
+    @patch('products.services.search_indexing.bulk_delete_products_from_index', return_value=(0, []))
+    @patch('products.services.search_indexing.bulk_index_products', return_value=(1, []))
+    def test_process_command_purges_processed_entries(self, mock_index: Any, mock_delete: Any) -> None:
+        ProductIndexOutbox.enqueue([self.product.id])
+
+        call_command('process_index_outbox', batch_size=10, retention_days=0)
+
+        assert not ProductIndexOutbox.objects.exists()
+
+    def test_replay_command(self) -> None:
+        ProductIndexOutbox.enqueue([self.product.id])
+        ProductIndexOutbox.objects.update(processed_at=timezone.now())
+
+        call_command('replay_index_outbox', since=(timezone.now() - timedelta(minutes=1)).isoformat())
+        assert pending_product_ids() == {self.product.id}
+
+        ProductIndexOutbox.objects.all().delete()
+        call_command('replay_index_outbox', all=True)
+        assert pending_product_ids() == set(Product.objects.values_list('id', flat=True))
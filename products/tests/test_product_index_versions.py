@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from typing import Any, Dict, Iterable, Iterator, Tuple
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.utils.elasticsearch.elastic_search import (
+    BUILDING_INDEX_KEY,
+    PRODUCT_INDEX_NAME,
+    bulk_index_products,
+    create_product_index_version,
+    delete_old_product_indices,
+    get_write_indices,
+    start_double_write,
+    stop_double_write,
+    swap_product_index_alias,
+)
+
+
+def index_info(hours_ago: float) -> Dict[str, Any]:
+    created_ms = int((time.time() - hours_ago * 3600) * 1000)
+    return {'settings': {'index': {'creation_date': str(created_ms)}}}
+
+
+@pytest.mark.django_db
+class TestProductIndexVersions(TestSetupMixin):
+    def setup_method(self) -> None:
+        stop_double_write()
+
+    def teardown_method(self) -> None:
+        stop_double_write()
+
+    @patch('products.utils.elasticsearch.elastic_search.get_product_index_body', return_value={})
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_creates_next_version(self, mock_client: Any, mock_body: Any) -> None:
+        mock_client.indices.get.return_value = {
+            f'{PRODUCT_INDEX_NAME}-v1': {},
+            f'{PRODUCT_INDEX_NAME}-v3': {},
+        }
+
+        index_name = create_product_index_version()
+
+        assert index_name == f'{PRODUCT_INDEX_NAME}-v4'
+        mock_client.indices.create.assert_called_once_with(index=index_name, body={})
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_swap_moves_alias_in_one_request(self, mock_client: Any) -> None:
+        mock_client.indices.exists.return_value = True
+        mock_client.indices.exists_alias.return_value = True
+
+        swap_product_index_alias(f'{PRODUCT_INDEX_NAME}-v2')
+
+        actions = mock_client.indices.update_aliases.call_args.kwargs['actions']
+        assert [next(iter(action)) for action in actions] == ['remove', 'add']
+        assert actions[1]['add'] == {
+            'index': f'{PRODUCT_INDEX_NAME}-v2', 'alias': PRODUCT_INDEX_NAME, 'is_write_index': True,
+        }
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_swap_replaces_legacy_concrete_index(self, mock_client: Any) -> None:
+        mock_client.indices.exists.return_value = True
+        mock_client.indices.exists_alias.return_value = False
+
+        swap_product_index_alias(f'{PRODUCT_INDEX_NAME}-v1')
+
+        actions = mock_client.indices.update_aliases.call_args.kwargs['actions']
+        assert actions[0] == {'remove_index': {'index': PRODUCT_INDEX_NAME}}
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_delete_old_indices_keeps_aliased_building_and_recent(self, mock_client: Any) -> None:
+        mock_client.indices.get_alias.return_value = {f'{PRODUCT_INDEX_NAME}-v3': {}}
+        mock_client.indices.get.return_value = {
+            f'{PRODUCT_INDEX_NAME}-v1': index_info(hours_ago=48),
+            f'{PRODUCT_INDEX_NAME}-v2': index_info(hours_ago=1),
+            f'{PRODUCT_INDEX_NAME}-v3': index_info(hours_ago=72),
+            f'{PRODUCT_INDEX_NAME}-v4': index_info(hours_ago=72),
+        }
+        start_double_write(f'{PRODUCT_INDEX_NAME}-v4')
+
+        deleted = delete_old_product_indices(timedelta(hours=24))
+
+        assert deleted == [f'{PRODUCT_INDEX_NAME}-v1']
+        mock_client.indices.delete.assert_called_once_with(index=f'{PRODUCT_INDEX_NAME}-v1')
+
+    def test_write_indices_include_building_index(self) -> None:
+        assert get_write_indices() == [PRODUCT_INDEX_NAME]
+
+        start_double_write(f'{PRODUCT_INDEX_NAME}-v2')
+        assert CacheHelper.get(BUILDING_INDEX_KEY) == f'{PRODUCT_INDEX_NAME}-v2'
+        assert get_write_indices() == [PRODUCT_INDEX_NAME, f'{PRODUCT_INDEX_NAME}-v2']
+
+    @patch('products.utils.elasticsearch.elastic_search.create_product_index')
+    def test_bulk_index_double_writes_while_building(self, mock_create: Any) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        start_double_write(f'{PRODUCT_INDEX_NAME}-v2')
+        written: Dict[str, int] = {}
+
+        def fake_bulk(
+            client: Any, actions: Iterable[Dict[str, Any]], **kwargs: Any
+        ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+            for action in actions:
+                written[action['_index']] = written.get(action['_index'], 0) + 1
+                yield True, {'index': {'_id': str(action['_id'])}}
+
+        with patch('products.utils.elasticsearch.elastic_search.helpers.streaming_bulk', fake_bulk):
+            result = bulk_index_products(iter([self.product]))
+
+        # 두 인덱스에 모두 쓰지만 결과는 현재 별칭 기준으로 한 번만 센다
+        assert written == {PRODUCT_INDEX_NAME: 1, f'{PRODUCT_INDEX_NAME}-v2': 1}
+        assert result == (1, [])
+
+    @patch('products.management.commands.cleanup_product_indices.delete_old_product_indices')
+    def test_cleanup_command_uses_grace_period(self, mock_delete: Any) -> None:
+        mock_delete.return_value = [f'{PRODUCT_INDEX_NAME}-v1']
+        out = StringIO()
+
+        call_command('cleanup_product_indices', grace_hours=6, stdout=out)
+
+        mock_delete.assert_called_once_with(timedelta(hours=6))
+        assert f'{PRODUCT_INDEX_NAME}-v1' in out.getvalue()
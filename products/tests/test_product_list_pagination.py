@@ -0,0 +1,104 @@
+from datetime import timedelta
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product, ProductListing
+from products.services.product_listing import PRODUCT_PAGE_SIZE, ProductListingService
+
+
+@pytest.mark.django_db
+class TestProductListPagination(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.category = Category.objects.create(name='TOP')
+        self.products = self._create_products(30)
+        self.product_ids = [product.id for product in self.products]
+
+    def _create_products(self, count: int, offset: int = 0) -> List[Product]:
+        now = timezone.now()
+        products = []
+        for index in range(count):
+            product = Product.objects.create(
+                user=self.admin_user,
+                name=f'상품 {offset + index}',
+                description='상품 설명',
+                price=10000,
+                stock=10,
+                is_live=True,
+            )
+            product.categories.set([self.category])
+            # 최신순 정렬을 고정하기 위해 등록 시각을 1분 간격으로 둔다
+            created_at = now - timedelta(minutes=count - index)
+            Product.objects.filter(id=product.id).update(created_at=created_at)
+            # update 는 시그널을 보내지 않으므로 목록 읽기 모델도 함께 맞춘다
+            ProductListing.objects.filter(id=product.id).update(created_at=created_at)
+            products.append(product)
+        return list(Product.objects.filter(id__in=[product.id for product in products]).order_by('-created_at', '-id'))
+
+    def test_home_renders_first_page(self) -> None:
+        response = self.client.get(reverse('home'))
+
+        assert response.status_code == 200
+        assert [listing.id for listing in response.context['products']] == self.product_ids[:PRODUCT_PAGE_SIZE]
+        assert response.context['next_cursor'] is not None
+
+    def test_product_list_renders_first_page(self) -> None:
+        response = self.client.get(reverse('customer-product-list'))
+
+        assert response.status_code == 200
+        assert [listing.id for listing in response.context['products']] == self.product_ids[:PRODUCT_PAGE_SIZE]
+        assert response.context['product_count'] is None
+
+    def test_more_view_returns_next_page(self) -> None:
+        _, cursor = ProductListingService.get_product_page(ProductListingService.get_live_listings())
+        assert cursor is not None
+
+        data = self.client.get(reverse('customer-product-list-more'), {'cursor': cursor}).json()
+
+        assert data['success'] is True
+        assert data['next_cursor'] is None
+        for product in self.products[PRODUCT_PAGE_SIZE:]:
+            assert product.name in data['html']
+        assert self.products[0].name not in data['html']
+
+    def test_category_filter_is_paginated(self) -> None:
+        other_category = Category.objects.create(name='BOTTOM')
+        self.products[0].categories.set([other_category])
+
+        response = self.client.get(reverse('customer-product-list'), {'category': 'BOTTOM'})
+
+        assert [listing.id for listing in response.context['products']] == [self.products[0].id]
+        assert response.context['next_cursor'] is None
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_search_fallback_is_paginated(self, mock_search: Any) -> None:
+        response = self.client.get(reverse('customer-product-list'), {'search': '상품'})
+
+        assert [listing.id for listing in response.context['products']] == self.product_ids[:PRODUCT_PAGE_SIZE]
+        assert response.context['product_count'] == 30
+
+        data = self.client.get(
+            reverse('customer-product-list-more'),
+            {'search': '상품', 'cursor': response.context['next_cursor']},
+        ).json()
+        assert self.products[PRODUCT_PAGE_SIZE].name in data['html']
+        assert data['next_cursor'] is None
+
+    def test_home_query_count_independent_of_catalog_size(self) -> None:
+        self.client.get(reverse('home'))
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(reverse('home'))
+
+        self._create_products(50, offset=100)
+        with CaptureQueriesContext(connection) as after:
+            self.client.get(reverse('home'))
+
+        assert len(after.captured_queries) == len(before.captured_queries)
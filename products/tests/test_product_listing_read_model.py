@@ -0,0 +1,137 @@
+import importlib
+from decimal import Decimal
+from io import StringIO
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product, ProductImage, ProductListing
+from products.services.product_listing_sync import ProductListingSyncService
+
+
+@pytest.mark.django_db
+class TestProductListingReadModel(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.category = Category.objects.create(name='TOP')
+        self.white = Color.objects.create(name='화이트', hex_code='#ffffff')
+        self.black = Color.objects.create(name='블랙')
+        self.images = [
+            ProductImage.objects.create(image='products/images/first.jpg'),
+            ProductImage.objects.create(image='products/images/second.jpg'),
+        ]
+        self.product = Product.objects.create(
+            user=self.admin_user,
+            name='린넨 셔츠',
+            description='',
+            price=Decimal('40000'),
+            sale_price=Decimal('10000'),
+            stock=1,
+            is_live=True,
+        )
+        self.product.categories.add(self.category)
+        self.product.colors.add(self.white, self.black)
+        self.product.image.add(*self.images)
+
+    def get_listing(self) -> ProductListing:
+        return ProductListing.objects.get(id=self.product.id)
+
+    def test_listing_holds_card_values(self) -> None:
+        listing = self.get_listing()
+
+        assert listing.name == '린넨 셔츠'
+        assert listing.slug == self.product.slug
+        assert listing.effective_price == Decimal('30000')
+        assert listing.discount_rate == 25
+        assert listing.image_url == self.images[0].image.url
+        assert listing.hover_image_url == self.images[1].image.url
+        assert listing.color_codes == ['#ffffff', '']
+        assert listing.color_names == ['화이트', '블랙']
+        assert listing.category_ids == [self.category.id]
+        assert listing.created_at == self.product.created_at
+
+    def test_related_changes_refresh_listing(self) -> None:
+        self.white.hex_code = '#fafafa'
+        self.white.save()
+        self.product.colors.remove(self.black)
+        self.product.image.remove(self.images[1])
+
+        listing = self.get_listing()
+        assert listing.color_codes == ['#fafafa']
+        assert listing.hover_image_url == self.images[0].image.url
+
+    def test_category_delete_refreshes_after_commit(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            self.category.delete()
+
+        assert self.get_listing().category_ids == []
+
+    def test_product_delete_removes_listing(self) -> None:
+        self.product.delete()
+
+        assert not ProductListing.objects.filter(id=self.product.id).exists()
+
+    def test_rebuild_command_restores_and_prunes_rows(self) -> None:
+        ProductListing.objects.filter(id=self.product.id).update(name='오래된 이름', color_names=[])
+        ProductListing.objects.create(id=self.product.id + 1000, name='삭제된 상품', slug='x', price=0,
+                                      effective_price=0, created_at=self.product.created_at)
+
+        out = StringIO()
+        call_command('rebuild_product_listings', '--chunk-size', '1', stdout=out)
+
+        assert self.get_listing().name == '린넨 셔츠'
+        assert self.get_listing().color_names == ['화이트', '블랙']
+        assert list(ProductListing.objects.values_list('id', flat=True)) == [self.product.id]
+        assert '1 stale rows removed' in out.getvalue()
+
+    def test_migration_backfill_matches_sync(self) -> None:
+        expected = ProductListing.objects.values().get(id=self.product.id)
+        ProductListing.objects.all().delete()
+
+        migration = importlib.import_module('products.migrations.0014_productlisting')
+        with connection.cursor() as cursor:
+            cursor.execute(migration.BACKFILL_PRODUCT_LISTINGS_SQL, [settings.MEDIA_URL, settings.MEDIA_URL])
+
+        backfilled = ProductListing.objects.values().get(id=self.product.id)
+        assert {**backfilled, 'updated_at': None} == {**expected, 'updated_at': None}
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_slugless_product_does_not_break_listing_pages(self, mock_search: Any) -> None:
+        Product.objects.filter(id=self.product.id).update(slug=None)
+        ProductListingSyncService.refresh([self.product.id])
+        ProductListing.objects.filter(id=self.product.id).update(slug='')
+
+        assert self.client.get(reverse('home')).status_code == 200
+        assert self.client.get(reverse('customer-product-list')).status_code == 200
+
+    def test_slug_migration_backfills_products_and_listings(self) -> None:
+        twin = Product.objects.create(user=self.admin_user, name='린넨 셔츠', description='', price=1, stock=1)
+        Product.objects.filter(id__in=[self.product.id, twin.id]).update(slug=None)
+        ProductListing.objects.filter(id__in=[self.product.id, twin.id]).update(slug='')
+
+        migration = importlib.import_module('products.migrations.0017_backfill_product_slugs')
+        migration.backfill_product_slugs(django_apps, None)
+
+        assert list(Product.objects.order_by('id').values_list('slug', flat=True)) == ['린넨-셔츠', '린넨-셔츠-1']
+        assert ProductListing.objects.get(id=twin.id).slug == '린넨-셔츠-1'
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_listing_page_does_not_join_relations(self, mock_search: Any) -> None:
+        self.client.force_login(self.customer_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('customer-product-list'), {'category': 'TOP', 'color': '블랙'})
+
+        assert [listing.id for listing in response.context['products']] == [self.product.id]
+        sql = ' '.join(query['sql'] for query in queries.captured_queries)
+        assert 'product_color_cdt' not in sql
+        assert 'product_image_cdt' not in sql
+        assert 'product_category_cdt' not in sql
@@ -0,0 +1,209 @@
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+
+from categories.models import Category
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Color, Product
+from products.services.product_listing import ProductListingService
+from products.utils.elasticsearch.elastic_search import (
+    build_facet_filters,
+    search_products_page,
+)
+
+
+def es_response(hits: List[Dict[str, Any]], total: int) -> Dict[str, Any]:
+    return {"hits": {"total": {"value": total, "relation": "eq"}, "hits": hits}}
+
+
+def es_hit(product_id: int, score: float) -> Dict[str, Any]:
+    return {"_id": str(product_id), "_score": score, "sort": [score, product_id]}
+
+
+@pytest.mark.django_db
+class TestProductSearch(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.products = [
+            Product.objects.create(
+                user=self.admin_user,
+                name=f'셔츠 {index}',
+                description='셔츠 설명',
+                price=10000 + index,
+                stock=10,
+                is_live=True,
+            )
+            for index in range(3)
+        ]
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_search_products_page_keeps_es_order(self, mock_es: Any) -> None:
+        mock_es.search.return_value = es_response([es_hit(3, 9.0), es_hit(1, 5.0), es_hit(2, 1.0)], total=3)
+
+        result = search_products_page('셔츠', size=2)
+
+        body = mock_es.search.call_args.kwargs['body']
+        assert body['size'] == 3
+        assert body['sort'][0] == {"_score": {"order": "desc"}}
+        assert body['track_total_hits'] is True
+        assert 'search_after' not in body
+        assert result == {"ids": [3, 1], "total": 3, "search_after": [5.0, 1], "facets": None}
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_search_products_page_last_page(self, mock_es: Any) -> None:
+        mock_es.search.return_value = es_response([es_hit(2, 1.0)], total=3)
+
+        result = search_products_page('셔츠', sort='price_low', search_after=[5.0, 1], size=2)
+
+        body = mock_es.search.call_args.kwargs['body']
+        assert body['search_after'] == [5.0, 1]
+        assert 'effective_price' in body['sort'][0]
+        assert result['search_after'] is None
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_search_products_page_applies_filters(self, mock_es: Any) -> None:
+        mock_es.search.return_value = es_response([], total=0)
+
+        search_products_page('셔츠', filters=[{"term": {"categories": "TOP"}}])
+
+        filters = mock_es.search.call_args.kwargs['body']['query']['bool']['filter']
+        assert {"term": {"categories": "TOP"}} in filters
+        assert {"term": {"is_live": True}} in filters
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_list_view_renders_hits_in_es_order(self, mock_search: Any) -> None:
+        ordered = [self.products[2], self.products[0], self.products[1]]
+        mock_search.return_value = {
+            "ids": [product.id for product in ordered],
+            "total": 7,
+            "search_after": [1.0, self.products[1].id],
+            "facets": None,
+        }
+
+        response = self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+
+        assert [listing.id for listing in response.context['products']] == [product.id for product in ordered]
+        assert response.context['product_count'] == 7
+        assert ProductListingService.decode_search_cursor(response.context['next_cursor']) == [
+            1.0, self.products[1].id,
+        ]
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_more_view_passes_search_after_and_sort(self, mock_search: Any) -> None:
+        mock_search.return_value = {"ids": [self.products[0].id], "total": 4, "search_after": None, "facets": None}
+        cursor = ProductListingService.encode_search_cursor([10000.0, self.products[1].id])
+
+        data = self.client.get(
+            reverse('customer-product-list-more'),
+            {'search': '셔츠', 'sort': 'price_low', 'cursor': cursor},
+        ).json()
+
+        assert mock_search.call_args.kwargs['search_after'] == [10000.0, self.products[1].id]
+        assert mock_search.call_args.kwargs['sort'] == 'price_low'
+        assert self.products[0].name in data['html']
+        assert data['next_cursor'] is None
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_unknown_sort_falls_back_to_relevance(self, mock_search: Any) -> None:
+        mock_search.return_value = {"ids": [], "total": 0, "search_after": None, "facets": None}
+
+        self.client.get(reverse('customer-product-list'), {'search': '셔츠', 'sort': 'bogus'})
+
+        assert mock_search.call_args.kwargs['sort'] == 'relevance'
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_category_becomes_es_filter(self, mock_search: Any) -> None:
+        Category.objects.create(name='TOP')
+        mock_search.return_value = {"ids": [], "total": 0, "search_after": None, "facets": None}
+
+        self.client.get(reverse('customer-product-list'), {'search': '셔츠', 'category': 'TOP'})
+
+        assert mock_search.call_args.kwargs['filters'] == [{"term": {"categories": "TOP"}}]
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_stale_hits_are_dropped(self, mock_search: Any) -> None:
+        self.products[0].is_sold = True
+        self.products[0].save()
+        mock_search.return_value = {
+            "ids": [product.id for product in self.products],
+            "total": 3,
+            "search_after": None,
+            "facets": None,
+        }
+
+        response = self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+
+        assert [listing.id for listing in response.context['products']] == [product.id for product in self.products[1:]]
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_search_products_page_returns_facets(self, mock_es: Any) -> None:
+        response = es_response([es_hit(1, 1.0)], total=1)
+        response["aggregations"] = {
+            "colors": {"buckets": [{"key": "블랙", "doc_count": 4}]},
+            "categories": {"buckets": [{"key": "TOP", "doc_count": 2}]},
+            "price": {"buckets": [{"key": 10000.0, "doc_count": 3}]},
+        }
+        mock_es.search.return_value = response
+
+        result = search_products_page('셔츠', with_facets=True)
+
+        body = mock_es.search.call_args.kwargs['body']
+        assert set(body['aggs']) == {'colors', 'categories', 'price'}
+        assert mock_es.search.call_count == 1
+        assert result['facets'] == {
+            "colors": [{"value": "블랙", "count": 4}],
+            "categories": [{"value": "TOP", "count": 2}],
+            "price": [{"from": 10000, "to": 20000, "range": "10000-20000", "count": 3}],
+        }
+
+    def test_build_facet_filters(self) -> None:
+        assert build_facet_filters() == []
+        assert build_facet_filters('TOP', ['블랙', '화이트'], 10000, 20000) == [
+            {"term": {"categories": "TOP"}},
+            {"terms": {"colors": ['블랙', '화이트']}},
+            {"range": {"effective_price": {"gte": 10000, "lt": 20000}}},
+        ]
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_facet_filters_become_es_filters(self, mock_search: Any) -> None:
+        facets = {"colors": [{"value": "블랙", "count": 1}], "categories": [], "price": []}
+        mock_search.return_value = {"ids": [], "total": 0, "search_after": None, "facets": facets}
+
+        response = self.client.get(
+            reverse('customer-product-list'),
+            {'color': ['블랙', '화이트'], 'price_range': '10000-20000'},
+        )
+
+        kwargs = mock_search.call_args.kwargs
+        assert kwargs['with_facets'] is True
+        assert {"terms": {"colors": ['블랙', '화이트']}} in kwargs['filters']
+        assert {"range": {"effective_price": {"gte": 10000, "lt": 20000}}} in kwargs['filters']
+        assert response.context['facets'] == facets
+        assert '블랙 (1)' in response.content.decode()
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_next_pages_skip_facet_aggregation(self, mock_search: Any) -> None:
+        mock_search.return_value = {"ids": [], "total": 0, "search_after": None, "facets": None}
+
+        self.client.get(
+            reverse('customer-product-list-more'),
+            {'search': '셔츠', 'cursor': ProductListingService.encode_search_cursor([1.0, 1])},
+        )
+
+        assert mock_search.call_args.kwargs['with_facets'] is False
+
+    @patch('products.services.product_listing.search_products_page', side_effect=Exception('ES down'))
+    def test_facet_filters_fall_back_to_db(self, mock_search: Any) -> None:
+        black = Color.objects.create(name='블랙')
+        self.products[0].colors.set([black])
+        self.products[1].sale_price = 5000
+        self.products[1].save()
+
+        response = self.client.get(reverse('customer-product-list'), {'color': '블랙'})
+        assert [listing.id for listing in response.context['products']] == [self.products[0].id]
+
+        response = self.client.get(reverse('customer-product-list'), {'price_range': '0-10000'})
+        assert [listing.id for listing in response.context['products']] == [self.products[1].id]
+        assert response.context['product_count'] == 1
@@ -0,0 +1,100 @@
+from io import StringIO
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
+from products.services.product_suggest import ProductSuggestService
+from products.utils.elasticsearch.elastic_search import (
+    get_product_index_body,
+    suggest_products,
+)
+
+
+def es_response() -> dict[str, Any]:
+    return {
+        'hits': {'hits': [{'_id': '3', '_source': {'name': '블랙 티셔츠'}}]},
+        'aggregations': {'categories': {'buckets': [{'key': '블라우스'}, {'key': 'TOP'}]}},
+    }
+
+
+@pytest.mark.django_db
+class TestProductSuggest(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.setup_test_user_data()
+        self.live_product = Product.objects.create(
+            user=self.admin_user, name='블랙 티셔츠', description='', price=10000, stock=1, is_live=True
+        )
+        Product.objects.create(user=self.admin_user, name='블루 셔츠', description='', price=10000, stock=1)
+        for prefix in ('블', '블랙'):
+            CacheHelper.delete(ProductSuggestService._cache_key(prefix, 8))
+
+    def test_mapping_has_autocomplete_subfields(self) -> None:
+        properties = get_product_index_body()['mappings']['properties']
+
+        assert properties['name']['fields']['autocomplete']['analyzer'] == 'autocomplete_analyzer'
+        assert properties['categories']['fields']['autocomplete']['analyzer'] == 'autocomplete_keyword_analyzer'
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_suggest_products_keeps_matching_categories(self, mock_client: Any) -> None:
+        mock_client.search.return_value = es_response()
+
+        result = suggest_products('블', size=5)
+
+        body = mock_client.search.call_args.kwargs['body']
+        assert body['size'] == 5
+        assert body['_source'] == ['name']
+        assert result == {'products': [{'id': 3, 'name': '블랙 티셔츠'}], 'categories': ['블라우스']}
+
+    @patch('products.services.product_suggest.suggest_products')
+    def test_caches_normalized_prefix(self, mock_suggest: Any) -> None:
+        mock_suggest.return_value = {'products': [], 'categories': ['블라우스']}
+
+        assert ProductSuggestService.get_suggestions('  블랙 ')['categories'] == ['블라우스']
+        assert ProductSuggestService.get_suggestions('블랙')['categories'] == ['블라우스']
+
+        mock_suggest.assert_called_once_with('블랙', 8)
+
+    @patch('products.services.product_suggest.suggest_products', side_effect=Exception('ES down'))
+    def test_falls_back_to_live_product_names(self, mock_suggest: Any) -> None:
+        result = ProductSuggestService.get_suggestions('블')
+
+        assert result == {'products': [{'id': self.live_product.id, 'name': '블랙 티셔츠'}], 'categories': []}
+        assert CacheHelper.get(ProductSuggestService._cache_key('블', 8)) is None
+
+    @patch('products.services.product_suggest.suggest_products')
+    def test_empty_query_skips_search(self, mock_suggest: Any) -> None:
+        response = self.client.get(reverse('product-suggest'), {'q': '   '})
+
+        assert response.json() == {'success': True, 'products': [], 'categories': []}
+        mock_suggest.assert_not_called()
+
+    @patch('products.services.product_suggest.suggest_products')
+    def test_view_clamps_size(self, mock_suggest: Any) -> None:
+        mock_suggest.return_value = {'products': [], 'categories': []}
+
+        self.client.get(reverse('product-suggest'), {'q': '블', 'size': '1000'})
+        self.client.get(reverse('product-suggest'), {'q': '블', 'size': 'abc'})
+
+        assert [call.args for call in mock_suggest.call_args_list] == [('블', 20), ('블', 8)]
+        CacheHelper.delete(ProductSuggestService._cache_key('블', 20))
+
+    @patch('products.management.commands.benchmark_product_suggest.suggest_products')
+    def test_benchmark_command_reports_latency(self, mock_suggest: Any) -> None:
+        mock_suggest.return_value = {'products': [], 'categories': []}
+        out = StringIO()
+
+        with patch('products.services.product_suggest.suggest_products', mock_suggest):
+            call_command('benchmark_product_suggest', prefixes=['블'], iterations=3, stdout=out)
+
+        assert 'elasticsearch: 3 requests' in out.getvalue()
+        assert 'cached: 3 requests' in out.getvalue()
+        # 캐시 측정에서는 첫 요청만 ES 를 호출한다
+        assert mock_suggest.call_count == 4
@@ -0,0 +1,177 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.urls import reverse
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from config.utils.cache_helper import CacheHelper
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product, SearchQueryLog
+from products.services import search_analytics
+from products.services.search_analytics import (
+    SEARCH_LOG_PERSIST_LOCK_KEY,
+    SearchAnalyticsService,
+)
+
+
+@pytest.mark.django_db
+class TestSearchAnalytics(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        search_analytics._buffer.clear()
+        # 앞선 테스트가 오래 걸렸으면 첫 기록에서 시간 기준 전송이 일어나므로 기준 시각을 맞춘다
+        search_analytics._last_flushed_at = time.monotonic()
+
+    def create_log(self, query: str, result_count: int, latency_ms: float, days_ago: int = 0) -> None:
+        SearchQueryLog.objects.create(
+            query=query,
+            result_count=result_count,
+            latency_ms=latency_ms,
+            backend='elasticsearch',
+            searched_at=timezone.now() - timedelta(days=days_ago),
+        )
+
+    def test_buffered_logs_are_persisted_in_bulk(self) -> None:
+        SearchAnalyticsService.record('셔츠', 3, 12.5, 'elasticsearch')
+        SearchAnalyticsService.record('바지', 0, 40.0, 'database', is_fallback=True)
+
+        assert SearchAnalyticsService.flush_buffer() == 2
+        assert SearchAnalyticsService.get_pending_count() == 2
+        assert SearchAnalyticsService.persist() == 2
+        assert SearchAnalyticsService.get_pending_count() == 0
+
+        log = SearchQueryLog.objects.get(query='바지')
+        assert log.result_count == 0
+        assert log.backend == 'database'
+        assert log.is_fallback
+
+    def test_buffer_flushes_when_full(self) -> None:
+        with patch.object(search_analytics, 'SEARCH_LOG_BUFFER_SIZE', 2):
+            SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+            SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+
+        assert search_analytics._buffer == []
+        assert SearchAnalyticsService.get_pending_count() == 2
+
+    def test_malformed_entries_are_skipped_individually(self) -> None:
+        SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+        SearchAnalyticsService.flush_buffer()
+        redis_client = get_redis_connection('default')
+        redis_client.rpush(SearchAnalyticsService._queue_key(), 'not-json', '{"query": "x", "searched_at": "bad"}')
+        SearchAnalyticsService.record('바지', 1, 1.0, 'cache')
+        SearchAnalyticsService.flush_buffer()
+
+        assert SearchAnalyticsService.persist() == 2
+        assert sorted(SearchQueryLog.objects.values_list('query', flat=True)) == ['바지', '셔츠']
+        assert SearchAnalyticsService.get_pending_count() == 0
+
+    def test_failed_insert_keeps_entries_queued(self) -> None:
+        SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+        SearchAnalyticsService.flush_buffer()
+
+        with patch.object(SearchQueryLog.objects, 'bulk_create', side_effect=DatabaseError('db down')):
+            with pytest.raises(DatabaseError):
+                SearchAnalyticsService.persist()
+
+        assert SearchAnalyticsService.get_pending_count() == 1
+        assert SearchAnalyticsService.persist() == 1
+
+    def test_persist_skips_while_another_worker_holds_lock(self) -> None:
+        SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+        SearchAnalyticsService.flush_buffer()
+        CacheHelper.add(SEARCH_LOG_PERSIST_LOCK_KEY, 1, timeout=60)
+
+        assert SearchAnalyticsService.persist() == 0
+        assert SearchAnalyticsService.get_pending_count() == 1
+
+    @patch('products.services.search_analytics.get_redis_connection')
+    def test_redis_failure_does_not_break_search(self, mock_redis: Any) -> None:
+        mock_redis.return_value.rpush.side_effect = ConnectionError('redis down')
+        SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+
+        assert SearchAnalyticsService.flush_buffer() == 0
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_listing_search_records_first_page_only(self, mock_search: Any) -> None:
+        product = Product.objects.create(
+            user=self.admin_user, name='린넨 셔츠', description='', price=10000, stock=1, is_live=True
+        )
+        mock_search.return_value = {'ids': [product.id], 'total': 1, 'search_after': None, 'facets': None}
+
+        self.client.get(reverse('customer-product-list'), {'search': ' 셔츠 '})
+        self.client.get(reverse('customer-product-list'), {'search': '셔츠'})
+        self.client.get(reverse('customer-product-list-more'), {'search': '셔츠', 'cursor': 'abc'})
+        SearchAnalyticsService.flush_buffer()
+        SearchAnalyticsService.persist()
+
+        logs = list(SearchQueryLog.objects.order_by('id').values_list('query', 'result_count', 'backend'))
+        assert logs == [('셔츠', 1, 'elasticsearch'), ('셔츠', 1, 'cache')]
+
+    @patch('products.services.product_listing.search_products_page', side_effect=ConnectionError('ES down'))
+    def test_fallback_search_is_recorded(self, mock_search: Any) -> None:
+        self.client.get(reverse('customer-product-list'), {'search': '없는상품'})
+        SearchAnalyticsService.flush_buffer()
+        SearchAnalyticsService.persist()
+
+        log = SearchQueryLog.objects.get()
+        assert (log.query, log.result_count, log.backend, log.is_fallback) == ('없는상품', 0, 'database', True)
+
+    def test_daily_stats_include_latency_percentiles(self) -> None:
+        for latency in (10, 20, 30, 40, 100):
+            self.create_log('셔츠', 1, latency)
+        self.create_log('바지', 0, 5, days_ago=1)
+
+        today, yesterday = SearchAnalyticsService.get_daily_stats()
+
+        assert today['search_count'] == 5
+        assert today['p50_latency_ms'] == 30
+        assert today['p95_latency_ms'] == pytest.approx(88)
+        assert yesterday['zero_result_count'] == 1
+
+    def test_top_and_zero_result_queries(self) -> None:
+        self.create_log('셔츠', 3, 1)
+        self.create_log('셔츠', 5, 1)
+        self.create_log('바지', 0, 1)
+        self.create_log('모자', 0, 1, days_ago=1)
+        day = timezone.localdate()
+
+        top = SearchAnalyticsService.get_top_queries(day)
+        zero = SearchAnalyticsService.get_top_queries(day, zero_result_only=True)
+
+        assert [(row['query'], row['search_count']) for row in top] == [('셔츠', 2), ('바지', 1)]
+        assert [row['query'] for row in zero] == ['바지']
+
+    def test_admin_report(self) -> None:
+        self.create_log('바지', 0, 1)
+        self.client.force_login(self.admin_user)
+
+        response = self.client.get(reverse('admin-search-analytics'), {'date': 'not-a-date'})
+
+        assert response.status_code == 200
+        assert response.context['day'] == timezone.localdate()
+        assert [row['query'] for row in response.context['zero_result_queries']] == ['바지']
+
+    def test_admin_report_requires_admin(self) -> None:
+        self.client.force_login(self.customer_user)
+
+        response = self.client.get(reverse('admin-search-analytics'))
+
+        assert response.status_code != 200
+
+    def test_flush_command_drains_queue(self) -> None:
+        for _ in range(3):
+            SearchAnalyticsService.record('셔츠', 1, 1.0, 'cache')
+        SearchAnalyticsService.flush_buffer()
+        out = StringIO()
+
+        call_command('flush_search_logs', '--batch-size', '2', stdout=out)
+
+        assert SearchQueryLog.objects.count() == 3
+        assert 'Saved 3 search logs in total' in out.getvalue()
@@ -0,0 +1,118 @@
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache as django_cache
+from django.urls import reverse
+from django_redis import get_redis_connection
+
+from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
+from products.services.search_cache import (
+    SEARCH_CACHE_STALE_AFTER_WRITE,
+    SEARCH_CACHE_TTL_TIERS,
+    SearchResultCacheService,
+)
+from products.utils.elasticsearch.elastic_search import (
+    bulk_delete_products_from_index,
+    bump_search_generation,
+    get_search_generation,
+    mark_search_index_written,
+)
+
+
+def es_result(ids: List[int]) -> Dict[str, Any]:
+    return {'ids': ids, 'total': len(ids), 'search_after': None, 'facets': None}
+
+
+@pytest.mark.django_db
+class TestSearchResultCache(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.products = [
+            Product.objects.create(
+                user=self.admin_user, name=f'원피스 {index}', description='', price=10000, stock=1, is_live=True
+            )
+            for index in range(2)
+        ]
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_repeated_query_is_served_from_cache(self, mock_search: Any) -> None:
+        mock_search.return_value = es_result([self.products[1].id, self.products[0].id])
+
+        first = self.client.get(reverse('customer-product-list'), {'search': '원피스'})
+        second = self.client.get(reverse('customer-product-list'), {'search': '  원피스 '})
+
+        assert mock_search.call_count == 1
+        assert mock_search.call_args.args[0] == '원피스'
+        assert (
+            [listing.id for listing in second.context['products']]
+            == [listing.id for listing in first.context['products']]
+            == [product.id for product in self.products[::-1]]
+        )
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_sort_and_filters_use_separate_entries(self, mock_search: Any) -> None:
+        mock_search.return_value = es_result([self.products[0].id])
+
+        self.client.get(reverse('customer-product-list'), {'search': '원피스'})
+        self.client.get(reverse('customer-product-list'), {'search': '원피스', 'sort': 'newest'})
+        self.client.get(reverse('customer-product-list'), {'search': '원피스', 'color': ['화이트', '블랙']})
+        self.client.get(reverse('customer-product-list'), {'search': '원피스', 'color': ['블랙', '화이트']})
+
+        assert mock_search.call_count == 3
+
+    @patch('products.services.product_listing.search_products_page')
+    def test_generation_bump_invalidates_results(self, mock_search: Any) -> None:
+        mock_search.return_value = es_result([self.products[0].id])
+        self.client.get(reverse('customer-product-list'), {'search': '원피스'})
+
+        bump_search_generation()
+        mock_search.return_value = es_result([self.products[1].id])
+        response = self.client.get(reverse('customer-product-list'), {'search': '원피스'})
+
+        assert mock_search.call_count == 2
+        assert [listing.id for listing in response.context['products']] == [self.products[1].id]
+
+    @patch(
+        'products.utils.elasticsearch.elastic_search.helpers.streaming_bulk',
+        return_value=iter([(True, {'delete': {'_id': '1', 'status': 200}})]),
+    )
+    def test_incremental_writes_only_shorten_cache_lifetime(self, mock_bulk: Any) -> None:
+        generation = get_search_generation()
+        cache_key = SearchResultCacheService.make_key('원피스', 'relevance', None, 24, [], True)
+        SearchResultCacheService.set(cache_key, es_result([self.products[0].id]), hit_count=100)
+
+        bulk_delete_products_from_index([self.products[0].id])
+
+        # 증분 색인은 세대를 올리지 않으므로 방금 만든 결과는 그대로 쓴다
+        assert get_search_generation() == generation
+        assert SearchResultCacheService.get(cache_key) == es_result([self.products[0].id])
+
+        # 색인 이전에 만든 결과는 허용 시간이 지나면 다시 조회한다
+        later = time.time() + SEARCH_CACHE_STALE_AFTER_WRITE + 1
+        with patch('products.services.search_cache.time.time', return_value=later):
+            assert SearchResultCacheService.get(cache_key) is None
+
+    def test_results_cached_after_write_keep_their_ttl(self) -> None:
+        mark_search_index_written()
+        cache_key = SearchResultCacheService.make_key('원피스', 'relevance', None, 24, [], True)
+        SearchResultCacheService.set(cache_key, es_result([]), hit_count=100)
+
+        later = time.time() + SEARCH_CACHE_STALE_AFTER_WRITE + 1
+        with patch('products.services.search_cache.time.time', return_value=later):
+            assert SearchResultCacheService.get(cache_key) == es_result([])
+
+    def test_popular_queries_get_longer_ttl(self) -> None:
+        assert [SearchResultCacheService.get_timeout(hits) for hits, _ in SEARCH_CACHE_TTL_TIERS] == [
+            timeout for _, timeout in SEARCH_CACHE_TTL_TIERS
+        ]
+
+        for _ in range(5):
+            hit_count = SearchResultCacheService.record_hit('원피스')
+        cache_key = SearchResultCacheService.make_key('원피스', 'relevance', None, 24, [], True)
+        SearchResultCacheService.set(cache_key, es_result([]), hit_count)
+
+        ttl = get_redis_connection('default').ttl(django_cache.make_key(cache_key))
+        assert ttl > SearchResultCacheService.get_timeout(0)
@@ -0,0 +1,103 @@
+from io import StringIO
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+from elasticsearch import NotFoundError
+
+from config.utils.setup_test_method import TestSetupMixin
+from products.utils.elasticsearch.elastic_search import (
+    CATEGORY_SYNONYM_SET,
+    COLOR_SYNONYM_SET,
+    create_product_index_version,
+    get_product_index_body,
+    get_search_generation,
+)
+from products.utils.elasticsearch.elastic_services import ElasticSearchService
+
+
+def not_found() -> NotFoundError:
+    meta = ApiResponseMeta(
+        status=404, http_version='1.1', headers=HttpHeaders(), duration=0.0, node=NodeConfig('http', 'localhost', 9200)
+    )
+    return NotFoundError('missing', meta=meta, body={})
+
+
+@pytest.mark.django_db
+class TestSearchSynonyms(TestSetupMixin):
+    def test_synonyms_are_applied_only_at_search_time(self) -> None:
+        body = get_product_index_body()
+        filters = body['settings']['analysis']['filter']
+        properties = body['mappings']['properties']
+
+        assert filters['category_synonym_filter'] == {
+            'type': 'synonym', 'synonyms_set': CATEGORY_SYNONYM_SET, 'updateable': True,
+        }
+        assert filters['color_synonym_filter']['synonyms_set'] == COLOR_SYNONYM_SET
+        assert properties['categories']['fields']['text']['search_analyzer'] == 'category_analyzer'
+        assert properties['colors']['fields']['text']['search_analyzer'] == 'color_analyzer'
+        assert properties['name']['fields']['synonym']['analyzer'] == 'korean_analyzer'
+
+        synonym_analyzers = {
+            name for name, analyzer in body['settings']['analysis']['analyzer'].items()
+            if {'category_synonym_filter', 'color_synonym_filter'} & set(analyzer.get('filter', []))
+        }
+        index_analyzers = {
+            field.get('analyzer')
+            for mapping in properties.values()
+            for field in [mapping, *mapping.get('fields', {}).values()]
+        }
+        assert not synonym_analyzers & index_analyzers
+
+    def test_synonym_file_lines_become_rules(self) -> None:
+        rules = ElasticSearchService.build_synonym_rules(['black,블랙', 'white,화이트'])
+
+        assert rules == [{'id': 'rule-1', 'synonyms': 'black,블랙'}, {'id': 'rule-2', 'synonyms': 'white,화이트'}]
+
+    @patch('products.utils.elasticsearch.elastic_search.get_product_index_body', return_value={})
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_new_index_creates_only_missing_sets(self, mock_client: Any, mock_body: Any) -> None:
+        mock_client.indices.get.return_value = {}
+
+        def get_synonym(id: str, size: int) -> dict[str, Any]:
+            if id == COLOR_SYNONYM_SET:
+                raise not_found()
+            return {}
+
+        mock_client.synonyms.get_synonym.side_effect = get_synonym
+
+        create_product_index_version()
+
+        assert [call.kwargs['id'] for call in mock_client.synonyms.put_synonym.call_args_list] == [COLOR_SYNONYM_SET]
+        rules = mock_client.synonyms.put_synonym.call_args.kwargs['synonyms_set']
+        assert {'id': 'rule-1', 'synonyms': 'black,블랙,검정,검은색,다크'} in rules
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_sync_command_updates_sets_and_invalidates_cache(self, mock_client: Any) -> None:
+        mock_client.synonyms.put_synonym.return_value = {
+            'result': 'updated',
+            'reload_analyzers_details': {'reload_details': [{'index': 'seoseung-soo-products-v2'}]},
+        }
+        generation = get_search_generation()
+        out = StringIO()
+
+        call_command('sync_search_synonyms', stdout=out)
+
+        assert mock_client.synonyms.put_synonym.call_count == 2
+        assert get_search_generation() == generation + 1
+        assert f'Updated {CATEGORY_SYNONYM_SET} (updated), reloaded seoseung-soo-products-v2' in out.getvalue()
+        mock_client.indices.create.assert_not_called()
+
+    @patch('products.utils.elasticsearch.elastic_search.es_client')
+    def test_reload_only(self, mock_client: Any) -> None:
+        mock_client.indices.reload_search_analyzers.return_value = {
+            'reload_details': [{'index': 'seoseung-soo-products-v2'}],
+        }
+        out = StringIO()
+
+        call_command('sync_search_synonyms', '--reload-only', stdout=out)
+
+        mock_client.synonyms.put_synonym.assert_not_called()
+        assert 'Reloaded search analyzers on seoseung-soo-products-v2' in out.getvalue()
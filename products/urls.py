@@ -13,7 +13,9 @@ from products.views.admin.product_size_views import (
     AdminSizeDeleteView,
     AdminSizeUpdateView,
 )
-from products.views.customers.product_list import ProductListView
+from products.views.admin.search_analytics import AdminSearchAnalyticsView
+from products.views.customers.product_list import ProductListMoreView, ProductListView
+from products.views.customers.product_suggest import ProductSuggestView
 from products.views.products_detail import ProductsDetailView
 
 urlpatterns = [
@@ -29,5 +31,8 @@ urlpatterns = [
     path("admin/size/", AdminProductSizeView.as_view(), name="admin-product-size"),
     path("admin/size/<int:pk>/update/", AdminSizeUpdateView.as_view(), name="admin-size-update"),
     path("admin/size/<int:pk>/delete/", AdminSizeDeleteView.as_view(), name="admin-size-delete"),
+    path("admin/search-analytics/", AdminSearchAnalyticsView.as_view(), name="admin-search-analytics"),
     path("list/", ProductListView.as_view(), name="customer-product-list"),
+    path("list/more/", ProductListMoreView.as_view(), name="customer-product-list-more"),
+    path("suggest/", ProductSuggestView.as_view(), name="product-suggest"),
 ]
\ No newline at end of file
@@ -0,0 +1,27 @@
+from typing import Iterable, List
+
+from config.utils.cache_helper import CacheHelper
+
+# 상품에서 파생된 캐시에 다는 태그. 상품 하나만 보여 주는 캐시는 product:<id>, 목록/집계 캐시는 catalog 를 단다
+CATALOG_TAG = 'catalog'
+
+
+def product_tag(product_id: int) -> str:
+    return f'product:{product_id}'
+
+
+def category_tag(category_id: int) -> str:
+    return f'category:{category_id}'
+
+
+def product_tags(product_ids: Iterable[int]) -> List[str]:
+    return [product_tag(product_id) for product_id in product_ids]
+
+
+def invalidate_products(product_ids: Iterable[int]) -> None:
+    # 상품이 하나라도 바뀌면 그 상품이 들어갈 수 있는 목록 캐시도 함께 버린다
+    CacheHelper.bump_tags_on_commit([*product_tags(product_ids), CATALOG_TAG])
+
+
+def invalidate_categories(category_ids: Iterable[int]) -> None:
+    CacheHelper.bump_tags_on_commit([*(category_tag(category_id) for category_id in category_ids), CATALOG_TAG])
@@ -1,46 +1,48 @@
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from django.http import HttpRequest
 from django.utils import timezone
 
 from config.utils.cache_helper import CacheHelper
-from products.models import Product
+from config.utils.local_cache import LocalCache
+from products.models import ProductListing
+from products.utils.cache_tags import CATALOG_TAG
 
 NEW_PRODUCT_PERIOD_DAYS = 30
 NEW_PRODUCT_LIMIT = 10
-NEW_PRODUCT_CACHE_TIMEOUT = 300
+# 상품이 바뀌면 catalog 태그로 바로 무효화되므로 길게 둔다. 30일이 지난 상품이 빠지는 것만 이 주기를 따른다
+NEW_PRODUCT_CACHE_TIMEOUT = 60 * 60
+NEW_PRODUCT_CACHE_KEY = 'product:new:list'
 
 
-def new_products_context(request: HttpRequest) -> Dict[str, Any]:
-    cache_key = 'product:new:list'
-    
-    product_ids = CacheHelper.get(cache_key)
-    
-    if product_ids is None:
-        one_month_ago = timezone.now() - timedelta(days=NEW_PRODUCT_PERIOD_DAYS)
-        
-        products = Product.objects.filter(
+def get_new_product_ids() -> List[int]:
+    one_month_ago = timezone.now() - timedelta(days=NEW_PRODUCT_PERIOD_DAYS)
+
+    return list(
+        ProductListing.objects.filter(
             created_at__gte=one_month_ago,
             is_live=True,
             is_sold=False
-        ).order_by('-created_at')[:NEW_PRODUCT_LIMIT]
-        
-        product_ids = [product.id for product in products]
-        
-        CacheHelper.set(cache_key, product_ids, NEW_PRODUCT_CACHE_TIMEOUT)
-    
-    if product_ids:
-        products_dict = {
-            p.id: p for p in Product.objects.filter(
-                id__in=product_ids
-            ).prefetch_related('colors', 'image')
-        }
-        new_products = [products_dict[pid] for pid in product_ids if pid in products_dict]
-    else:
-        new_products = []
-    
+        ).order_by('-created_at').values_list('id', flat=True)[:NEW_PRODUCT_LIMIT]
+    )
+
+
+def get_new_products() -> List[ProductListing]:
+    product_ids = CacheHelper.get_or_set(
+        CacheHelper.make_tagged_key(NEW_PRODUCT_CACHE_KEY, [CATALOG_TAG]),
+        get_new_product_ids,
+        NEW_PRODUCT_CACHE_TIMEOUT,
+    )
+    if not product_ids:
+        return []
+
+    products_dict = {p.id: p for p in ProductListing.objects.filter(id__in=product_ids)}
+    return [products_dict[pid] for pid in product_ids if pid in products_dict]
+
+
+def new_products_context(request: HttpRequest) -> Dict[str, Any]:
+    # Redis 에는 상품 ID 만 두고, 워커 메모리에는 조회한 상품 객체까지 둔다
     return {
-        'new_products': new_products
+        'new_products': LocalCache.get_or_set(NEW_PRODUCT_CACHE_KEY, get_new_products, tags=[CATALOG_TAG])
     }
-
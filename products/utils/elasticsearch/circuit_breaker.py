@@ -0,0 +1,82 @@
+import logging
+import time
+from typing import Optional
+
+from elastic_transport import TransportError
+from elasticsearch import ApiError
+
+from config.utils.cache_helper import CacheHelper
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_FAILURE_WINDOW = 30
+CIRCUIT_OPEN_SECONDS = 30
+CIRCUIT_PROBE_TIMEOUT = 10
+
+CIRCUIT_FAILURES_KEY = 'products:es:circuit:failures'
+CIRCUIT_OPENED_AT_KEY = 'products:es:circuit:opened_at'
+CIRCUIT_PROBE_KEY = 'products:es:circuit:probe'
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class ElasticSearchCircuitBreaker:
+    """모든 워커가 Redis 로 상태를 공유하는 Elasticsearch 서킷 브레이커"""
+
+    @staticmethod
+    def is_failure(error: Exception) -> bool:
+        # 연결 실패/타임아웃과 ES 서버 오류만 장애로 센다 (잘못된 쿼리 같은 4xx 는 제외)
+        if isinstance(error, TransportError):
+            return True
+        return isinstance(error, ApiError) and (error.meta.status >= 500 or error.meta.status == 429)
+
+    @staticmethod
+    def get_state() -> str:
+        opened_at: Optional[float] = CacheHelper.get(CIRCUIT_OPENED_AT_KEY)
+        if opened_at is None:
+            return CLOSED
+        if time.time() - opened_at < CIRCUIT_OPEN_SECONDS:
+            return OPEN
+        return HALF_OPEN
+
+    @staticmethod
+    def before_request() -> str:
+        state = ElasticSearchCircuitBreaker.get_state()
+        if state == OPEN:
+            raise CircuitOpenError('Elasticsearch 서킷이 열려 있습니다')
+        # 반쯤 열린 상태에서는 한 워커만 시험 요청을 보내고 나머지는 바로 대체 경로로 간다
+        if state == HALF_OPEN and not CacheHelper.add(CIRCUIT_PROBE_KEY, 1, timeout=CIRCUIT_PROBE_TIMEOUT):
+            raise CircuitOpenError('Elasticsearch 복구 확인 중입니다')
+        return state
+
+    @staticmethod
+    def record_success(state: str) -> None:
+        if state == HALF_OPEN:
+            logger.info("[ElasticSearchCircuitBreaker] 서킷을 닫습니다")
+            CacheHelper.delete(CIRCUIT_OPENED_AT_KEY)
+            CacheHelper.delete(CIRCUIT_FAILURES_KEY)
+            CacheHelper.delete(CIRCUIT_PROBE_KEY)
+
+    @staticmethod
+    def record_failure(state: str) -> None:
+        if state == HALF_OPEN:
+            ElasticSearchCircuitBreaker.open()
+            return
+
+        failures = CacheHelper.incr(CIRCUIT_FAILURES_KEY, timeout=CIRCUIT_FAILURE_WINDOW)
+        if failures >= CIRCUIT_FAILURE_THRESHOLD:
+            ElasticSearchCircuitBreaker.open()
+
+    @staticmethod
+    def open() -> None:
+        logger.warning("[ElasticSearchCircuitBreaker] 서킷을 엽니다")
+        CacheHelper.set(CIRCUIT_OPENED_AT_KEY, time.time())
+        CacheHelper.delete(CIRCUIT_FAILURES_KEY)
+        CacheHelper.delete(CIRCUIT_PROBE_KEY)
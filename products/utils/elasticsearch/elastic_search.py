@@ -1,37 +1,104 @@
-from typing import Any, Dict, List
+import time
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
+import urllib3
+from django.utils.functional import SimpleLazyObject
+from elastic_transport import NodeConfig, Urllib3HttpNode
 from elasticsearch import Elasticsearch, helpers
 from elasticsearch.exceptions import NotFoundError
 
 from config import settings
+from config.utils.cache_helper import CacheHelper
+from products.utils.elasticsearch.circuit_breaker import ElasticSearchCircuitBreaker
 from products.utils.elasticsearch.elastic_services import ElasticSearchService
 
-es_client = Elasticsearch(
-    settings.ES_HOST,
-    api_key=settings.ES_API_KEY,
-)
 
+class TimeoutHttpNode(Urllib3HttpNode):
+    def __init__(self, config: NodeConfig) -> None:
+        super().__init__(config)
+        # 기본 노드는 전체 타임아웃 하나만 쓰므로, 연결이 안 될 때 빨리 포기하도록 연결/읽기를 나눈다
+        self.pool.timeout = urllib3.Timeout(connect=settings.ES_CONNECT_TIMEOUT, read=settings.ES_READ_TIMEOUT)
+
+
+def create_es_client() -> Elasticsearch:
+    return Elasticsearch(
+        settings.ES_HOST,
+        api_key=settings.ES_API_KEY,
+        node_class=TimeoutHttpNode,
+        connections_per_node=settings.ES_CONNECTIONS_PER_NODE,
+        max_retries=1,
+        retry_on_timeout=False,
+    )
+
+
+# import 시점이 아니라 첫 사용 시 만들어, 워커가 fork 된 뒤 각자의 커넥션 풀을 갖게 한다
+es_client = cast(Elasticsearch, SimpleLazyObject(create_es_client))
+
+# 읽기/쓰기 별칭. 실제 데이터는 "seoseung-soo-products-v<N>" 물리 인덱스에 있다
 PRODUCT_INDEX_NAME = "seoseung-soo-products"
+BUILDING_INDEX_KEY = "products:index:building"
+BUILDING_INDEX_TIMEOUT = 60 * 60 * 6
+# 별칭 교체, 전체 재색인, 동의어 갱신 때 올려서 이전 세대의 검색 결과 캐시를 모두 버린다
+SEARCH_GENERATION_KEY = "products:search:generation"
+# 상품 단위 색인/삭제 시각. 이보다 먼저 만든 검색 결과 캐시는 짧은 시간만 더 쓴다 (SearchResultCacheService)
+SEARCH_INDEX_WRITTEN_KEY = "products:search:index_written_at"
 
+# 검색 분석기가 참조하는 동의어 세트. 기본값은 es_data/ 파일에서 읽어 온다
+CATEGORY_SYNONYM_SET = "seoseung-soo-category-synonyms"
+COLOR_SYNONYM_SET = "seoseung-soo-color-synonyms"
 
-def create_product_index(force_reset: bool = False) -> None:
-    category_synonyms = ElasticSearchService.load_category_synonyms()
-    color_synonyms = ElasticSearchService.load_color_synonyms()
-    
-    index_mapping = {
+# 동점일 때 search_after 위치가 흔들리지 않도록 항상 id 를 마지막 정렬 기준으로 둔다
+SEARCH_SORT_OPTIONS: Dict[str, List[Dict[str, Any]]] = {
+    "relevance": [{"_score": {"order": "desc"}}, {"id": {"order": "desc"}}],
+    "newest": [{"created_at": {"order": "desc"}}, {"id": {"order": "desc"}}],
+    "price_low": [{"effective_price": {"order": "asc", "unmapped_type": "float"}}, {"id": {"order": "asc"}}],
+    "price_high": [{"effective_price": {"order": "desc", "unmapped_type": "float"}}, {"id": {"order": "desc"}}],
+}
+DEFAULT_SEARCH_SORT = "relevance"
+
+FACET_TERMS_SIZE = 30
+AUTOCOMPLETE_MAX_GRAM = 20
+PRICE_HISTOGRAM_INTERVAL = 10000
+
+
+def get_product_index_body() -> Dict[str, Any]:
+    return {
         "settings": {
             "analysis": {
                 "filter": {
+                    # 동의어는 색인 시점이 아니라 검색 시점에만 확장하므로 세트만 갱신하면 재색인 없이 반영된다
                     "category_synonym_filter": {
                         "type": "synonym",
-                        "synonyms": category_synonyms,
+                        "synonyms_set": CATEGORY_SYNONYM_SET,
+                        "updateable": True,
                     },
                     "color_synonym_filter": {
                         "type": "synonym",
-                        "synonyms": color_synonyms,
+                        "synonyms_set": COLOR_SYNONYM_SET,
+                        "updateable": True,
+                    },
+                    "autocomplete_edge_filter": {
+                        "type": "edge_ngram",
+                        "min_gram": 1,
+                        "max_gram": AUTOCOMPLETE_MAX_GRAM,
+                    }
+                },
+                "tokenizer": {
+                    "autocomplete_tokenizer": {
+                        "type": "edge_ngram",
+                        "min_gram": 1,
+                        "max_gram": AUTOCOMPLETE_MAX_GRAM,
+                        "token_chars": ["letter", "digit"],
                     }
                 },
                 "analyzer": {
+                    "keyword_lowercase_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "keyword",
+                        "filter": ["lowercase"]
+                    },
                     "category_analyzer": {
                         "type": "custom",
                         "tokenizer": "keyword",
@@ -55,6 +122,27 @@ def create_product_index(force_reset: bool = False) -> None:
                     "korean_analyzer": {
                         "type": "standard",
                         "filter": ["lowercase"]
+                    },
+                    # 자동완성: 색인할 때만 접두어 토큰을 만들고, 검색어는 그대로 비교한다
+                    "autocomplete_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "autocomplete_tokenizer",
+                        "filter": ["lowercase"]
+                    },
+                    "autocomplete_search_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "standard",
+                        "filter": ["lowercase"]
+                    },
+                    "autocomplete_keyword_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "keyword",
+                        "filter": ["lowercase", "autocomplete_edge_filter"]
+                    },
+                    "autocomplete_keyword_search_analyzer": {
+                        "type": "custom",
+                        "tokenizer": "keyword",
+                        "filter": ["lowercase"]
                     }
                 }
             }
@@ -66,31 +154,58 @@ def create_product_index(force_reset: bool = False) -> None:
                     "type": "text",
                     "analyzer": "korean_analyzer",
                     "fields": {
-                        "synonym": {"type": "text", "analyzer": "text_with_synonym_analyzer"}
+                        "synonym": {
+                            "type": "text",
+                            "analyzer": "korean_analyzer",
+                            "search_analyzer": "text_with_synonym_analyzer",
+                        },
+                        "autocomplete": {
+                            "type": "text",
+                            "analyzer": "autocomplete_analyzer",
+                            "search_analyzer": "autocomplete_search_analyzer",
+                        },
                     }
                 },
                 "description": {
                     "type": "text",
                     "analyzer": "korean_analyzer",
                     "fields": {
-                        "synonym": {"type": "text", "analyzer": "text_with_synonym_analyzer"}
+                        "synonym": {
+                            "type": "text",
+                            "analyzer": "korean_analyzer",
+                            "search_analyzer": "text_with_synonym_analyzer",
+                        }
                     }
                 },
                 "price": {"type": "float"},
                 "sale_price": {"type": "float"},
+                "effective_price": {"type": "float"},
                 "stock": {"type": "integer"},
                 "is_live": {"type": "boolean"},
                 "is_sold": {"type": "boolean"},
                 "categories": {
                     "type": "keyword",
                     "fields": {
-                        "text": {"type": "text", "analyzer": "category_analyzer"}
+                        "text": {
+                            "type": "text",
+                            "analyzer": "keyword_lowercase_analyzer",
+                            "search_analyzer": "category_analyzer",
+                        },
+                        "autocomplete": {
+                            "type": "text",
+                            "analyzer": "autocomplete_keyword_analyzer",
+                            "search_analyzer": "autocomplete_keyword_search_analyzer",
+                        },
                     }
                 },
                 "colors": {
                     "type": "keyword",
                     "fields": {
-                        "text": {"type": "text", "analyzer": "color_analyzer"}
+                        "text": {
+                            "type": "text",
+                            "analyzer": "keyword_lowercase_analyzer",
+                            "search_analyzer": "color_analyzer",
+                        }
                     }
                 },
                 "created_at": {"type": "date"},
@@ -98,98 +213,421 @@ def create_product_index(force_reset: bool = False) -> None:
             }
         }
     }
-    
-    if not es_client.indices.exists(index=PRODUCT_INDEX_NAME):
-        es_client.indices.create(index=PRODUCT_INDEX_NAME, body=index_mapping)
-    elif force_reset:
-        try:
-            es_client.indices.delete(index=PRODUCT_INDEX_NAME)
-        except NotFoundError:
-            pass  # 인덱스가 존재하지 않으므로 무시
-        es_client.indices.create(index=PRODUCT_INDEX_NAME, body=index_mapping)
-        
-
-
-def bulk_index_products(products: Any, reset_index: bool = False) -> tuple[int, int]:
-    create_product_index(force_reset=reset_index)
-    actions = []
-    for product in products:
-        doc = {
-            "_index": PRODUCT_INDEX_NAME,
-            "_id": product.id,
-            "_source": {
-                "id": product.id,
-                "name": product.name,
-                "description": product.description,
-                "price": float(product.price),
-                "sale_price": float(product.sale_price) if product.sale_price else None,
-                "stock": product.stock,
-                "is_live": product.is_live,
-                "is_sold": product.is_sold,
-                "categories": [cat.name for cat in product.categories.all()],
-                "colors": [color.name for color in product.colors.all()],
-                "created_at": product.created_at.isoformat(),
-                "updated_at": product.updated_at.isoformat(),
+
+
+
+def get_product_index_versions() -> Dict[str, int]:
+    indices = es_client.indices.get(index=f"{PRODUCT_INDEX_NAME}-v*")
+    versions = {}
+    for index_name in indices:
+        version = index_name.rsplit("-v", 1)[-1]
+        if version.isdigit():
+            versions[index_name] = int(version)
+    return versions
+
+
+def get_aliased_product_indices() -> List[str]:
+    try:
+        return list(es_client.indices.get_alias(name=PRODUCT_INDEX_NAME))
+    except NotFoundError:
+        return []
+
+
+def get_synonym_set_sources() -> Dict[str, List[str]]:
+    return {
+        CATEGORY_SYNONYM_SET: ElasticSearchService.load_category_synonyms(),
+        COLOR_SYNONYM_SET: ElasticSearchService.load_color_synonyms(),
+    }
+
+
+def synonym_set_exists(set_id: str) -> bool:
+    try:
+        es_client.synonyms.get_synonym(id=set_id, size=1)
+    except NotFoundError:
+        return False
+    return True
+
+
+def put_synonym_set(set_id: str, synonyms: List[str]) -> Dict[str, Any]:
+    # 세트를 갱신하면 ES 가 이를 쓰는 모든 인덱스의 검색 분석기를 그 자리에서 다시 읽는다
+    response = es_client.synonyms.put_synonym(
+        id=set_id, synonyms_set=ElasticSearchService.build_synonym_rules(synonyms)
+    )
+    return dict(response)
+
+
+def ensure_synonym_sets() -> None:
+    # 운영 중에 갱신한 세트를 인덱스를 새로 만들 때 파일 내용으로 되돌리지 않도록 없을 때만 만든다
+    for set_id, synonyms in get_synonym_set_sources().items():
+        if not synonym_set_exists(set_id):
+            put_synonym_set(set_id, synonyms)
+
+
+def sync_synonym_sets() -> Dict[str, Dict[str, Any]]:
+    results = {
+        set_id: put_synonym_set(set_id, synonyms)
+        for set_id, synonyms in get_synonym_set_sources().items()
+    }
+    # 이전 동의어로 만든 검색 결과 캐시를 버린다
+    bump_search_generation()
+    return results
+
+
+def reload_search_analyzers() -> Dict[str, Any]:
+    return dict(es_client.indices.reload_search_analyzers(index=PRODUCT_INDEX_NAME))
+
+
+def create_product_index_version() -> str:
+    # 검색은 항상 별칭으로 하고, 재색인은 새 버전의 물리 인덱스에 만든 뒤 별칭을 옮긴다
+    ensure_synonym_sets()
+    next_version = max(get_product_index_versions().values(), default=0) + 1
+    index_name = f"{PRODUCT_INDEX_NAME}-v{next_version}"
+    es_client.indices.create(index=index_name, body=get_product_index_body())
+    return index_name
+
+
+def create_product_index(force_reset: bool = False) -> None:
+    # force_reset 은 빈 새 버전으로 별칭을 바로 옮긴다. 무중단 재색인은 index_products --force 를 사용한다
+    if force_reset or not es_client.indices.exists(index=PRODUCT_INDEX_NAME):
+        swap_product_index_alias(create_product_index_version())
+
+
+def swap_product_index_alias(index_name: str) -> None:
+    actions: List[Dict[str, Any]] = [
+        {"remove": {"index": f"{PRODUCT_INDEX_NAME}-v*", "alias": PRODUCT_INDEX_NAME, "must_exist": False}},
+        {"add": {"index": index_name, "alias": PRODUCT_INDEX_NAME, "is_write_index": True}},
+    ]
+    # 별칭 도입 전의 단일 인덱스가 같은 이름으로 남아 있으면 같은 요청에서 제거해 공백 없이 전환한다
+    if es_client.indices.exists(index=PRODUCT_INDEX_NAME) and not es_client.indices.exists_alias(
+        name=PRODUCT_INDEX_NAME
+    ):
+        actions.insert(0, {"remove_index": {"index": PRODUCT_INDEX_NAME}})
+
+    es_client.indices.update_aliases(actions=actions)
+    bump_search_generation()
+
+
+def delete_old_product_indices(grace_period: timedelta) -> List[str]:
+    protected = set(get_aliased_product_indices())
+    building_index = CacheHelper.get(BUILDING_INDEX_KEY)
+    if building_index:
+        protected.add(building_index)
+
+    cutoff_ms = (time.time() - grace_period.total_seconds()) * 1000
+    deleted = []
+    for index_name, index_info in es_client.indices.get(index=f"{PRODUCT_INDEX_NAME}-v*").items():
+        created_ms = int(index_info["settings"]["index"]["creation_date"])
+        if index_name not in protected and created_ms < cutoff_ms:
+            es_client.indices.delete(index=index_name)
+            deleted.append(index_name)
+    return deleted
+
+
+def start_double_write(index_name: str, timeout: int = BUILDING_INDEX_TIMEOUT) -> None:
+    CacheHelper.set(BUILDING_INDEX_KEY, index_name, timeout)
+
+
+def stop_double_write() -> None:
+    CacheHelper.delete(BUILDING_INDEX_KEY)
+
+
+def get_write_indices() -> List[str]:
+    # 재색인 중이면 증분 변경을 새로 만드는 인덱스에도 함께 써서 별칭 전환 시 누락을 막는다
+    building_index = CacheHelper.get(BUILDING_INDEX_KEY)
+    if building_index:
+        return [PRODUCT_INDEX_NAME, building_index]
+    return [PRODUCT_INDEX_NAME]
+
+
+def get_search_generation() -> int:
+    return int(CacheHelper.get(SEARCH_GENERATION_KEY, 0))
+
+
+def bump_search_generation() -> int:
+    return CacheHelper.incr(SEARCH_GENERATION_KEY)
+
+
+def mark_search_index_written() -> None:
+    CacheHelper.set(SEARCH_INDEX_WRITTEN_KEY, time.time())
+
+
+@lru_cache(maxsize=None)
+def ensure_product_index() -> bool:
+    # 증분 색인마다 인덱스 존재 여부를 묻지 않도록 프로세스당 한 번만 확인한다 (실패하면 캐시되지 않는다)
+    create_product_index()
+    return True
+
+
+INDEX_CHUNK_SIZE = 500
+
+
+def product_index_action(product: Any, index_name: str = PRODUCT_INDEX_NAME) -> Dict[str, Any]:
+    return {
+        "_index": index_name,
+        "_id": product.id,
+        "_source": {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "price": float(product.price),
+            "sale_price": float(product.sale_price) if product.sale_price else None,
+            "effective_price": float(product.effective_price),
+            "stock": product.stock,
+            "is_live": product.is_live,
+            "is_sold": product.is_sold,
+            "categories": [cat.name for cat in product.categories.all()],
+            "colors": [color.name for color in product.colors.all()],
+            "created_at": product.created_at.isoformat(),
+            "updated_at": product.updated_at.isoformat(),
+        }
+    }
+
+
+def stream_index_products(
+    products: Iterable[Any],
+    chunk_size: int = INDEX_CHUNK_SIZE,
+    thread_count: int = 1,
+    index_name: str = PRODUCT_INDEX_NAME,
+) -> Iterator[Tuple[bool, int]]:
+    # 전체 actions 목록을 메모리에 만들지 않고 chunk 단위로 보내며, 상품별 (성공 여부, ID)를 순서대로 돌려준다
+    actions = (product_index_action(product, index_name) for product in products)
+    # 검색용 짧은 읽기 타임아웃 대신 대량 요청에 맞는 타임아웃을 쓴다
+    bulk_client = es_client.options(request_timeout=settings.ES_BULK_TIMEOUT)
+    if thread_count > 1:
+        results = helpers.parallel_bulk(
+            bulk_client, actions, thread_count=thread_count, chunk_size=chunk_size, raise_on_error=False
+        )
+    else:
+        results = helpers.streaming_bulk(bulk_client, actions, chunk_size=chunk_size, raise_on_error=False)
+
+    for ok, item in results:
+        yield ok, int(item["index"]["_id"])
+
+
+def bulk_index_products(
+    products: Any, reset_index: bool = False, chunk_size: int = INDEX_CHUNK_SIZE, thread_count: int = 1
+) -> tuple[int, List[int]]:
+    if reset_index:
+        create_product_index(force_reset=True)
+    else:
+        ensure_product_index()
+
+    write_indices = get_write_indices()
+    if len(write_indices) > 1:
+        products = list(products)
+
+    success_count = 0
+    failed_ids: set[int] = set()
+    for index_name in write_indices:
+        for ok, product_id in stream_index_products(products, chunk_size, thread_count, index_name):
+            # 실패는 어느 인덱스에서든 다시 색인해야 하므로 모두 모으고, 성공 수는 별칭(현재 인덱스) 기준으로만 센다
+            if not ok:
+                failed_ids.add(product_id)
+            elif index_name == PRODUCT_INDEX_NAME:
+                success_count += 1
+
+    mark_search_index_written()
+    return success_count, sorted(failed_ids)
+
+
+def search_index(search_body: Dict[str, Any]) -> Any:
+    # 서킷이 열려 있으면 ES 를 기다리지 않고 CircuitOpenError 로 바로 대체 경로를 타게 한다
+    state = ElasticSearchCircuitBreaker.before_request()
+    try:
+        response = es_client.search(index=PRODUCT_INDEX_NAME, body=search_body)
+    except Exception as e:
+        if ElasticSearchCircuitBreaker.is_failure(e):
+            ElasticSearchCircuitBreaker.record_failure(state)
+        raise
+    ElasticSearchCircuitBreaker.record_success(state)
+    return response
+
+
+def build_search_query(query: str, filters: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    # 검색어 없이 패싯 필터만 걸린 경우에는 전체 상품을 대상으로 한다
+    must: Dict[str, Any] = {"match_all": {}}
+    if query:
+        must = {
+            "multi_match": {
+                "query": query,
+                "fields": [
+                    "name^5", "name.synonym^5",
+                    "description^3", "description.synonym^3",
+                    "categories.text^10",
+                    "colors.text^8"
+                ],
+                "type": "best_fields",
+                "analyzer": "text_with_color_synonym_analyzer",
+                "fuzziness": "AUTO",
             }
         }
-        actions.append(doc)
-    
-    if actions:
-        result = helpers.bulk(es_client, actions, raise_on_error=False)
-        if isinstance(result, tuple):
-            success, failed = result
-            failed_count = len(failed) if isinstance(failed, list) else 0
-            return success, failed_count
-        return len(actions), 0
-    
-    return 0, 0
-
-
-def search_products(query: str, limit: int = 100) -> List[Dict[str, Any]]:
-    if not query:
-        return []
-    
+
+    return {
+        "bool": {
+            "must": [must],
+            "filter": [
+                {"term": {"is_live": True}},
+                {"term": {"is_sold": False}},
+                *(filters or []),
+            ]
+        }
+    }
+
+
+def build_facet_filters(
+    category: Optional[str] = None,
+    colors: Optional[List[str]] = None,
+    price_min: Optional[int] = None,
+    price_max: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    filters: List[Dict[str, Any]] = []
+    if category:
+        filters.append({"term": {"categories": category}})
+    if colors:
+        filters.append({"terms": {"colors": colors}})
+    if price_min is not None or price_max is not None:
+        price_range: Dict[str, int] = {}
+        if price_min is not None:
+            price_range["gte"] = price_min
+        if price_max is not None:
+            price_range["lt"] = price_max
+        filters.append({"range": {"effective_price": price_range}})
+    return filters
+
+
+def parse_facets(aggregations: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    return {
+        "colors": [
+            {"value": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregations.get("colors", {}).get("buckets", [])
+        ],
+        "categories": [
+            {"value": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregations.get("categories", {}).get("buckets", [])
+        ],
+        "price": [
+            {
+                "from": int(bucket["key"]),
+                "to": int(bucket["key"]) + PRICE_HISTOGRAM_INTERVAL,
+                "range": f"{int(bucket['key'])}-{int(bucket['key']) + PRICE_HISTOGRAM_INTERVAL}",
+                "count": bucket["doc_count"],
+            }
+            for bucket in aggregations.get("price", {}).get("buckets", [])
+        ],
+    }
+
+
+def search_products_page(
+    query: str,
+    sort: str = DEFAULT_SEARCH_SORT,
+    search_after: Optional[List[Any]] = None,
+    size: int = 24,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    with_facets: bool = False,
+) -> Dict[str, Any]:
+    search_body: Dict[str, Any] = {
+        "query": build_search_query(query, filters),
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 가져온다
+        "size": size + 1,
+        "sort": SEARCH_SORT_OPTIONS.get(sort, SEARCH_SORT_OPTIONS[DEFAULT_SEARCH_SORT]),
+        "_source": False,
+        "track_total_hits": True,
+    }
+    if search_after:
+        search_body["search_after"] = search_after
+    if with_facets:
+        # 패싯 집계는 첫 페이지에서만 필요하므로 요청이 있을 때만 같은 요청에 포함한다
+        search_body["aggs"] = {
+            "colors": {"terms": {"field": "colors", "size": FACET_TERMS_SIZE}},
+            "categories": {"terms": {"field": "categories", "size": FACET_TERMS_SIZE}},
+            "price": {
+                "histogram": {
+                    "field": "effective_price",
+                    "interval": PRICE_HISTOGRAM_INTERVAL,
+                    "min_doc_count": 1,
+                }
+            },
+        }
+
+    # ES 장애는 호출하는 쪽에서 DB 검색으로 대체할 수 있도록 그대로 전파한다
+    response = search_index(search_body)
+    hits = response["hits"]["hits"]
+    page_hits = hits[:size]
+
+    return {
+        "ids": [int(hit["_id"]) for hit in page_hits],
+        "total": response["hits"]["total"]["value"],
+        "search_after": page_hits[-1]["sort"] if len(hits) > size else None,
+        "facets": parse_facets(response.get("aggregations", {})) if with_facets else None,
+    }
+
+
+def suggest_products(prefix: str, size: int = 8) -> Dict[str, List[Any]]:
+    # 입력 중인 접두어만 빠르게 비교하도록 fuzzy multi_match 대신 edge-ngram 필드만 조회한다
     search_body = {
         "query": {
             "bool": {
-                "must": [
-                    {
-                        "multi_match": {
-                            "query": query,
-                            "fields": [
-                                "name^5", "name.synonym^5",
-                                "description^3", "description.synonym^3",
-                                "categories.text^10",
-                                "colors.text^8"
-                            ],
-                            "type": "best_fields",
-                            "analyzer": "text_with_color_synonym_analyzer",
-                            "fuzziness": "AUTO",
-                        }
-                    }
+                "should": [
+                    {"match": {"name.autocomplete": {"query": prefix, "operator": "and"}}},
+                    {"match": {"categories.autocomplete": prefix}},
                 ],
+                "minimum_should_match": 1,
                 "filter": [
                     {"term": {"is_live": True}},
-                    {"term": {"is_sold": False}}
-                ]
+                    {"term": {"is_sold": False}},
+                ],
             }
         },
-        "size": limit,
-        "sort": [
-            {"created_at": {"order": "desc"}}
-        ]
+        "size": size,
+        "_source": ["name"],
+        "track_total_hits": False,
+        "aggs": {"categories": {"terms": {"field": "categories", "size": size}}},
+    }
+
+    response = search_index(search_body)
+    lowered_prefix = prefix.lower()
+
+    return {
+        "products": [
+            {"id": int(hit["_id"]), "name": hit["_source"]["name"]}
+            for hit in response["hits"]["hits"]
+        ],
+        # 집계에는 매칭된 상품의 다른 카테고리도 섞이므로 접두어로 시작하는 것만 남긴다
+        "categories": [
+            bucket["key"]
+            for bucket in response.get("aggregations", {}).get("categories", {}).get("buckets", [])
+            if bucket["key"].lower().startswith(lowered_prefix)
+        ],
     }
-    
-    try:
-        response = es_client.search(index=PRODUCT_INDEX_NAME, body=search_body)
-        product_ids = [hit["_source"]["id"] for hit in response["hits"]["hits"]]
-        return product_ids
-    except Exception:
-        return []
 
 
 def delete_product_from_index(product_id: int) -> None:
-    try:
-        es_client.delete(index=PRODUCT_INDEX_NAME, id=str(product_id))
-    except NotFoundError:
-        pass  # 문서 또는 인덱스가 존재하지 않으므로 무시
\ No newline at end of file
+    for index_name in get_write_indices():
+        try:
+            es_client.delete(index=index_name, id=str(product_id))
+        except NotFoundError:
+            pass  # 문서 또는 인덱스가 존재하지 않으므로 무시
+    mark_search_index_written()
+
+def bulk_delete_products_from_index(product_ids: List[int]) -> tuple[int, List[int]]:
+    actions = [
+        {"_op_type": "delete", "_index": index_name, "_id": product_id}
+        for index_name in get_write_indices()
+        for product_id in product_ids
+    ]
+    if not actions:
+        return 0, []
+
+    success_count = 0
+    failed_ids: set[int] = set()
+    results = helpers.streaming_bulk(
+        es_client.options(request_timeout=settings.ES_BULK_TIMEOUT), actions, raise_on_error=False
+    )
+    for ok, item in results:
+        # 이미 색인에 없는 문서(404)는 삭제된 것으로 간주한다
+        if ok or item["delete"].get("status") == 404:
+            success_count += 1
+        else:
+            failed_ids.add(int(item["delete"]["_id"]))
+    mark_search_index_written()
+    return success_count, sorted(failed_ids)
@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Any, Dict, List
 
 
 class ElasticSearchService:
@@ -21,4 +21,9 @@ class ElasticSearchService:
 
     @staticmethod
     def load_color_synonyms() -> List[str]:
-        return ElasticSearchService.load_synonyms("color_synonyms")
\ No newline at end of file
+        return ElasticSearchService.load_synonyms("color_synonyms")
+
+    @staticmethod
+    def build_synonym_rules(synonyms: List[str]) -> List[Dict[str, Any]]:
+        # 규칙 id 를 줄 내용 기준이 아닌 순번으로 두어, 파일을 고친 그대로 동의어 세트 전체를 덮어쓴다
+        return [{"id": f"rule-{index}", "synonyms": rule} for index, rule in enumerate(synonyms, start=1)]
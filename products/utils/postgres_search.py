@@ -0,0 +1,130 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import (
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    TextField,
+    Value,
+)
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Cast, Coalesce
+
+from products.models import Product
+
+T = TypeVar('T')
+
+# 한국어 형태소 사전이 없으므로 공백 기준 토큰을 그대로 쓰는 simple 설정을 사용한다
+SEARCH_CONFIG = 'simple'
+
+# Elasticsearch 의 필드 가중치(categories > colors > name > description)와 비슷한 순서로 둔다
+SEARCH_WEIGHTS = {
+    'categories': 'A',
+    'colors': 'B',
+    'name': 'B',
+    'description': 'C',
+}
+
+
+def _joined_names(through: Any, related_field: str) -> Subquery:
+    names = (
+        through.objects.filter(product_id=OuterRef('pk'))
+        .values('product_id')
+        .annotate(names=StringAgg(f'{related_field}__name', ' '))
+        .values('names')
+    )
+    return Subquery(names)
+
+
+def build_search_vector() -> CombinedExpression:
+    return (
+        SearchVector('name', config=SEARCH_CONFIG, weight=SEARCH_WEIGHTS['name'])
+        + SearchVector('description', config=SEARCH_CONFIG, weight=SEARCH_WEIGHTS['description'])
+        + SearchVector(
+            Coalesce(_joined_names(Product.categories.through, 'category'), Value(''), output_field=TextField()),
+            config=SEARCH_CONFIG,
+            weight=SEARCH_WEIGHTS['categories'],
+        )
+        + SearchVector(
+            Coalesce(_joined_names(Product.colors.through, 'color'), Value(''), output_field=TextField()),
+            config=SEARCH_CONFIG,
+            weight=SEARCH_WEIGHTS['colors'],
+        )
+    )
+
+
+def update_search_vectors(product_ids: Iterable[int]) -> None:
+    # 카테고리/색상 이름까지 한 번의 UPDATE 로 다시 계산한다 (update 는 시그널을 다시 발생시키지 않는다)
+    Product.objects.filter(id__in=list(product_ids)).update(search_vector=build_search_vector())
+
+
+def build_search_query(query: str) -> Optional[SearchQuery]:
+    # 입력 중인 단어도 찾을 수 있도록 각 토큰을 접두어 검색으로 바꾼다 ("티셔" -> 티셔츠)
+    tokens = re.findall(r'\w+', query.lower())
+    if not tokens:
+        return None
+    return SearchQuery(' & '.join(f'{token}:*' for token in tokens), config=SEARCH_CONFIG, search_type='raw')
+
+
+@lru_cache(maxsize=1)
+def is_trigram_available() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def search_queryset(queryset: QuerySet[Product], query: str) -> QuerySet[Product]:
+    """검색어와 전문 검색으로 일치하는 상품을 search_rank 로 주석 처리해 돌려준다"""
+    search_query = build_search_query(query)
+    if search_query is None:
+        return queryset.annotate(search_rank=Value(0.0)).none()
+
+    # ts_rank 는 real 을 돌려주므로 커서 값과 정확히 비교할 수 있도록 double precision 으로 바꾼다
+    return queryset.filter(search_vector=search_query).annotate(
+        search_rank=Cast(SearchRank(F('search_vector'), search_query), FloatField())
+    )
+
+
+def fuzzy_search_queryset(queryset: QuerySet[Product], query: str) -> QuerySet[Product]:
+    """전문 검색에 걸리지 않는 오타나 단어 중간 일치를 상품명 trigram 유사도(없으면 부분 문자열)로 찾는다"""
+    if is_trigram_available():
+        return queryset.filter(name__trigram_word_similar=query).annotate(
+            search_rank=Cast(TrigramWordSimilarity(query, 'name'), FloatField())
+        )
+
+    return queryset.filter(Q(name__icontains=query) | Q(description__icontains=query)).annotate(
+        search_rank=Value(0.0)
+    )
+
+
+def search_page(
+    queryset: QuerySet[Product],
+    query: str,
+    paginate: Callable[[QuerySet[Product]], Tuple[List[T], Optional[str]]],
+) -> Tuple[QuerySet[Product], List[T], Optional[str]]:
+    """전문 검색 결과로 페이지를 만들고, 페이지가 비었을 때만 같은 커서로 fuzzy_search_queryset 결과를 읽는다"""
+    matched = search_queryset(queryset, query)
+    if build_search_query(query) is None:
+        return matched, [], None
+
+    # 일치 여부를 EXISTS 로 따로 묻지 않고 실제 페이지 쿼리의 결과로 판단한다
+    page, next_cursor = paginate(matched)
+    if page:
+        return matched, page, next_cursor
+
+    matched = fuzzy_search_queryset(queryset, query)
+    page, next_cursor = paginate(matched)
+    return matched, page, next_cursor
@@ -1,5 +1,6 @@
 from typing import cast
 
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
@@ -32,18 +33,20 @@ class ProductCreateView(AdminPermission, View):
         image_form = ProductImageForm(request.POST, request.FILES)
         
         if form.is_valid() and image_form.is_valid():
-            product = form.save(commit=False)
-            product.user = cast(User, request.user)
-            product.save()
-            
-            form.save_m2m()
-            
-            images = request.FILES.getlist('image')
-            if images:
-                # TODO: i 변수를 사용하고 있지않음 확인 후 수정 필요
-                for i, image in enumerate(images):
-                    product_image = ProductImage.objects.create(image=image)
-                    product.image.add(product_image)
+            # 상품/M2M 변경과 검색 색인 아웃박스 기록을 한 트랜잭션으로 묶는다
+            with transaction.atomic():
+                product = form.save(commit=False)
+                product.user = cast(User, request.user)
+                product.save()
+                
+                form.save_m2m()
+                
+                images = request.FILES.getlist('image')
+                if images:
+                    # TODO: i 변수를 사용하고 있지않음 확인 후 수정 필요
+                    for i, image in enumerate(images):
+                        product_image = ProductImage.objects.create(image=image)
+                        product.image.add(product_image)
             
             return redirect('product-list')
         
@@ -82,14 +85,16 @@ class ProductUpdateView(AdminPermission, View):
         image_form = ProductImageForm(request.POST, request.FILES)
         
         if form.is_valid() and image_form.is_valid():
-            form.save()
-            
-            # 새 이미지 추가 (이미지가 있는 경우에만)
-            images = request.FILES.getlist('image')
-            if images:
-                for image in images:
-                    product_image = ProductImage.objects.create(image=image)
-                    product.image.add(product_image)
+            # 상품/M2M 변경과 검색 색인 아웃박스 기록을 한 트랜잭션으로 묶는다
+            with transaction.atomic():
+                form.save()
+                
+                # 새 이미지 추가 (이미지가 있는 경우에만)
+                images = request.FILES.getlist('image')
+                if images:
+                    for image in images:
+                        product_image = ProductImage.objects.create(image=image)
+                        product.image.add(product_image)
             
             return redirect('product-list')
         
@@ -0,0 +1,20 @@
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.views import View
+
+from products.services.search_analytics import SearchAnalyticsService
+from users.utils.permission import AdminPermission
+
+
+class AdminSearchAnalyticsView(AdminPermission, View):
+    def get(self, request: HttpRequest) -> HttpResponse:
+        day = SearchAnalyticsService.parse_day(request.GET.get('date'))
+        context = {
+            'title': '검색 분석',
+            'day': day,
+            'daily_stats': SearchAnalyticsService.get_daily_stats(),
+            'top_queries': SearchAnalyticsService.get_top_queries(day),
+            'zero_result_queries': SearchAnalyticsService.get_top_queries(day, zero_result_only=True),
+            'pending_count': SearchAnalyticsService.get_pending_count(),
+        }
+        return render(request, 'products/admin/admin_search_analytics.html', context)
@@ -1,45 +1,74 @@
-from django.db.models import Q
-from django.http import HttpRequest, HttpResponse
+from typing import List, Optional
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.decorators import method_decorator
 from django.views import View
 
-from categories.models import Category
-from products.models import Product
-from products.utils.elasticsearch.elastic_search import search_products
+from config.utils.page_cache import cache_anonymous_page
+from products.services.product_listing import DEFAULT_BROWSE_SORT, ProductListingService
+from products.utils.cache_tags import CATALOG_TAG
+from products.utils.elasticsearch.elastic_search import DEFAULT_SEARCH_SORT
+
+SEARCH_SORT_CHOICES = [
+    ('relevance', '정확도순'),
+    ('newest', '최신순'),
+    ('price_low', '낮은 가격순'),
+    ('price_high', '높은 가격순'),
+]
+BROWSE_SORT_CHOICES = SEARCH_SORT_CHOICES[1:]
+# 검색 패싯이 없을 때 보여주는 가격대 (ProductListingService.parse_price_range 형식)
+PRICE_RANGE_CHOICES = [
+    ('-30000', '3만원 미만'),
+    ('30000-50000', '3만원 ~ 5만원'),
+    ('50000-100000', '5만원 ~ 10만원'),
+    ('100000-', '10만원 이상'),
+]
+
 
+def get_product_list_page_tags(request: HttpRequest) -> Optional[List[str]]:
+    # 검색 결과는 검색어마다 달라 적중률이 낮고, 캐시하면 검색 로그도 남지 않는다
+    if request.GET.get('search') or 'cursor' in request.GET:
+        return None
+    return [CATALOG_TAG]
 
+
+@method_decorator(cache_anonymous_page(get_product_list_page_tags), name='get')
 class ProductListView(View):
     def get(self, request: HttpRequest) -> HttpResponse:
-        products = Product.objects.filter(is_live=True, is_sold=False).prefetch_related('colors', 'image', 'categories').order_by('-created_at')
-        
+        listing = ProductListingService.get_listing_page(request.GET)
+
+        # 무한 스크롤 요청에도 현재 검색/필터 조건을 그대로 넘긴다
+        listing_params = request.GET.copy()
+        listing_params.pop('cursor', None)
+
         search_query = request.GET.get('search', '')
-        category_name = request.GET.get('category', '')
-        selected_category = None
-        
-        if search_query:
-            try:
-                product_ids = search_products(search_query)
-                if product_ids:
-                    products = products.filter(id__in=product_ids)
-                else:
-                    products = products.none()
-            except Exception:
-                products = products.filter(
-                    Q(name__icontains=search_query) |
-                    Q(description__icontains=search_query) |
-                    Q(categories__name__icontains=search_query)
-                ).distinct()
-
-        if category_name:
-            selected_category = Category.objects.filter(name=category_name).first()
-            if selected_category:
-                products = products.filter(categories=selected_category)
-            else:
-                products = products.none()
-        
         context = {
-            'products': products,
+            'products': listing['products'],
+            'next_cursor': listing['next_cursor'],
+            'product_count': listing['total_count'],
+            'facets': listing['facets'],
+            'listing_query': listing_params.urlencode(),
             'search_query': search_query,
-            'category': selected_category,
+            'sort': request.GET.get('sort') or (DEFAULT_SEARCH_SORT if search_query else DEFAULT_BROWSE_SORT),
+            'sort_choices': SEARCH_SORT_CHOICES if search_query else BROWSE_SORT_CHOICES,
+            'price_range_choices': PRICE_RANGE_CHOICES,
+            'selected_colors': request.GET.getlist('color'),
+            'selected_price_range': request.GET.get('price_range', ''),
+            'category': listing['category'],
         }
-        return render(request, 'products/customers/product_list.html', context)
\ No newline at end of file
+        return render(request, 'products/customers/product_list.html', context)
+
+
+class ProductListMoreView(View):
+    def get(self, request: HttpRequest) -> JsonResponse:
+        listing = ProductListingService.get_listing_page(request.GET)
+
+        return JsonResponse({
+            'success': True,
+            'html': render_to_string(
+                'products/customers/product_cards.html', {'products': listing['products']}, request=request
+            ),
+            'next_cursor': listing['next_cursor'],
+        })
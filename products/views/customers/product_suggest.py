@@ -0,0 +1,15 @@
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from products.services.product_suggest import SUGGEST_SIZE, ProductSuggestService
+
+
+class ProductSuggestView(View):
+    def get(self, request: HttpRequest) -> JsonResponse:
+        try:
+            size = int(request.GET.get('size', SUGGEST_SIZE))
+        except ValueError:
+            size = SUGGEST_SIZE
+
+        suggestions = ProductSuggestService.get_suggestions(request.GET.get('q', ''), size)
+        return JsonResponse({'success': True, **suggestions})
@@ -1,35 +1,49 @@
-from django.db.models import Prefetch
+from typing import List, Optional
+
 from django.http.request import HttpRequest
 from django.http.response import Http404, HttpResponse
 from django.shortcuts import render
+from django.utils.decorators import method_decorator
 from django.views.generic.base import View
 
+from config.utils.local_cache import LocalCache
+from config.utils.page_cache import cache_anonymous_page
 from favorites.services.favorite_service import FavoriteService
+from products.models import Product
+from products.utils.cache_tags import CATALOG_TAG, product_tag
 from products.utils.url_slug import find_product_by_slug
 from reviews.forms.review_create import ReviewCommentForm, ReviewForm, ReviewImageForm
-from reviews.models import Review, ReviewComment
 from reviews.services.review_count import ReviewCountService
+from reviews.services.review_pagination import ReviewPaginationService
+
+
+def get_product_detail_page_tags(request: HttpRequest, product_name: str) -> Optional[List[str]]:
+    # 슬러그가 바뀌면 상품 저장 시 catalog 태그가 올라가 이 매핑도 함께 지워진다
+    product_id = LocalCache.get_or_set(
+        f'product:slug:{product_name}',
+        lambda: Product.objects.filter(slug=product_name).values_list('id', flat=True).first(),
+        tags=[CATALOG_TAG],
+    )
+    if product_id is None:
+        return None
+    return [CATALOG_TAG, product_tag(product_id)]
 
 
+@method_decorator(cache_anonymous_page(get_product_detail_page_tags), name='get')
 class ProductsDetailView(View):
     def get(self, request: HttpRequest, product_name: str) -> HttpResponse:
         product = find_product_by_slug(product_name)
         if not product:
             raise Http404("상품을 찾을 수 없습니다.")
         
-        reviews = Review.objects.filter(
-            product=product,
-            is_published=True
-        ).select_related('user').prefetch_related(
-            'images', 
-            Prefetch('comments', queryset=ReviewComment.objects.all().select_related('user'))
-        ).order_by('-created_at')
+        # 첫 페이지만 렌더링하고 나머지는 리뷰 목록 API로 이어서 불러온다
+        reviews, next_review_cursor = ReviewPaginationService.get_review_page(product)
         
         review_stats = ReviewCountService.get_product_review_stats(product)
         
         user_review = None
         if request.user.is_authenticated:
-            user_review = next((review for review in reviews if review.user == request.user), None)
+            user_review = ReviewPaginationService.get_user_review(product, request.user)
         
         is_favorited = False
         if request.user.is_authenticated:
@@ -43,6 +57,7 @@ class ProductsDetailView(View):
         context = {
             "products": product,
             "reviews": reviews,
+            "next_review_cursor": next_review_cursor,
             "avg_rating": review_stats['avg_rating'],
             "review_count": review_stats['review_count'],
             "photo_review_count": review_stats['photo_review_count'],
@@ -0,0 +1,36 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from products.models import Product
+from reviews.services.review_count import ReviewCountService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild review statistics for all products'
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of products rebuilt per batch',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        chunk_size = options['chunk_size']
+        last_product_id = 0
+        rebuilt_count = 0
+
+        while True:
+            product_ids = list(
+                Product.objects.filter(id__gt=last_product_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not product_ids:
+                break
+            last_product_id = product_ids[-1]
+
+            ReviewCountService.rebuild_stats(product_ids)
+            rebuilt_count += len(product_ids)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt review stats for {rebuilt_count} products'))
@@ -31,6 +31,10 @@ class Review(BaseModel):
     
     class Meta:
         db_table = 'reviews'
+        indexes = [
+            models.Index(fields=['product', 'is_published', '-created_at', '-id'], name='reviews_product_page_idx'),
+            models.Index(fields=['product', 'user'], name='reviews_product_user_idx'),
+        ]
     
     def get_star_display(self) -> str:
         return '★' * self.rating + '☆' * (5 - self.rating)
@@ -49,4 +53,27 @@ class ReviewComment(BaseModel):
     is_published = models.BooleanField(default=True)
     
     class Meta:
-        db_table = 'review_comments'
\ No newline at end of file
+        db_table = 'review_comments'
+
+class ProductReviewStats(BaseModel):
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='review_stats')
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    photo_review_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'product_review_stats'
+
+    @property
+    def avg_rating(self) -> float:
+        if not self.review_count:
+            return 0.0
+        return self.rating_sum / self.review_count
+
+    def get_rating_count(self, rating: int) -> int:
+        return int(getattr(self, f'rating_{rating}_count'))
@@ -1,44 +1,119 @@
-from typing import Dict, Union
+from typing import Dict, Iterable, Union
 
-from django.db.models import Avg, Count
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
 
 from products.models import Product
-from reviews.models import Review
+from reviews.models import ProductReviewStats, Review
+
+RATINGS = range(1, 6)
 
 
 class ReviewCountService:
     @staticmethod
     def get_product_review_stats(product: Product) -> Dict[str, Union[float, int, Dict[int, Dict[str, Union[int, float]]]]]:
-        reviews = Review.objects.filter(product=product)
-        
-        stats = reviews.aggregate(
-            avg_rating=Avg('rating'),
-            review_count=Count('id')
-        )
-        
-        rating_counts = {
-            item['rating']: item['count'] 
-            for item in reviews.values('rating').annotate(count=Count('id'))
-        }
-        
-        total_reviews = stats['review_count']
+        stats = ProductReviewStats.objects.filter(product=product).first()
+        if stats is None:
+            # 동시에 리뷰가 작성되며 만들어진 행을 덮어쓰지 않도록, 없는 경우에만 넣는다
+            stats = ReviewCountService.rebuild_stats([product.id], overwrite=False)[product.id]
+
+        total_reviews = stats.review_count
         rating_distribution = {}
         for rating in range(5, 0, -1):
-            count = rating_counts.get(rating, 0)
+            count = stats.get_rating_count(rating)
             percentage = (count / total_reviews * 100) if total_reviews > 0 else 0.0
             rating_distribution[rating] = {
                 'count': count,
                 'percentage': round(percentage, 1)
             }
-        
-        photo_review_count = Review.objects.filter(
-            product=product,
-            images__isnull=False
-        ).distinct().count()
-        
+
         return {
-            'avg_rating': float(stats['avg_rating']) if stats['avg_rating'] is not None else 0.0,
-            'review_count': stats['review_count'],
-            'photo_review_count': photo_review_count,
+            'avg_rating': stats.avg_rating,
+            'review_count': total_reviews,
+            'photo_review_count': stats.photo_review_count,
             'rating_distribution': rating_distribution
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def rebuild_stats(product_ids: Iterable[int], overwrite: bool = True) -> Dict[int, ProductReviewStats]:
+        product_ids = list(product_ids)
+
+        aggregates = {
+            row['product_id']: row
+            for row in Review.objects.filter(product_id__in=product_ids).values('product_id').annotate(
+                review_count=Count('id'),
+                rating_sum=Sum('rating'),
+                **{f'rating_{rating}_count': Count('id', filter=Q(rating=rating)) for rating in RATINGS},
+            )
+        }
+        photo_counts = dict(
+            Review.objects.filter(product_id__in=product_ids, images__isnull=False)
+            .values('product_id')
+            .annotate(photo_review_count=Count('id', distinct=True))
+            .values_list('product_id', 'photo_review_count')
+        )
+
+        stats_list = []
+        for product_id in product_ids:
+            row = aggregates.get(product_id, {})
+            stats_list.append(ProductReviewStats(
+                product_id=product_id,
+                review_count=row.get('review_count', 0),
+                rating_sum=row.get('rating_sum') or 0,
+                photo_review_count=photo_counts.get(product_id, 0),
+                **{f'rating_{rating}_count': row.get(f'rating_{rating}_count', 0) for rating in RATINGS},
+            ))
+
+        if not overwrite:
+            ProductReviewStats.objects.bulk_create(stats_list, ignore_conflicts=True)
+            return {stats.product_id: stats for stats in stats_list}
+
+        ProductReviewStats.objects.bulk_create(
+            stats_list,
+            update_conflicts=True,
+            unique_fields=['product'],
+            update_fields=[
+                'review_count', 'rating_sum', 'photo_review_count', 'updated_at',
+                *[f'rating_{rating}_count' for rating in RATINGS],
+            ],
+        )
+        return {stats.product_id: stats for stats in stats_list}
+
+    @staticmethod
+    def apply_delta(
+        product_id: int,
+        review_count: int = 0,
+        rating_sum: int = 0,
+        rating_counts: Dict[int, int] | None = None,
+        photo_review_count: int = 0,
+        create_missing: bool = True,
+    ) -> None:
+        changes = {
+            'review_count': review_count,
+            'rating_sum': rating_sum,
+            'photo_review_count': photo_review_count,
+            **{f'rating_{rating}_count': count for rating, count in (rating_counts or {}).items()},
+        }
+        changes = {field: delta for field, delta in changes.items() if delta}
+        if not changes:
+            return
+
+        with transaction.atomic():
+            if not create_missing:
+                # 삭제 경로에서는 행을 새로 만들지 않는다. 상품과 함께 지워지는 중이면 통계 행이 먼저 사라져
+                # 있을 수 있고, 그 외에는 다음 조회 때 get_product_review_stats 가 다시 계산한다.
+                stats = ProductReviewStats.objects.select_for_update().filter(product_id=product_id).first()
+                if stats is None:
+                    return
+                created = False
+            else:
+                # 행 잠금으로 같은 상품의 증분 갱신을 직렬화한다 (동시에 처음 만드는 경우는 get_or_create 가 처리)
+                stats, created = ProductReviewStats.objects.select_for_update().get_or_create(product_id=product_id)
+            # 새로 만든 행이거나 값이 음수가 될 만큼 어긋났다면 이번 변경이 반영된 리뷰 테이블에서 다시 계산한다
+            if created or any(getattr(stats, field) + delta < 0 for field, delta in changes.items()):
+                ReviewCountService.rebuild_stats([product_id])
+                return
+
+            ProductReviewStats.objects.filter(pk=stats.pk).update(
+                **{field: F(field) + delta for field, delta in changes.items()}
+            )
@@ -0,0 +1,31 @@
+from typing import List, Optional, Tuple
+
+from django.db.models import QuerySet
+
+from config.utils.cursor_pagination import CursorPagination
+from products.models import Product
+from reviews.models import Review
+from users.models import User
+
+REVIEW_PAGE_SIZE = 10
+
+
+class ReviewPaginationService:
+    @staticmethod
+    def get_published_reviews(product: Product) -> QuerySet[Review]:
+        return Review.objects.filter(
+            product=product,
+            is_published=True
+        ).select_related('user').prefetch_related('images')
+
+    @staticmethod
+    def get_review_page(
+        product: Product, cursor: Optional[str] = None, page_size: int = REVIEW_PAGE_SIZE
+    ) -> Tuple[List[Review], Optional[str]]:
+        return CursorPagination.paginate(
+            ReviewPaginationService.get_published_reviews(product), cursor, page_size
+        )
+
+    @staticmethod
+    def get_user_review(product: Product, user: User) -> Optional[Review]:
+        return Review.objects.filter(product=product, user=user, is_published=True).order_by('-created_at').first()
@@ -0,0 +1,138 @@
+from collections import Counter
+from typing import Any, Iterable, Set
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from config.utils.cache_helper import CacheHelper
+from products.utils.cache_tags import product_tag
+from reviews.models import Review, ReviewComment, ReviewImage
+from reviews.services.review_count import ReviewCountService
+
+
+def _photo_review_ids(review_ids: Iterable[int]) -> Set[int]:
+    return set(
+        Review.objects.filter(id__in=list(review_ids), images__isnull=False).values_list('id', flat=True)
+    )
+
+
+def _apply_photo_changes(review_ids: Set[int], before: Set[int]) -> None:
+    after = _photo_review_ids(review_ids) if review_ids else set()
+    deltas: Counter[int] = Counter()
+    changed = (after - before) | (before - after)
+    for review_id, product_id in Review.objects.filter(id__in=changed).values_list('id', 'product_id'):
+        deltas[product_id] += 1 if review_id in after else -1
+    for product_id, delta in deltas.items():
+        ReviewCountService.apply_delta(product_id, photo_review_count=delta)
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_rating(sender: Any, instance: Review, **kwargs: Any) -> None:
+    instance._previous = (  # type: ignore[attr-defined]
+        Review.objects.filter(pk=instance.pk).values_list('product_id', 'rating').first() if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Review)
+def update_stats_on_review_save(sender: Any, instance: Review, created: bool, **kwargs: Any) -> None:
+    previous = getattr(instance, '_previous', None)
+    if created or previous is None:
+        ReviewCountService.apply_delta(
+            instance.product_id,
+            review_count=1,
+            rating_sum=instance.rating,
+            rating_counts={instance.rating: 1},
+        )
+        return
+
+    previous_product_id, previous_rating = previous
+    if previous_product_id != instance.product_id:
+        # 다른 상품으로 옮겨진 리뷰는 이전 상품에서 빼고 새 상품에 더한다
+        has_images = instance.images.exists()
+        ReviewCountService.apply_delta(
+            previous_product_id,
+            review_count=-1,
+            rating_sum=-previous_rating,
+            rating_counts={previous_rating: -1},
+            photo_review_count=-1 if has_images else 0,
+        )
+        ReviewCountService.apply_delta(
+            instance.product_id,
+            review_count=1,
+            rating_sum=instance.rating,
+            rating_counts={instance.rating: 1},
+            photo_review_count=1 if has_images else 0,
+        )
+    elif previous_rating != instance.rating:
+        ReviewCountService.apply_delta(
+            instance.product_id,
+            rating_sum=instance.rating - previous_rating,
+            rating_counts={previous_rating: -1, instance.rating: 1},
+        )
+
+
+@receiver(pre_delete, sender=Review)
+def remember_review_photos(sender: Any, instance: Review, **kwargs: Any) -> None:
+    instance._had_images = instance.images.exists()  # type: ignore[attr-defined]
+
+
+@receiver(post_delete, sender=Review)
+def update_stats_on_review_delete(sender: Any, instance: Review, **kwargs: Any) -> None:
+    ReviewCountService.apply_delta(
+        instance.product_id,
+        review_count=-1,
+        rating_sum=-instance.rating,
+        rating_counts={instance.rating: -1},
+        photo_review_count=-1 if getattr(instance, '_had_images', False) else 0,
+        create_missing=False,
+    )
+
+
+@receiver(m2m_changed, sender=Review.images.through)
+def update_stats_on_review_images_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Set[int] | None, **kwargs: Any
+) -> None:
+    if action in ('pre_add', 'pre_remove', 'pre_clear'):
+        if not reverse:
+            review_ids = {instance.pk}
+        elif pk_set is not None:
+            review_ids = set(pk_set)
+        else:
+            review_ids = set(instance.reviews.values_list('id', flat=True))
+        instance._photo_review_ids_before = (review_ids, _photo_review_ids(review_ids))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        review_ids, before = getattr(instance, '_photo_review_ids_before', (set(), set()))
+        _apply_photo_changes(review_ids, before)
+
+
+@receiver(pre_delete, sender=ReviewImage)
+def remember_image_reviews(sender: Any, instance: ReviewImage, **kwargs: Any) -> None:
+    review_ids = set(instance.reviews.values_list('id', flat=True))
+    instance._photo_review_ids_before = (review_ids, _photo_review_ids(review_ids))  # type: ignore[attr-defined]
+
+
+@receiver(post_delete, sender=ReviewImage)
+def update_stats_on_image_delete(sender: Any, instance: ReviewImage, **kwargs: Any) -> None:
+    review_ids, before = getattr(instance, '_photo_review_ids_before', (set(), set()))
+    _apply_photo_changes(review_ids, before)
+
+
+# 상품 상세 페이지 캐시에 리뷰 목록이 들어 있으므로 해당 상품 태그만 올린다
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_product_page_on_review_change(sender: Any, instance: Review, **kwargs: Any) -> None:
+    CacheHelper.bump_tags_on_commit([product_tag(instance.product_id)])
+
+
+@receiver(post_save, sender=ReviewComment)
+@receiver(post_delete, sender=ReviewComment)
+def invalidate_product_page_on_comment_change(sender: Any, instance: ReviewComment, **kwargs: Any) -> None:
+    product_id = Review.objects.filter(pk=instance.review_id).values_list('product_id', flat=True).first()
+    if product_id is not None:
+        CacheHelper.bump_tags_on_commit([product_tag(product_id)])
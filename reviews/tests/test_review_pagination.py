@@ -0,0 +1,138 @@
+from datetime import timedelta
+from typing import List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from config.utils.cursor_pagination import CursorPagination
+from config.utils.setup_test_method import TestSetupMixin
+from products.utils.url_slug import product_name_to_slug
+from reviews.models import Review
+from reviews.services.review_pagination import REVIEW_PAGE_SIZE, ReviewPaginationService
+
+
+@pytest.mark.django_db
+class TestReviewPagination(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.reviews = self._create_reviews(25)
+
+    def _create_reviews(self, count: int) -> List[Review]:
+        now = timezone.now()
+        reviews = []
+        for index in range(count):
+            review = Review.objects.create(
+                product=self.product,
+                user=self.admin_user,
+                content=f'Review Content {index}',
+                rating=5,
+            )
+            reviews.append(review)
+        # 최신순 정렬을 고정하기 위해 작성 시각을 1분 간격으로 둔다
+        for index, review in enumerate(reviews):
+            Review.objects.filter(id=review.id).update(created_at=now - timedelta(minutes=count - index))
+        return list(Review.objects.filter(id__in=[review.id for review in reviews]).order_by('-created_at', '-id'))
+
+    def test_first_page(self) -> None:
+        reviews, next_cursor = ReviewPaginationService.get_review_page(self.product)
+
+        assert reviews == self.reviews[:REVIEW_PAGE_SIZE]
+        assert next_cursor is not None
+
+    def test_walk_all_pages(self) -> None:
+        collected: List[Review] = []
+        cursor = None
+        while True:
+            reviews, cursor = ReviewPaginationService.get_review_page(self.product, cursor)
+            collected.extend(reviews)
+            if cursor is None:
+                break
+
+        assert collected == self.reviews
+
+    def test_cursor_breaks_created_at_ties_by_id(self) -> None:
+        Review.objects.filter(product=self.product).update(created_at=timezone.now())
+        expected = list(Review.objects.filter(product=self.product).order_by('-id'))
+
+        first_page, cursor = ReviewPaginationService.get_review_page(self.product, page_size=5)
+        second_page, _ = ReviewPaginationService.get_review_page(self.product, cursor, page_size=5)
+
+        assert first_page + second_page == expected[:10]
+
+    def test_unpublished_reviews_are_excluded(self) -> None:
+        Review.objects.filter(id=self.reviews[0].id).update(is_published=False)
+
+        reviews, _ = ReviewPaginationService.get_review_page(self.product)
+
+        assert self.reviews[0] not in reviews
+
+    def test_invalid_cursor_returns_first_page(self) -> None:
+        assert CursorPagination.decode_cursor('not-a-cursor') is None
+
+        reviews, _ = ReviewPaginationService.get_review_page(self.product, 'not-a-cursor')
+
+        assert reviews == self.reviews[:REVIEW_PAGE_SIZE]
+
+    def test_get_user_review(self) -> None:
+        assert ReviewPaginationService.get_user_review(self.product, self.customer_user) is None
+
+        review = Review.objects.create(
+            product=self.product,
+            user=self.customer_user,
+            content='Customer Review Content',
+            rating=4,
+        )
+
+        assert ReviewPaginationService.get_user_review(self.product, self.customer_user) == review
+
+    def test_review_list_view(self) -> None:
+        url = reverse('review-list', kwargs={'product_id': self.product.id})
+        _, cursor = ReviewPaginationService.get_review_page(self.product)
+        assert cursor is not None
+
+        response = self.client.get(url, {'cursor': cursor})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data['success'] is True
+        assert [review['id'] for review in data['reviews']] == [
+            review.id for review in self.reviews[REVIEW_PAGE_SIZE:REVIEW_PAGE_SIZE * 2]
+        ]
+        assert 'Review Content' in data['html']
+        assert data['next_cursor'] is not None
+
+    def test_review_list_view_last_page(self) -> None:
+        url = reverse('review-list', kwargs={'product_id': self.product.id})
+        cursor = CursorPagination.encode_cursor(self.reviews[-3].created_at, self.reviews[-3].id)
+
+        data = self.client.get(url, {'cursor': cursor}).json()
+
+        assert len(data['reviews']) == 2
+        assert data['next_cursor'] is None
+
+    def test_detail_page_embeds_first_page(self) -> None:
+        self.client.force_login(self.admin_user)
+        url = reverse('products-detail', kwargs={'product_name': product_name_to_slug(self.product.name)})
+
+        response = self.client.get(url)
+
+        assert response.status_code == 200
+        assert list(response.context['reviews']) == self.reviews[:REVIEW_PAGE_SIZE]
+        assert response.context['next_review_cursor'] is not None
+        assert response.context['user_review'] == self.reviews[0]
+
+    def test_detail_page_query_count_independent_of_review_count(self) -> None:
+        url = reverse('products-detail', kwargs={'product_name': product_name_to_slug(self.product.name)})
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(url)
+
+        self._create_reviews(50)
+        with CaptureQueriesContext(connection) as after:
+            self.client.get(url)
+
+        assert len(after.captured_queries) == len(before.captured_queries)
@@ -1,8 +1,13 @@
+from typing import Any
+
 import pytest
+from django.core.management import call_command
+from django.db import connection
 
 from config.utils.setup_test_method import TestSetupMixin
+from products.models import Product
 from reviews.forms.review_create import ReviewForm
-from reviews.models import Review
+from reviews.models import ProductReviewStats, Review, ReviewImage
 from reviews.services.review_count import ReviewCountService
 
 
@@ -39,4 +44,114 @@ class TestReviewRatingCount(TestSetupMixin):
     def test_empty_rating(self) -> None:
         form = ReviewForm(data={'content': '적절한 내용'})
         assert not form.is_valid()
-        assert self.review_rating_field_name in form.errors
\ No newline at end of file
+        assert self.review_rating_field_name in form.errors
+
+
+@pytest.mark.django_db
+class TestProductReviewStats(TestSetupMixin):
+    def setup_method(self) -> None:
+        self.setup_test_user_data()
+        self.setup_test_products_data()
+        self.setup_test_reviews_data()
+        # 첫 조회에서 통계 행을 만든 뒤부터는 증분 갱신된다
+        ReviewCountService.get_product_review_stats(self.product)
+
+    def test_stats_are_read_from_single_row(self, django_assert_num_queries: Any) -> None:
+        with django_assert_num_queries(1):
+            stats = ReviewCountService.get_product_review_stats(self.product)
+
+        assert stats['review_count'] == 2
+        assert stats['avg_rating'] == 4.5
+        assert stats['rating_distribution'][5] == {'count': 1, 'percentage': 50.0}  # type: ignore[index]
+
+    def test_rating_update_moves_histogram_bucket(self) -> None:
+        self.customer_review.rating = 1
+        self.customer_review.save()
+
+        stats = ProductReviewStats.objects.get(product=self.product)
+        assert stats.rating_sum == 6
+        assert stats.rating_4_count == 0
+        assert stats.rating_1_count == 1
+
+    def test_review_delete_decrements_stats(self) -> None:
+        image = ReviewImage.objects.create(image='reviews/images/test_image.jpg')
+        self.admin_review.images.add(image)
+
+        self.admin_review.delete()
+
+        stats = ProductReviewStats.objects.get(product=self.product)
+        assert stats.review_count == 1
+        assert stats.rating_5_count == 0
+        assert stats.photo_review_count == 0
+        assert stats.avg_rating == 4.0
+
+    def test_photo_review_count_follows_images(self) -> None:
+        first_image = ReviewImage.objects.create(image='reviews/images/first.jpg')
+        second_image = ReviewImage.objects.create(image='reviews/images/second.jpg')
+
+        self.customer_review.images.add(first_image, second_image)
+        assert ProductReviewStats.objects.get(product=self.product).photo_review_count == 1
+
+        self.customer_review.images.remove(first_image)
+        assert ProductReviewStats.objects.get(product=self.product).photo_review_count == 1
+
+        second_image.delete()
+        assert ProductReviewStats.objects.get(product=self.product).photo_review_count == 0
+
+    def test_rebuild_command_restores_stats(self) -> None:
+        ProductReviewStats.objects.filter(product=self.product).update(review_count=0, rating_sum=0, rating_4_count=0)
+
+        call_command('rebuild_review_stats')
+
+        stats = ProductReviewStats.objects.get(product=self.product)
+        assert stats.review_count == 2
+        assert stats.rating_sum == 9
+        assert stats.rating_4_count == 1
+
+    def test_first_review_creates_stats_row(self) -> None:
+        other = Product.objects.create(user=self.admin_user, name='Other Product', description='', price=5.00, stock=5)
+
+        Review.objects.create(product=other, user=self.customer_user, content='Other Review', rating=3)
+
+        stats = ProductReviewStats.objects.get(product=other)
+        assert stats.review_count == 1
+        assert stats.rating_3_count == 1
+
+    def test_moving_review_to_other_product_moves_stats(self) -> None:
+        other = Product.objects.create(user=self.admin_user, name='Other Product', description='', price=5.00, stock=5)
+        self.admin_review.images.add(ReviewImage.objects.create(image='reviews/images/test_image.jpg'))
+
+        self.admin_review.product = other
+        self.admin_review.save()
+
+        stats = ProductReviewStats.objects.get(product=self.product)
+        assert (stats.review_count, stats.rating_5_count, stats.photo_review_count) == (1, 0, 0)
+        other_stats = ProductReviewStats.objects.get(product=other)
+        assert (other_stats.review_count, other_stats.rating_5_count, other_stats.photo_review_count) == (1, 1, 1)
+
+    def test_drifted_stats_are_rebuilt_instead_of_going_negative(self) -> None:
+        ProductReviewStats.objects.filter(product=self.product).update(review_count=0, rating_sum=0, rating_5_count=0)
+
+        self.admin_review.delete()
+
+        stats = ProductReviewStats.objects.get(product=self.product)
+        assert stats.review_count == 1
+        assert stats.rating_sum == 4
+        assert stats.rating_5_count == 0
+
+    def test_deleting_product_with_reviews_leaves_no_stats_row(self) -> None:
+        product_id = self.product.id
+
+        self.product.delete()
+        # 커밋 시점의 지연 FK 검사를 테스트 안에서 바로 실행한다
+        connection.check_constraints()
+
+        assert not ProductReviewStats.objects.filter(product_id=product_id).exists()
+
+    def test_review_delete_without_stats_row_does_not_create_one(self) -> None:
+        ProductReviewStats.objects.filter(product=self.product).delete()
+
+        self.admin_review.delete()
+
+        assert not ProductReviewStats.objects.filter(product=self.product).exists()
+        assert ReviewCountService.get_product_review_stats(self.product)['review_count'] == 1
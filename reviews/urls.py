@@ -6,10 +6,12 @@ from reviews.views.comment_update import ReviewCommentUpdateView
 from reviews.views.image_delete import DeleteReviewImageView
 from reviews.views.review_create import ReviewCreateView
 from reviews.views.review_delete import ReviewDeleteView
+from reviews.views.review_list import ReviewListView
 from reviews.views.review_update import ReviewUpdateView
 
 urlpatterns = [
     # 리뷰 CRUD
+    path('list/<int:product_id>/', ReviewListView.as_view(), name='review-list'),
     path('create/<int:product_id>/', ReviewCreateView.as_view(), name='review-create'),
     path('update/<int:review_id>/', ReviewUpdateView.as_view(), name='review-update'),
     path('delete/<int:review_id>/', ReviewDeleteView.as_view(), name='review-delete'),
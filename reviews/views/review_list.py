@@ -0,0 +1,33 @@
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.views import View
+
+from products.models import Product
+from reviews.services.review_pagination import ReviewPaginationService
+
+
+class ReviewListView(View):
+    def get(self, request: HttpRequest, product_id: int) -> JsonResponse:
+        product = get_object_or_404(Product, id=product_id)
+        reviews, next_cursor = ReviewPaginationService.get_review_page(product, request.GET.get('cursor'))
+
+        return JsonResponse({
+            'success': True,
+            'html': render_to_string('reviews/review_items.html', {'reviews': reviews}, request=request),
+            'reviews': [
+                {
+                    'id': review.id,
+                    'username': review.get_masked_username(),
+                    'first_name': review.user.first_name or review.get_masked_username(),
+                    'rating': review.get_star_display(),
+                    'content': review.content,
+                    'date': review.created_at.strftime('%Y.%m.%d'),
+                    'hasProfileImage': bool(review.user.profile_image),
+                    'profileImage': review.user.profile_image or None,
+                    'images': [image.image.url for image in review.images.all()],
+                }
+                for review in reviews
+            ],
+            'next_cursor': next_cursor,
+        })
@@ -0,0 +1,20 @@
+// 비로그인 페이지는 서버에서 통째로 캐시되므로 사용자별 값은 /fragments/ 에서 받아 채운다
+document.addEventListener('DOMContentLoaded', () => {
+    fetch('/fragments/', {
+        credentials: 'same-origin',
+        headers: { 'X-Requested-With': 'XMLHttpRequest' },
+    })
+        .then(response => response.json())
+        .then(data => {
+            // 캐시된 HTML 의 CSRF 토큰은 처음 렌더링한 방문자의 것이라 그대로 쓰면 403 이 난다
+            document.querySelectorAll('[name=csrfmiddlewaretoken]').forEach(input => {
+                input.value = data.csrf_token;
+            });
+
+            // 뒤로 가기 등으로 비로그인 상태의 캐시 페이지가 보이면 로그인 상태로 다시 불러온다
+            if (data.is_authenticated && document.body.dataset.authenticated === 'false') {
+                window.location.reload();
+            }
+        })
+        .catch(error => console.error('사용자 정보 불러오기 실패:', error));
+});
@@ -0,0 +1,44 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const sentinel = document.querySelector('.product-list-sentinel');
+    const productGrid = document.querySelector('.product-grid');
+
+    if (!sentinel || !productGrid) return;
+
+    let isLoading = false;
+
+    function loadMoreProducts() {
+        const cursor = sentinel.dataset.cursor;
+        if (isLoading || !cursor) return;
+
+        isLoading = true;
+        fetch(`${sentinel.dataset.url}cursor=${encodeURIComponent(cursor)}`)
+            .then(response => response.json())
+            .then(data => {
+                if (!data.success) return;
+
+                productGrid.insertAdjacentHTML('beforeend', data.html);
+
+                if (data.next_cursor) {
+                    sentinel.dataset.cursor = data.next_cursor;
+                } else {
+                    observer.disconnect();
+                    sentinel.remove();
+                }
+            })
+            .catch(error => {
+                console.error('상품을 불러오는 중 오류가 발생했습니다:', error);
+            })
+            .finally(() => {
+                isLoading = false;
+            });
+    }
+
+    // 목록 끝에 가까워지면 다음 페이지를 미리 불러온다
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+            loadMoreProducts();
+        }
+    }, { rootMargin: '400px' });
+
+    observer.observe(sentinel);
+});
@@ -1,6 +1,6 @@
 document.addEventListener('DOMContentLoaded', function() {
     const sphereContainer = document.querySelector('.review-sphere-container');
-    const spheres = document.querySelectorAll('.review-sphere');
+    const spheres = Array.from(document.querySelectorAll('.review-sphere'));
     const detailPanel = document.querySelector('.review-detail-panel');
     const closePanel = document.querySelector('.close-panel');
     
@@ -34,24 +34,29 @@ document.addEventListener('DOMContentLoaded', function() {
         const positions = [];
         
         spheres.forEach((sphere, index) => {
-            let x, y;
-            let attempts = 0;
-            const maxAttempts = 100;
-            
-            do {
-                x = HORIZONTAL_PADDING + Math.random() * (width - SPHERE_RADIUS * 2 - HORIZONTAL_PADDING * 2);
-                y = Math.random() * (height - SPHERE_RADIUS * 2);
-                attempts++;
-            } while (isOverlapping(x, y, positions) && attempts < maxAttempts);
-            
-            positions.push({ x, y });
-            
-            sphere.style.left = `${x}px`;
-            sphere.style.top = `${y}px`;
-            sphere.dataset.index = index;
+            placeSphere(sphere, index, positions);
         });
     }
     
+    function placeSphere(sphere, index, positions) {
+        const { width, height } = getContainerSize();
+        let x, y;
+        let attempts = 0;
+        const maxAttempts = 100;
+        
+        do {
+            x = HORIZONTAL_PADDING + Math.random() * (width - SPHERE_RADIUS * 2 - HORIZONTAL_PADDING * 2);
+            y = Math.random() * (height - SPHERE_RADIUS * 2);
+            attempts++;
+        } while (isOverlapping(x, y, positions) && attempts < maxAttempts);
+        
+        positions.push({ x, y });
+        
+        sphere.style.left = `${x}px`;
+        sphere.style.top = `${y}px`;
+        sphere.dataset.index = index;
+    }
+    
     function isOverlapping(x, y, positions) {
         for (let pos of positions) {
             const dx = (x + SPHERE_RADIUS) - (pos.x + SPHERE_RADIUS);
@@ -67,7 +72,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     setTimeout(initializeSpheres, 100);
     
-    spheres.forEach(sphere => {
+    function bindSphere(sphere) {
         sphere.addEventListener('mousedown', e => {
             e.preventDefault();
             selectedSphere = sphere;
@@ -110,7 +115,43 @@ document.addEventListener('DOMContentLoaded', function() {
                 handleSphereClick.call(this, e);
             }
         }, { passive: false });
-    });
+    }
+    
+    spheres.forEach(bindSphere);
+    
+    // 더보기로 불러온 리뷰도 구체로 추가한다 (review_more.js 에서 window.reviewData 에 넣은 뒤 호출)
+    window.addReviewSpheres = function(reviews) {
+        const sphereList = sphereContainer.querySelector('.review-spheres');
+        const positions = spheres.map(sphere => ({
+            x: parseFloat(sphere.style.left || 0),
+            y: parseFloat(sphere.style.top || 0)
+        }));
+        
+        reviews.forEach(review => {
+            const sphere = document.createElement('div');
+            sphere.className = 'review-sphere';
+            sphere.dataset.reviewId = review.id;
+            sphere.dataset.hasImage = review.hasProfileImage ? 'true' : 'false';
+            
+            if (review.hasProfileImage) {
+                const img = document.createElement('img');
+                img.src = review.profileImage;
+                img.alt = review.username;
+                img.className = 'sphere-profile-image';
+                sphere.appendChild(img);
+            } else {
+                const avatar = document.createElement('span');
+                avatar.className = 'avatar-text';
+                avatar.textContent = 'S';
+                sphere.appendChild(avatar);
+            }
+            
+            sphereList.appendChild(sphere);
+            placeSphere(sphere, spheres.length, positions);
+            spheres.push(sphere);
+            bindSphere(sphere);
+        });
+    };
     
     document.addEventListener('mousemove', e => {
         if (!selectedSphere) return;
@@ -0,0 +1,42 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const moreBtn = document.getElementById('reviewMoreBtn');
+    const reviewContent = document.getElementById('customerReviewContent');
+
+    if (!moreBtn || !reviewContent) return;
+
+    moreBtn.addEventListener('click', function() {
+        const cursor = moreBtn.dataset.cursor;
+        if (!cursor) return;
+
+        moreBtn.disabled = true;
+        fetch(`${moreBtn.dataset.url}?cursor=${encodeURIComponent(cursor)}`)
+            .then(response => response.json())
+            .then(data => {
+                if (!data.success) return;
+
+                reviewContent.insertAdjacentHTML('beforeend', data.html);
+
+                // 리뷰 모달 이전/다음 탐색에 새로 불러온 리뷰도 포함한다
+                const productImages = (window.reviewData && window.reviewData.length > 0)
+                    ? window.reviewData[0].productImages
+                    : [];
+                data.reviews.forEach(review => {
+                    window.reviewData.push({ ...review, productImages: productImages });
+                });
+                if (window.addReviewSpheres) {
+                    window.addReviewSpheres(data.reviews);
+                }
+
+                if (data.next_cursor) {
+                    moreBtn.dataset.cursor = data.next_cursor;
+                    moreBtn.disabled = false;
+                } else {
+                    moreBtn.remove();
+                }
+            })
+            .catch(error => {
+                console.error('리뷰를 불러오는 중 오류가 발생했습니다:', error);
+                moreBtn.disabled = false;
+            });
+    });
+});
@@ -0,0 +1,48 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const inputs = document.querySelectorAll('input[data-suggest-url]');
+    const datalist = document.getElementById('searchSuggestions');
+
+    if (!inputs.length || !datalist) return;
+
+    let debounceTimer = null;
+    let controller = null;
+
+    function renderSuggestions(data) {
+        const values = [...data.categories, ...data.products.map(product => product.name)];
+        datalist.replaceChildren(...[...new Set(values)].map(value => {
+            const option = document.createElement('option');
+            option.value = value;
+            return option;
+        }));
+    }
+
+    function fetchSuggestions(input) {
+        const query = input.value.trim();
+        if (!query) {
+            datalist.replaceChildren();
+            return;
+        }
+
+        // 이전 입력에 대한 요청은 취소해 늦게 도착한 응답이 최신 결과를 덮어쓰지 않게 한다
+        if (controller) controller.abort();
+        controller = new AbortController();
+
+        fetch(`${input.dataset.suggestUrl}?q=${encodeURIComponent(query)}`, { signal: controller.signal })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) renderSuggestions(data);
+            })
+            .catch(error => {
+                if (error.name !== 'AbortError') {
+                    console.error('자동완성을 불러오는 중 오류가 발생했습니다:', error);
+                }
+            });
+    }
+
+    inputs.forEach(input => {
+        input.addEventListener('input', () => {
+            clearTimeout(debounceTimer);
+            debounceTimer = setTimeout(() => fetchSuggestions(input), 150);
+        });
+    });
+});